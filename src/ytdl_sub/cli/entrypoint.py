@@ -2,6 +2,7 @@ import gc
 import os
 import random
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -70,6 +71,83 @@ def _maybe_write_subscription_log_file(
     FileHandler.copy(Logger.debug_log_filename(), persist_log_path)
 
 
+def _download_subscription(
+    config: ConfigFile,
+    subscription: Subscription,
+    update_with_info_json: bool,
+    dry_run: bool,
+) -> None:
+    """
+    Downloads a single subscription, storing any exception on the subscription itself
+    """
+    with subscription.exception_handling():
+        logger.info(
+            "Beginning subscription %s for %s",
+            ("dry run" if dry_run else "download"),
+            subscription.name,
+        )
+        logger.debug("Subscription full yaml:\n%s", subscription.as_yaml())
+
+        if update_with_info_json:
+            subscription.update_with_info_json(dry_run=dry_run)
+        else:
+            subscription.download(dry_run=dry_run)
+
+    _maybe_write_subscription_log_file(
+        config=config,
+        subscription=subscription,
+        dry_run=dry_run,
+        exception=subscription.exception,
+    )
+
+
+def _download_subscription_in_parallel(
+    config: ConfigFile,
+    subscription: Subscription,
+    update_with_info_json: bool,
+    dry_run: bool,
+) -> None:
+    """
+    Downloads a single subscription within a worker thread, with a debug log of its own
+    """
+    with Logger.separate_debug_log():
+        _download_subscription(
+            config=config,
+            subscription=subscription,
+            update_with_info_json=update_with_info_json,
+            dry_run=dry_run,
+        )
+
+        # The thread's debug log gets deleted on exit, keep it in the error log if it failed
+        Logger.cleanup(has_error=subscription.exception is not None)
+    gc.collect()
+
+
+def _validate_parallel_download_archives(subscriptions: List[Subscription]) -> None:
+    """
+    SQLite download archives hold their database's write lock from an entry's first change until
+    it gets committed. Subscriptions that share a database would wait on each other's locks and
+    fail, so they can not download in parallel.
+
+    Raises
+    ------
+    ValidationException
+        If multiple subscriptions share a SQLite download archive
+    """
+    subscription_names_by_database: Dict[str, List[str]] = {}
+    for subscription in subscriptions:
+        if database_path := subscription.download_archive.sqlite_database_path:
+            subscription_names_by_database.setdefault(database_path, []).append(subscription.name)
+
+    for database_path, subscription_names in subscription_names_by_database.items():
+        if len(subscription_names) > 1:
+            raise ValidationException(
+                f"Subscriptions {', '.join(subscription_names)} share the download archive "
+                f"database {database_path}, which is not supported with --parallel. Give each "
+                "subscription its own database, or download them without --parallel."
+            )
+
+
 def _download_subscriptions_from_yaml_files(
     config: ConfigFile,
     subscription_paths: List[str],
@@ -78,6 +156,7 @@ def _download_subscriptions_from_yaml_files(
     update_with_info_json: bool,
     dry_run: bool,
     shuffle: bool,
+    parallel: int = 1,
 ) -> List[Subscription]:
     """
     Downloads all subscriptions from one or many subscription yaml files.
@@ -96,6 +175,10 @@ def _download_subscriptions_from_yaml_files(
         Whether to dry run or not
     shuffle
         Whether to shuffle the subscription download order
+    parallel
+        Number of subscriptions to download concurrently. Each runs in its own thread with its
+        own working directory and debug log. Subscriptions can not share a SQLite download
+        archive when above 1
 
     Returns
     -------
@@ -121,25 +204,34 @@ def _download_subscriptions_from_yaml_files(
         logger.info("Shuffling subscriptions")
         random.shuffle(subscriptions)
 
-    for subscription in subscriptions:
-        with subscription.exception_handling():
-            logger.info(
-                "Beginning subscription %s for %s",
-                ("dry run" if dry_run else "download"),
-                subscription.name,
-            )
-            logger.debug("Subscription full yaml:\n%s", subscription.as_yaml())
+    if parallel > 1:
+        # Dry runs work on in-memory copies of SQLite download archives
+        if not dry_run:
+            _validate_parallel_download_archives(subscriptions)
+
+        logger.info("Downloading up to %d subscriptions in parallel", parallel)
+        with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="ytdl-sub") as executor:
+            futures = [
+                executor.submit(
+                    _download_subscription_in_parallel,
+                    config=config,
+                    subscription=subscription,
+                    update_with_info_json=update_with_info_json,
+                    dry_run=dry_run,
+                )
+                for subscription in subscriptions
+            ]
+            for future in futures:
+                future.result()
 
-            if update_with_info_json:
-                subscription.update_with_info_json(dry_run=dry_run)
-            else:
-                subscription.download(dry_run=dry_run)
+        return subscriptions
 
-        _maybe_write_subscription_log_file(
+    for subscription in subscriptions:
+        _download_subscription(
             config=config,
             subscription=subscription,
+            update_with_info_json=update_with_info_json,
             dry_run=dry_run,
-            exception=subscription.exception,
         )
 
         Logger.cleanup(has_error=False)
@@ -318,6 +410,7 @@ def main() -> List[Subscription]:
                 update_with_info_json=args.update_with_info_json,
                 dry_run=args.dry_run,
                 shuffle=args.shuffle,
+                parallel=args.parallel,
             )
 
         # One-off download
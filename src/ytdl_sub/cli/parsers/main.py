@@ -176,6 +176,10 @@ class SubArguments:
         short="-sh",
         long="--shuffle",
     )
+    PARALLEL = CLIArgument(
+        short="-p",
+        long="--parallel",
+    )
 
 
 subscription_parser = subparsers.add_parser("sub")
@@ -208,6 +212,14 @@ subscription_parser.add_argument(
     help="shuffle subscription order when downloading",
     default=False,
 )
+subscription_parser.add_argument(
+    SubArguments.PARALLEL.short,
+    SubArguments.PARALLEL.long,
+    metavar="N",
+    type=int,
+    help="download up to N subscriptions at the same time",
+    default=1,
+)
 
 ###################################################################################################
 # DOWNLOAD PARSER
@@ -1,6 +1,6 @@
 import os
 import posixpath
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from mergedeep import mergedeep
 from yt_dlp.utils import datetime_from_str
@@ -16,20 +16,38 @@ from ytdl_sub.utils.exceptions import SubscriptionPermissionError
 from ytdl_sub.utils.file_handler import FileHandler
 from ytdl_sub.validators.file_path_validators import FFmpegFileValidator, FFprobeFileValidator
 from ytdl_sub.validators.strict_dict_validator import StrictDictValidator
+from ytdl_sub.validators.string_select_validator import StringSelectValidator
 from ytdl_sub.validators.validators import (
     BoolValidator,
+    FloatValidator,
     IntValidator,
     LiteralDictValidator,
+    StringListValidator,
     StringValidator,
 )
 
 
+class FileCopyStrategyValidator(StringSelectValidator):
+    _expected_value_type_name = "file copy strategy"
+    _select_values = {"copy", "reflink", "hardlink"}
+
+
 class ExperimentalValidator(StrictDictValidator):
     """
     Experimental flags reside under the ``experimental`` key.
     """
 
-    _optional_keys = {"enable_update_with_info_json"}
+    _optional_keys = {
+        "enable_update_with_info_json",
+        "enable_pipelined_downloads",
+        "enable_streaming_metadata",
+        "enable_entry_metadata_pruning",
+        "entry_metadata_keep_keys",
+        "file_copy_strategy",
+        "enable_full_empty_directory_pruning",
+        "uploader_metadata_cache_ttl_s",
+        "metadata_url_concurrency",
+    }
     _allow_extra_keys = True
 
     def __init__(self, name: str, value: Any):
@@ -38,6 +56,30 @@ class ExperimentalValidator(StrictDictValidator):
         self._enable_update_with_info_json = self._validate_key(
             key="enable_update_with_info_json", validator=BoolValidator, default=False
         )
+        self._enable_pipelined_downloads = self._validate_key(
+            key="enable_pipelined_downloads", validator=BoolValidator, default=False
+        )
+        self._enable_streaming_metadata = self._validate_key(
+            key="enable_streaming_metadata", validator=BoolValidator, default=False
+        )
+        self._enable_entry_metadata_pruning = self._validate_key(
+            key="enable_entry_metadata_pruning", validator=BoolValidator, default=False
+        )
+        self._entry_metadata_keep_keys = self._validate_key(
+            key="entry_metadata_keep_keys", validator=StringListValidator, default=[]
+        )
+        self._file_copy_strategy = self._validate_key(
+            key="file_copy_strategy", validator=FileCopyStrategyValidator, default="copy"
+        )
+        self._enable_full_empty_directory_pruning = self._validate_key(
+            key="enable_full_empty_directory_pruning", validator=BoolValidator, default=False
+        )
+        self._uploader_metadata_cache_ttl_s = self._validate_key(
+            key="uploader_metadata_cache_ttl_s", validator=FloatValidator, default=604800
+        )
+        self._metadata_url_concurrency = self._validate_key(
+            key="metadata_url_concurrency", validator=IntValidator, default=1
+        )
 
     @property
     def enable_update_with_info_json(self) -> bool:
@@ -48,6 +90,89 @@ class ExperimentalValidator(StrictDictValidator):
         """
         return self._enable_update_with_info_json.value
 
+    @property
+    def enable_pipelined_downloads(self) -> bool:
+        """
+        Post-processes each entry (file conversion, tagging, moving to the output directory, etc)
+        on a separate thread while the next entry downloads. Entries are still post-processed
+        one at a time in the order they were downloaded.
+        """
+        return self._enable_pipelined_downloads.value
+
+    @property
+    def enable_streaming_metadata(self) -> bool:
+        """
+        Reduces memory usage when downloading metadata of large channels or playlists. Instead of
+        holding every entry's metadata in memory, only what is needed to order entries is kept,
+        and the rest is read from its info.json right before the entry downloads. Metadata of
+        multiple URLs is fetched one URL at a time when enabled.
+        """
+        return self._enable_streaming_metadata.value
+
+    @property
+    def enable_entry_metadata_pruning(self) -> bool:
+        """
+        Drops metadata that ytdl-sub does not use (i.e. ``formats``, ``automatic_captions``,
+        ``heatmap``) as soon as an entry's info.json is read, to reduce memory usage. Keys that
+        are not read by a built-in variable will not be in ``entry_metadata`` unless they are
+        added to ``entry_metadata_keep_keys``.
+        """
+        return self._enable_entry_metadata_pruning.value
+
+    @property
+    def entry_metadata_keep_keys(self) -> List[str]:
+        """
+        Additional entry metadata keys to keep when ``enable_entry_metadata_pruning`` is enabled.
+        """
+        return [key.value for key in self._entry_metadata_keep_keys.list]
+
+    @property
+    def file_copy_strategy(self) -> str:
+        """
+        How files get copied, i.e. existing files into the working directory when using
+        ``--update-with-info-json``. Supports
+
+          - ``copy``: Always write a full copy of the file.
+          - ``reflink``: Clone the file on copy-on-write filesystems (btrfs, xfs, etc), which is
+            near-instant and takes no extra space. Otherwise, copy within the kernel. Falls back
+            to ``copy`` if neither is supported.
+          - ``hardlink``: Hardlink files placed into the output directory when on the same
+            filesystem, otherwise falls back to ``copy``. Files that may get modified in-place
+            are never hardlinked, and always use ``copy``.
+
+        Defaults to ``copy``.
+        """
+        return self._file_copy_strategy.value
+
+    @property
+    def enable_full_empty_directory_pruning(self) -> bool:
+        """
+        After each subscription, walk the entire output directory and delete every empty
+        directory in it. By default, only the directories of files deleted by the subscription
+        are checked, and deleted up to the output directory if empty.
+        """
+        return self._enable_full_empty_directory_pruning.value
+
+    @property
+    def uploader_metadata_cache_ttl_s(self) -> float:
+        """
+        How long, in seconds, to reuse the metadata of channels (uploaders) that yt-dlp fetches
+        separately from their videos. It is stored in yt-dlp's cache directory, and kept apart
+        per set of cookies and credentials in ``ytdl_options``. Set to ``0`` to always fetch
+        it. Defaults to ``604800`` (7 days).
+        """
+        return self._uploader_metadata_cache_ttl_s.value
+
+    @property
+    def metadata_url_concurrency(self) -> int:
+        """
+        Maximum number of a subscription's URLs to download metadata for at the same time. Each
+        URL downloads into its own directory, and entries are still processed in URL order.
+        Metadata stays serial when throttle protection sleeps between requests or when
+        ``enable_streaming_metadata`` is enabled. Defaults to ``1`` (one URL at a time).
+        """
+        return self._metadata_url_concurrency.value
+
 
 class PersistLogsValidator(StrictDictValidator):
     """
@@ -7,7 +7,6 @@ from ytdl_sub.entries.variables.override_variables import (
     OverrideHelpers,
 )
 from ytdl_sub.script.parser import parse
-from ytdl_sub.script.script import Script
 from ytdl_sub.script.types.function import BuiltInFunction
 from ytdl_sub.script.types.resolvable import Resolvable, String
 from ytdl_sub.script.types.syntax_tree import SyntaxTree
@@ -153,23 +152,21 @@ class Overrides(UnstructuredDictFormatterValidator, Scriptable):
         """
         Initialize the override script with any unresolved variables
         """
-        self.script.add_parsed(
-            self.initial_variables(
-                unresolved_variables={
-                    var_name: SyntaxTree(
-                        ast=[
-                            BuiltInFunction(
-                                name="throw",
-                                args=[
-                                    String(f"Plugin variable {var_name} has not been created yet")
-                                ],
-                            )
-                        ]
-                    )
-                    for var_name in unresolved_variables
-                }
-            )
+        initial_variables = self.initial_variables(
+            unresolved_variables={
+                var_name: SyntaxTree(
+                    ast=[
+                        BuiltInFunction(
+                            name="throw",
+                            args=[String(f"Plugin variable {var_name} has not been created yet")],
+                        )
+                    ]
+                )
+                for var_name in unresolved_variables
+            }
         )
+        self.script.add_parsed(initial_variables)
+        self._user_variable_names = frozenset(initial_variables.keys() - unresolved_variables)
         self.unresolvable.update(unresolved_variables)
         self.update_script()
         return self
@@ -180,21 +177,18 @@ class Overrides(UnstructuredDictFormatterValidator, Scriptable):
         entry: Optional[Entry],
         function_overrides: Optional[Dict[str, str]],
     ) -> Resolvable:
-        script: Script = self.script
-        unresolvable: Set[str] = self.unresolvable
-        if entry:
-            script = entry.script
-            unresolvable = entry.unresolvable
+        try:
+            if function_overrides is None:
+                return (entry or self).resolve_parsed(formatter.parsed)
 
-        # Update the script internally so long as we are not supplying overrides
-        # that could alter the script with one-off state
-        update = function_overrides is None
+            # Function overrides are one-off state, so resolve them separately from the script
+            variable_definitions = dict({"tmp_var": formatter.format_string}, **function_overrides)
+            if entry:
+                return entry.resolve_once(variable_definitions)["tmp_var"]
 
-        try:
-            return script.resolve_once(
-                dict({"tmp_var": formatter.format_string}, **(function_overrides or {})),
-                unresolvable=unresolvable,
-                update=update,
+            return self.script.resolve_once(
+                variable_definitions,
+                unresolvable=self.unresolvable,
             )["tmp_var"]
         except ScriptVariableNotResolved as exc:
             raise StringFormattingException(
@@ -37,6 +37,31 @@ class Plugin(BasePlugin[OptionsValidatorT], Generic[OptionsValidatorT], ABC):
     Class to define the new plugin functionality
     """
 
+    # Whether entries get post-processed alongside the next entry's download
+    _is_download_pipelined: bool = False
+
+    def set_download_pipelined(self, is_download_pipelined: bool) -> None:
+        """
+        Parameters
+        ----------
+        is_download_pipelined
+            Whether downloads are pipelined, in which case post_download_entry gets called
+        """
+        self._is_download_pipelined = is_download_pipelined
+
+    # Whether a split plugin splits each entry after it gets modified
+    _is_entry_split: bool = False
+
+    def set_entry_split(self, is_entry_split: bool) -> None:
+        """
+        Parameters
+        ----------
+        is_entry_split
+            Whether a split plugin runs, in which case modified entry files are split into new
+            files that do not get the entry's ffmpeg remux plan
+        """
+        self._is_entry_split = is_entry_split
+
     @cached_property
     def is_enabled(self) -> bool:
         """
@@ -83,6 +108,19 @@ class Plugin(BasePlugin[OptionsValidatorT], Generic[OptionsValidatorT], ABC):
         """
         return entry
 
+    def post_download_entry(self, entry: Entry) -> None:
+        """
+        After each entry is downloaded, before it gets modified or post-processed. Only called
+        when downloads are pipelined, where it runs on the download stage while post-processing
+        runs alongside the next download.
+
+        Parameters
+        ----------
+        entry
+            Entry that was downloaded
+        """
+        return None
+
     def modify_entry(self, entry: Entry) -> Optional[Entry]:
         """
         After each entry is downloaded, modify the entry in some way before sending it to
@@ -250,6 +250,17 @@ class OutputOptions(OptionsDictValidator):
         :description:
           The file name to store a subscriptions download archive placed relative to
           the output directory. Defaults to ``.ytdl-sub-{subscription_name}-download-archive.json``
+
+          If the name ends in ``.db``, ``.sqlite`` or ``.sqlite3``, the archive is stored in a
+          SQLite database instead, which is updated in place per-entry rather than rewritten. A
+          single database, i.e. ``/config/download-archive.db``, can be shared by many
+          subscriptions since entries are keyed by subscription name. Subscriptions that share a
+          database can not be downloaded with ``--parallel``.
+
+          SQLite archives also remember the content hashes of output files, so on later runs,
+          unchanged output files are not hashed again in full when checking whether a
+          re-downloaded file modifies them. JSON archives only keep these hashes for the
+          duration of a single run.
         """
         return self._download_archive_name
 
@@ -262,6 +273,8 @@ class OutputOptions(OptionsDictValidator):
           subscription name or output directory. It will try to load the archive file using this
           name first, and fallback to ``download_archive_name``. It will always save to this file
           and remove the original ``download_archive_name``.
+
+          Setting this to a SQLite database name migrates a json archive into the database.
         """
         return self._migrated_download_archive_name
 
@@ -1,7 +1,7 @@
 import copy
 import json
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, MutableMapping, Optional
 
 from ytdl_sub.config.overrides import Overrides
 from ytdl_sub.config.validators.options import OptionsDictValidator
@@ -46,9 +46,10 @@ class InfoJsonDownloader(SourcePlugin[InfoJsonDownloaderOptions]):
             overrides=overrides,
         )
         # Keep track of original file mappings for the 'mock' download
-        self._original_entry_mappings = copy.deepcopy(
-            enhanced_download_archive.mapping.entry_mappings
-        )
+        self._original_entry_mappings: Dict[str, DownloadMapping] = {
+            uid: copy.deepcopy(mapping)
+            for uid, mapping in enhanced_download_archive.mapping.entry_mappings.items()
+        }
 
     @property
     def output_directory(self) -> str:
@@ -60,7 +61,7 @@ class InfoJsonDownloader(SourcePlugin[InfoJsonDownloaderOptions]):
         return self._enhanced_download_archive.output_directory
 
     @property
-    def _entry_mappings(self) -> Dict[str, DownloadMapping]:
+    def _entry_mappings(self) -> MutableMapping[str, DownloadMapping]:
         """
         Returns
         -------
@@ -87,6 +88,7 @@ class InfoJsonDownloader(SourcePlugin[InfoJsonDownloaderOptions]):
                 return Entry(
                     entry_dict=entry_dict,
                     working_directory=self.working_directory,
+                    metadata_keep_keys=self._metadata_keep_keys,
                 )
 
         raise ValidationException(
@@ -165,6 +167,7 @@ class InfoJsonDownloader(SourcePlugin[InfoJsonDownloaderOptions]):
                 FileHandler.copy(
                     src_file_path=file_path,
                     dst_file_path=working_directory_file_path,
+                    copy_strategy=self._enhanced_download_archive.copy_strategy,
                 )
 
         return entry
@@ -1,6 +1,6 @@
 import abc
 from abc import ABC
-from typing import Dict, Generic, Iterable, List, Optional, Type, final
+from typing import Dict, Generic, Iterable, List, Optional, Set, Type, final
 
 from ytdl_sub.config.overrides import Overrides
 from ytdl_sub.config.plugin.plugin import BasePlugin, Plugin
@@ -43,6 +43,16 @@ class SourcePlugin(BasePlugin[OptionsValidatorT], Generic[OptionsValidatorT], AB
         )
         self._download_ytdl_options_builder = download_ytdl_options
         self._metadata_ytdl_options_builder = metadata_ytdl_options
+        self._metadata_keep_keys: Optional[Set[str]] = None
+
+    def set_metadata_keep_keys(self, metadata_keep_keys: Optional[Set[str]]) -> None:
+        """
+        Parameters
+        ----------
+        metadata_keep_keys
+            Entry metadata keys to keep when reading entries. If None, keep all of it
+        """
+        self._metadata_keep_keys = metadata_keep_keys
 
     @abc.abstractmethod
     def download_metadata(self) -> Iterable[Entry]:
@@ -1,7 +1,10 @@
 import contextlib
 import os
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from yt_dlp.utils import RejectedVideoReached
 
@@ -190,6 +193,23 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
     plugin_options_type = MultiUrlValidator
     plugin_extensions = [UrlDownloaderThumbnailPlugin, UrlDownloaderCollectionVariablePlugin]
 
+    # Directory within the working directory to download each URL's metadata into when concurrent
+    _METADATA_DIRECTORY_NAME: str = ".ytdl-sub-metadata"
+
+    # Metadata kept in memory for each entry when streaming metadata. Enough to build
+    # EntryParent trees, sort entries, and check whether they were already downloaded
+    _STREAMED_METADATA_KEYS: Set[str] = {
+        "_type",
+        "playlist_id",
+        v.uid.metadata_key,
+        v.ext.metadata_key,
+        v.title.metadata_key,
+        v.playlist_index.metadata_key,
+        v.upload_date.metadata_key,
+        v.extractor_key.metadata_key,
+        v.ie_key.metadata_key,
+    }
+
     @classmethod
     def ytdl_option_defaults(cls) -> Dict:
         """
@@ -231,6 +251,48 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
         )
         self._downloaded_entries: Set[str] = set()
         self._url_state: Optional[URLDownloadState] = None
+        self._on_url_complete: Callable[[], None] = lambda: None
+        self._stream_metadata = False
+        self._uploader_metadata_cache_ttl_s: float = 0
+        self._metadata_url_concurrency = 1
+
+    def set_on_url_complete(self, callback: Callable[[], None]) -> None:
+        """
+        Parameters
+        ----------
+        callback
+            Called after the last entry of each URL is yielded, before the URL's info.json files
+            are cleared from the working directory
+        """
+        self._on_url_complete = callback
+
+    def set_stream_metadata(self, stream_metadata: bool) -> None:
+        """
+        Parameters
+        ----------
+        stream_metadata
+            Whether to only keep an index of each entry's metadata in memory, and read the rest
+            from its info.json when the entry is yielded
+        """
+        self._stream_metadata = stream_metadata
+
+    def set_uploader_metadata_cache_ttl(self, cache_ttl_s: float) -> None:
+        """
+        Parameters
+        ----------
+        cache_ttl_s
+            How long to reuse cached uploader metadata for, in seconds. Not cached when 0
+        """
+        self._uploader_metadata_cache_ttl_s = cache_ttl_s
+
+    def set_metadata_url_concurrency(self, metadata_url_concurrency: int) -> None:
+        """
+        Parameters
+        ----------
+        metadata_url_concurrency
+            Maximum number of URLs to download metadata for at the same time
+        """
+        self._metadata_url_concurrency = metadata_url_concurrency
 
     def download_ytdl_options(self, url_idx: Optional[int] = None) -> Dict:
         """
@@ -368,6 +430,7 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
         return Entry(
             download_entry_dict,
             working_directory=self.working_directory,
+            metadata_keep_keys=self._metadata_keep_keys,
         )
 
     def _iterate_child_entries(
@@ -393,8 +456,9 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
                 entries_to_iter[idx] = None
                 continue
 
-            yield entries_to_iter[idx]
-            self._mark_downloaded(entries_to_iter[idx])
+            entry = entries_to_iter[idx].load_info_json(metadata_keep_keys=self._metadata_keep_keys)
+            yield entry
+            self._mark_downloaded(entry)
 
             entries_to_iter[idx] = None
 
@@ -408,18 +472,47 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
             yield from self._iterate_parent_entry(parent=parent_child, validator=validator)
 
     def _download_url_metadata(
-        self, url: str, include_sibling_metadata: bool, ytdl_options_overrides: Dict
+        self,
+        url: str,
+        include_sibling_metadata: bool,
+        ytdl_options_overrides: Dict,
+        metadata_directory: Optional[str] = None,
     ) -> Tuple[List[EntryParent], List[Entry]]:
         """
-        Downloads only info.json files and forms EntryParent trees
-        """
-        with self._separate_download_archives():
-            entry_dicts = YTDLP.extract_info_via_info_json(
-                working_directory=self.working_directory,
-                ytdl_options_overrides=ytdl_options_overrides,
-                log_prefix_on_info_json_dl="Downloading metadata for",
-                url=url,
-            )
+        Downloads only info.json files and forms EntryParent trees. If a metadata directory is
+        given, the info.json files are downloaded there instead of the working directory, and
+        deleted once read.
+        """
+        index_keys: Optional[Set[str]] = None
+        if self._stream_metadata:
+            index_keys = set(self._STREAMED_METADATA_KEYS)
+            if include_sibling_metadata:
+                index_keys |= EntryParent.sibling_metadata_keys()
+
+        if metadata_directory is None:
+            with self._separate_download_archives():
+                entry_dicts = YTDLP.extract_info_via_info_json(
+                    working_directory=self.working_directory,
+                    ytdl_options_overrides=ytdl_options_overrides,
+                    log_prefix_on_info_json_dl="Downloading metadata for",
+                    index_keys=index_keys,
+                    metadata_keep_keys=self._metadata_keep_keys,
+                    uploader_cache_ttl_s=self._uploader_metadata_cache_ttl_s,
+                    url=url,
+                )
+        else:
+            try:
+                entry_dicts = YTDLP.extract_info_via_info_json(
+                    working_directory=metadata_directory,
+                    ytdl_options_overrides=ytdl_options_overrides,
+                    log_prefix_on_info_json_dl="Downloading metadata for",
+                    index_keys=index_keys,
+                    metadata_keep_keys=self._metadata_keep_keys,
+                    uploader_cache_ttl_s=self._uploader_metadata_cache_ttl_s,
+                    url=url,
+                )
+            finally:
+                shutil.rmtree(metadata_directory, ignore_errors=True)
 
         parents = EntryParent.from_entry_dicts(
             url=url,
@@ -435,6 +528,98 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
 
         return parents, orphans
 
+    def _isolate_metadata_ytdl_options(
+        self, ytdl_options_overrides: Dict, metadata_directory: str
+    ) -> Dict:
+        """
+        Returns
+        -------
+        Metadata ytdl options that write to their own directory, with their own copy of the
+        download archive as it was prior to any downloading
+        """
+        os.makedirs(metadata_directory, exist_ok=True)
+        isolated_ytdl_options = dict(ytdl_options_overrides)
+
+        # outtmpl is either a single template or a dict of templates per output type
+        if isinstance(outtmpl := isolated_ytdl_options.get("outtmpl"), dict):
+            isolated_ytdl_options["outtmpl"] = {
+                output_type: str(Path(metadata_directory) / Path(template).name)
+                for output_type, template in outtmpl.items()
+            }
+        elif outtmpl:
+            isolated_ytdl_options["outtmpl"] = str(Path(metadata_directory) / Path(outtmpl).name)
+
+        if archive_path := isolated_ytdl_options.get("download_archive"):
+            isolated_archive_path = str(Path(metadata_directory) / Path(archive_path).name)
+            isolated_ytdl_options["download_archive"] = isolated_archive_path
+
+            # Same as _separate_download_archives, prefer the backup since it is the archive
+            # prior to any downloading
+            for original_archive_path in (f"{archive_path}.backup", archive_path):
+                if os.path.isfile(original_archive_path):
+                    FileHandler.copy(
+                        src_file_path=original_archive_path,
+                        dst_file_path=isolated_archive_path,
+                    )
+                    break
+
+        return isolated_ytdl_options
+
+    def _download_urls_metadata(
+        self, url_metadata_kwargs: List[Dict[str, Any]]
+    ) -> Iterator[Tuple[List[EntryParent], List[Entry]]]:
+        """
+        Downloads the metadata of each URL, yielding them in the same order they are given.
+
+        When there is more than one URL and the metadata URL concurrency is above 1, their
+        metadata downloads concurrently, each in their own directory. Not done if throttle
+        protection sleeps between requests, since concurrent requests would defeat it, or when
+        streaming metadata, since entries read their info.json files from the working directory
+        when they are yielded.
+        """
+        is_concurrent = (
+            len(url_metadata_kwargs) > 1
+            and self._metadata_url_concurrency > 1
+            and not self._stream_metadata
+            and not any(
+                kwargs["ytdl_options_overrides"].get("sleep_interval_requests")
+                for kwargs in url_metadata_kwargs
+            )
+        )
+        if not is_concurrent:
+            for kwargs in url_metadata_kwargs:
+                yield self._download_url_metadata(**kwargs)
+            return
+
+        metadata_directory = Path(self.working_directory) / self._METADATA_DIRECTORY_NAME
+        with ThreadPoolExecutor(
+            max_workers=min(len(url_metadata_kwargs), self._metadata_url_concurrency),
+            thread_name_prefix=f"{threading.current_thread().name}-metadata",
+        ) as executor:
+            futures: List[Future] = []
+            for url_idx, kwargs in enumerate(url_metadata_kwargs):
+                url_metadata_directory = str(metadata_directory / str(url_idx))
+                futures.append(
+                    executor.submit(
+                        Logger.with_current_debug_log(self._download_url_metadata),
+                        url=kwargs["url"],
+                        include_sibling_metadata=kwargs["include_sibling_metadata"],
+                        ytdl_options_overrides=self._isolate_metadata_ytdl_options(
+                            ytdl_options_overrides=kwargs["ytdl_options_overrides"],
+                            metadata_directory=url_metadata_directory,
+                        ),
+                        metadata_directory=url_metadata_directory,
+                    )
+                )
+
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                # Do not start downloading metadata that will not get used
+                for future in futures:
+                    future.cancel()
+
     def _iterate_entries(
         self,
         parents: List[EntryParent],
@@ -451,21 +636,28 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
 
             yield from self._iterate_child_entries(entries=orphans, validator=validator)
 
-    def _download_metadata(self, url: str, validator: UrlValidator) -> Iterable[Entry]:
-        metadata_ytdl_options = self.metadata_ytdl_options(
-            ytdl_option_overrides=validator.ytdl_options.to_native_dict(self.overrides)
-        )
+            # Entries yielded for this URL may still be getting post-processed, wait for them
+            # before the working directory gets cleared
+            self._on_url_complete()
 
-        include_sibling_metadata = self.overrides.apply_formatter(
-            validator.include_sibling_metadata, expected_type=bool
-        )
-
-        parents, orphan_entries = self._download_url_metadata(
-            url=url,
-            include_sibling_metadata=include_sibling_metadata,
-            ytdl_options_overrides=metadata_ytdl_options,
-        )
+    def _url_metadata_kwargs(self, url: str, validator: UrlValidator) -> Dict[str, Any]:
+        return {
+            "url": url,
+            "include_sibling_metadata": self.overrides.apply_formatter(
+                validator.include_sibling_metadata, expected_type=bool
+            ),
+            "ytdl_options_overrides": self.metadata_ytdl_options(
+                ytdl_option_overrides=validator.ytdl_options.to_native_dict(self.overrides)
+            ),
+        }
 
+    def _iterate_url_entries(
+        self,
+        url: str,
+        validator: UrlValidator,
+        parents: List[EntryParent],
+        orphan_entries: List[Entry],
+    ) -> Iterable[Entry]:
         self._url_state = URLDownloadState(
             entries_total=sum(parent.num_children() for parent in parents) + len(orphan_entries),
         )
@@ -479,6 +671,8 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
 
     def download_metadata(self) -> Iterable[Entry]:
         """The function to perform the download of all media entries"""
+        url_validators: List[Tuple[int, str, UrlValidator]] = []
+
         # download the bottom-most urls first since they are top-priority
         for idx, url_validator in reversed(list(enumerate(self.collection.urls.list))):
             # URLs can be empty. If they are, then skip
@@ -491,19 +685,37 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
                 if not url:
                     continue
 
-                for entry in self._download_metadata(url=url, validator=url_validator):
-                    entry.initialize_script(self.overrides).add(
-                        {
-                            v.ytdl_sub_input_url: url,
-                            v.ytdl_sub_input_url_index: idx,
-                            v.ytdl_sub_input_url_count: len(self.collection.urls.list),
-                        }
-                    )
+                url_validators.append((idx, url, url_validator))
 
-                    yield entry
+        urls_metadata = self._download_urls_metadata(
+            [
+                self._url_metadata_kwargs(url=url, validator=url_validator)
+                for _, url, url_validator in url_validators
+            ]
+        )
 
-    def download(self, entry: Entry) -> Optional[Entry]:
+        for (idx, url, url_validator), (parents, orphan_entries) in zip(
+            url_validators, urls_metadata
+        ):
+            for entry in self._iterate_url_entries(
+                url=url, validator=url_validator, parents=parents, orphan_entries=orphan_entries
+            ):
+                entry.initialize_script(self.overrides).add(
+                    {
+                        v.ytdl_sub_input_url: url,
+                        v.ytdl_sub_input_url_index: idx,
+                        v.ytdl_sub_input_url_count: len(self.collection.urls.list),
+                    }
+                )
+
+                yield entry
+
+    def download_media(self, entry: Entry) -> Optional[Entry]:
         """
+        Downloads the entry without adding its download index variables, which depend on every
+        prior entry already being in the download archive. Use ``add_download_indices`` once
+        they are.
+
         Parameters
         ----------
         entry
@@ -533,13 +745,47 @@ class MultiUrlDownloader(SourcePlugin[MultiUrlValidator]):
             download_logger.info("Entry rejected by download match-filter, skipping ..")
             return None
 
+        return entry.add_download_variables(download_entry=download_entry)
+
+    def add_download_indices(self, entry: Entry) -> Entry:
+        """
+        Parameters
+        ----------
+        entry
+            Entry downloaded via ``download_media``
+
+        Returns
+        -------
+        The entry with its download and upload date indices added, based on the entries
+        currently in the download archive
+        """
         upload_date_idx = self._enhanced_download_archive.mapping.get_num_entries_with_date(
             standardized_date=entry.get(v.ytdl_sub_keep_files_date_eval, str)
         )
         download_idx = self._enhanced_download_archive.num_entries
 
-        return entry.add_injected_variables(
-            download_entry=download_entry,
+        return entry.add_download_index_variables(
             download_idx=download_idx,
             upload_date_idx=upload_date_idx,
         )
+
+    def download(self, entry: Entry) -> Optional[Entry]:
+        """
+        Parameters
+        ----------
+        entry
+            Entry to download
+
+        Returns
+        -------
+        The entry that was downloaded successfully
+
+        Raises
+        ------
+        RejectedVideoReached
+          If a video was rejected and was not from match_filter
+        """
+        if (downloaded_entry := self.download_media(entry)) is None:
+            return None
+
+        return self.add_download_indices(downloaded_entry)
@@ -1,38 +1,260 @@
 import contextlib
 import copy
+import hashlib
 import json
 import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
 
 import yt_dlp as ytdl
 from yt_dlp.utils import ExistingVideoReached, MaxDownloadsReached, RejectedVideoReached
 
+from ytdl_sub.entries.entry import Entry
 from ytdl_sub.thread.log_entries_downloaded_listener import LogEntriesDownloadedListener
 from ytdl_sub.utils.exceptions import FileNotDownloadedException
+from ytdl_sub.utils.file_handler import FileHandler
 from ytdl_sub.utils.logger import Logger
 
 
+class _YoutubeDLPool:
+    """
+    Idle YoutubeDL instances keyed by a canonical hash of their options. Instances are checked out
+    exclusively, so the pool can be shared between threads.
+    """
+
+    def __init__(self, max_idle_instances: int):
+        self._max_idle_instances = max_idle_instances
+        self._lock = threading.Lock()
+        self._idle: "OrderedDict[str, List[ytdl.YoutubeDL]]" = OrderedDict()
+
+        # Keeps non-JSON option values (i.e. match_filter functions) alive so their ids,
+        # which are part of the options key, can not be reused by other objects
+        self._pinned_option_values: Dict[int, Any] = {}
+
+    def options_key(self, ytdl_options: Dict) -> str:
+        """
+        Returns
+        -------
+        Canonical hash of the options dict. Values that can not be serialized are keyed by
+        identity.
+        """
+
+        def _identity(value: Any) -> str:
+            with self._lock:
+                self._pinned_option_values[id(value)] = value
+            return f"{type(value).__qualname__}@{id(value)}"
+
+        serialized = json.dumps(ytdl_options, sort_keys=True, default=_identity)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def checkout(self, key: str) -> Optional[ytdl.YoutubeDL]:
+        """
+        Returns
+        -------
+        An idle instance with the given key, or None if there are none
+        """
+        with self._lock:
+            if not (instances := self._idle.get(key)):
+                return None
+
+            ytdl_downloader = instances.pop()
+            if not instances:
+                del self._idle[key]
+
+        return ytdl_downloader
+
+    def checkin(self, key: str, ytdl_downloader: ytdl.YoutubeDL) -> None:
+        """
+        Returns the instance to the pool, closing the least recently used instance if the pool
+        is full
+        """
+        with self._lock:
+            self._idle.setdefault(key, []).append(ytdl_downloader)
+            self._idle.move_to_end(key)
+
+            evicted: List[ytdl.YoutubeDL] = []
+            while sum(len(instances) for instances in self._idle.values()) > (
+                self._max_idle_instances
+            ):
+                oldest_key = next(iter(self._idle))
+                evicted.append(self._idle[oldest_key].pop(0))
+                if not self._idle[oldest_key]:
+                    del self._idle[oldest_key]
+
+        for evicted_downloader in evicted:
+            evicted_downloader.close()
+
+    def close(self) -> None:
+        """
+        Closes all idle instances, which saves their cookies and closes their connections
+        """
+        with self._lock:
+            instances = [instance for idle in self._idle.values() for instance in idle]
+            self._idle.clear()
+            self._pinned_option_values.clear()
+
+        for ytdl_downloader in instances:
+            ytdl_downloader.close()
+
+
+_THREAD_LOCAL_POOL = threading.local()
+
+
 class YTDLP:
     _EXTRACT_ENTRY_NUM_RETRIES: int = 5
     _EXTRACT_ENTRY_RETRY_WAIT_SEC: int = 5
+    _MAX_IDLE_DOWNLOADERS: int = 4
+    _MAX_CONCURRENT_UPLOADER_LOOKUPS: int = 4
+    _UPLOADER_CACHE_SECTION: str = "ytdl-sub-uploader"
+
+    # Private state yt-dlp keeps per download session, and its initial value. Reset before reusing
+    # a YoutubeDL instance
+    _YTDLP_DOWNLOAD_SESSION_STATE: Dict[str, Callable[[], Any]] = {
+        "_download_retcode": int,
+        "_num_downloads": int,
+        "_num_videos": int,
+        "_playlist_level": int,
+        "_playlist_urls": set,
+    }
+
+    # ytdl options that can change what an uploader lookup returns, i.e. private or
+    # members-only metadata that is only visible when authenticated
+    _UPLOADER_CACHE_OPTION_KEYS: Set[str] = {
+        "ap_mso",
+        "ap_password",
+        "ap_username",
+        "client_certificate",
+        "client_certificate_key",
+        "client_certificate_password",
+        "cookiefile",
+        "cookiesfrombrowser",
+        "extractor_args",
+        "http_headers",
+        "netrc_cmd",
+        "netrc_location",
+        "password",
+        "username",
+        "usenetrc",
+        "videopassword",
+    }
 
     logger = Logger.get(name="yt-dlp-downloader")
 
+    @classmethod
+    @contextmanager
+    def reuse_downloaders(cls) -> Iterator[None]:
+        """
+        Context manager that reuses YoutubeDL instances with identical options within the current
+        thread, instead of creating one per extract_info call. This keeps extractors, cookies
+        and HTTP connections alive between entries. All instances are closed on exit.
+        """
+        if getattr(_THREAD_LOCAL_POOL, "pool", None) is not None:
+            yield
+            return
+
+        _THREAD_LOCAL_POOL.pool = _YoutubeDLPool(max_idle_instances=cls._MAX_IDLE_DOWNLOADERS)
+        try:
+            yield
+        finally:
+            pool: _YoutubeDLPool = _THREAD_LOCAL_POOL.pool
+            _THREAD_LOCAL_POOL.pool = None
+            with Logger.handle_external_logs(name="yt-dlp"):
+                pool.close()
+
+    @classmethod
+    def _reset_download_state(cls, ytdl_downloader: ytdl.YoutubeDL) -> bool:
+        """
+        Resets the state yt-dlp keeps per download session, so a reused instance behaves like a
+        newly created one. The download archive file can change between sessions, so reload it.
+
+        Returns
+        -------
+        False if the instance does not have the expected state, i.e. yt-dlp renamed it, and can
+        not be reused
+        """
+        if not all(
+            hasattr(ytdl_downloader, attribute) for attribute in cls._YTDLP_DOWNLOAD_SESSION_STATE
+        ):
+            return False
+
+        for attribute, initial_value in cls._YTDLP_DOWNLOAD_SESSION_STATE.items():
+            setattr(ytdl_downloader, attribute, initial_value())
+
+        archive_path = ytdl_downloader.params.get("download_archive")
+        if isinstance(archive_path, (str, Path)):
+            ytdl_downloader.archive = set()
+            if os.path.isfile(archive_path):
+                with open(archive_path, "r", encoding="utf-8") as archive_file:
+                    ytdl_downloader.archive.update(line.strip() for line in archive_file)
+        return True
+
+    @classmethod
+    @contextmanager
+    def _pooled_ytdlp_downloader(
+        cls, pool: _YoutubeDLPool, ytdl_options_overrides: Dict
+    ) -> Iterator[ytdl.YoutubeDL]:
+        key = pool.options_key(ytdl_options_overrides)
+        ytdl_downloader = pool.checkout(key)
+        if ytdl_downloader is not None and not cls._reset_download_state(ytdl_downloader):
+            ytdl_downloader.close()
+            ytdl_downloader = None
+
+        if ytdl_downloader is None:
+            # Deep copy ytdl_options in case yt-dlp modifies the dict
+            ytdl_downloader = ytdl.YoutubeDL(copy.deepcopy(ytdl_options_overrides))
+
+        try:
+            yield ytdl_downloader
+        except BaseException:
+            # Do not reuse instances that may be left in a partial state
+            ytdl_downloader.close()
+            raise
+
+        pool.checkin(key, ytdl_downloader)
+
     @classmethod
     @contextmanager
     def ytdlp_downloader(cls, ytdl_options_overrides: Dict) -> ytdl.YoutubeDL:
         """
-        Context manager to interact with yt_dlp.
+        Context manager to interact with yt_dlp. Reuses an idle instance with the same options
+        when called within ``reuse_downloaders``.
         """
         cls.logger.debug("ytdl_options: %s", str(ytdl_options_overrides))
         with Logger.handle_external_logs(name="yt-dlp"):
-            # Deep copy ytdl_options in case yt-dlp modifies the dict
-            with ytdl.YoutubeDL(copy.deepcopy(ytdl_options_overrides)) as ytdl_downloader:
+            if (pool := getattr(_THREAD_LOCAL_POOL, "pool", None)) is not None:
+                downloader_context = cls._pooled_ytdlp_downloader(pool, ytdl_options_overrides)
+            else:
+                # Deep copy ytdl_options in case yt-dlp modifies the dict
+                downloader_context = ytdl.YoutubeDL(copy.deepcopy(ytdl_options_overrides))
+
+            with downloader_context as ytdl_downloader:
                 yield ytdl_downloader
 
+    @classmethod
+    def _output_directories(cls, ytdl_options: Dict) -> List[Optional[str]]:
+        """
+        Returns
+        -------
+        Directories yt-dlp writes files into with these options, or [None] if not known
+        """
+        outtmpl = ytdl_options.get("outtmpl")
+        templates = list(outtmpl.values()) if isinstance(outtmpl, dict) else [outtmpl]
+        if "paths" in ytdl_options or not all(
+            isinstance(template, str) and template for template in templates
+        ):
+            return [None]
+
+        directories = {os.path.dirname(template) for template in templates}
+        if any("%(" in directory for directory in directories):
+            # Directories are formatted per-entry
+            return [None]
+        return sorted(directories)
+
     @classmethod
     def extract_info(cls, ytdl_options_overrides: Dict, **kwargs) -> Dict:
         """
@@ -46,8 +268,12 @@ class YTDLP:
         **kwargs
             arguments passed directory to YoutubeDL extract_info
         """
-        with cls.ytdlp_downloader(ytdl_options_overrides) as ytdlp:
-            return ytdlp.extract_info(**kwargs)
+        try:
+            with cls.ytdlp_downloader(ytdl_options_overrides) as ytdlp:
+                return ytdlp.extract_info(**kwargs)
+        finally:
+            for output_directory in cls._output_directories(ytdl_options_overrides):
+                FileHandler.mark_files_changed(output_directory)
 
     @classmethod
     def extract_info_with_retry(
@@ -134,12 +360,23 @@ class YTDLP:
         )
 
     @classmethod
-    def _get_entry_dicts_from_info_json_files(cls, working_directory: str) -> List[Dict]:
+    def _get_entry_dicts_from_info_json_files(
+        cls,
+        working_directory: str,
+        index_keys: Optional[Set[str]] = None,
+        metadata_keep_keys: Optional[Set[str]] = None,
+    ) -> List[Dict]:
         """
         Parameters
         ----------
         working_directory
             Directory that info json files are located
+        index_keys
+            Optional. Only keep these keys of entries (not parents), along with the keys needed
+            to look up uploader metadata. The rest is loaded later via ``Entry.load_info_json``
+        metadata_keep_keys
+            Optional. Only keep these metadata keys of entries (not parents). If None, keep all
+            of it
 
         Returns
         -------
@@ -154,7 +391,20 @@ class YTDLP:
 
         for info_json_path in info_json_paths:
             with open(info_json_path, "r", encoding="utf-8") as file:
-                entry_dicts.append(json.load(file))
+                entry_dict = json.load(file)
+
+            if Entry.is_entry_parent(entry_dict):
+                entry_dicts.append(entry_dict)
+                continue
+
+            entry_dict = Entry.prune_metadata(entry_dict, metadata_keep_keys=metadata_keep_keys)
+            if index_keys is not None:
+                entry_dict = Entry.info_json_index(
+                    entry_dict=entry_dict,
+                    info_json_path=str(info_json_path),
+                    index_keys=index_keys | {"uploader_id", "uploader_url"},
+                )
+            entry_dicts.append(entry_dict)
 
         return entry_dicts
 
@@ -183,12 +433,123 @@ class YTDLP:
         finally:
             info_json_listener.complete = True
 
+    @classmethod
+    def _uploader_cache_key(cls, ytdl_options_overrides: Dict, uploader_url: str) -> str:
+        """
+        Returns
+        -------
+        Cache key of the uploader URL, combined with a digest of the ytdl options that can
+        change what the lookup returns
+        """
+        cache_options = {
+            key: value
+            for key, value in ytdl_options_overrides.items()
+            if key in cls._UPLOADER_CACHE_OPTION_KEYS
+        }
+        serialized = json.dumps(cache_options, sort_keys=True, default=str)
+        digest = hashlib.sha256(serialized.encode("utf-8")).hexdigest()[:16]
+        return f"{uploader_url}#{digest}"
+
+    @classmethod
+    def _extract_uploader_info(
+        cls, ytdl_options_overrides: Dict, uploader_url: str, cache_ttl_s: float
+    ) -> Optional[Dict]:
+        """
+        Extracts the uploader's metadata without any of its entries. If ``cache_ttl_s`` is
+        positive, successful lookups are stored in yt-dlp's cache directory and reused until they
+        are older than it.
+
+        Returns
+        -------
+        The uploader's metadata in the same form as if it were read from an info.json file,
+        or None if it could not be extracted
+        """
+        uploader_ytdl_options = ytdl_options_overrides | {"playlist_items": "0:0"}
+        cache_key = cls._uploader_cache_key(
+            ytdl_options_overrides=ytdl_options_overrides, uploader_url=uploader_url
+        )
+
+        # Lookups run in their own threads, which do not share the caller's downloaders. Reuse a
+        # single instance for the cache load, the lookup and the cache store
+        with cls.reuse_downloaders():
+            if cache_ttl_s > 0:
+                with cls.ytdlp_downloader(uploader_ytdl_options) as ytdlp:
+                    cached = ytdlp.cache.load(section=cls._UPLOADER_CACHE_SECTION, key=cache_key)
+                if isinstance(cached, dict) and (
+                    time.time() - cached.get("timestamp", 0) < cache_ttl_s
+                ):
+                    cls.logger.debug("Using cached parent metadata for URL %s", uploader_url)
+                    return cached.get("uploader_dict")
+
+            cls.logger.debug("Attempting to get parent metadata from URL %s", uploader_url)
+            try:
+                uploader_dict = cls.extract_info(
+                    ytdl_options_overrides=uploader_ytdl_options, url=uploader_url
+                )
+            except Exception:  # pylint: disable=broad-except
+                return None
+
+            if not isinstance(uploader_dict, dict):
+                return None
+
+            # Round-trip through JSON so fresh and cached lookups have the same shape as entry
+            # dicts that are read from info.json files
+            uploader_dict = json.loads(json.dumps(ytdl.YoutubeDL.sanitize_info(uploader_dict)))
+            if cache_ttl_s > 0:
+                with cls.ytdlp_downloader(uploader_ytdl_options) as ytdlp:
+                    ytdlp.cache.store(
+                        section=cls._UPLOADER_CACHE_SECTION,
+                        key=cache_key,
+                        data={"timestamp": time.time(), "uploader_dict": uploader_dict},
+                    )
+            return uploader_dict
+
+    @classmethod
+    def _extract_uploader_infos(
+        cls, ytdl_options_overrides: Dict, uploader_urls: List[str], cache_ttl_s: float
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Extracts the metadata of each uploader. Lookups run concurrently unless throttle
+        protection sleeps between requests.
+
+        Returns
+        -------
+        Mapping of uploader URL to its metadata, or None if it could not be extracted
+        """
+        if len(uploader_urls) <= 1 or ytdl_options_overrides.get("sleep_interval_requests"):
+            return {
+                uploader_url: cls._extract_uploader_info(
+                    ytdl_options_overrides=ytdl_options_overrides,
+                    uploader_url=uploader_url,
+                    cache_ttl_s=cache_ttl_s,
+                )
+                for uploader_url in uploader_urls
+            }
+
+        extract_uploader_info = Logger.with_current_debug_log(cls._extract_uploader_info)
+        with ThreadPoolExecutor(
+            max_workers=min(len(uploader_urls), cls._MAX_CONCURRENT_UPLOADER_LOOKUPS),
+            thread_name_prefix=f"{threading.current_thread().name}-uploader",
+        ) as executor:
+            uploader_dicts = executor.map(
+                lambda uploader_url: extract_uploader_info(
+                    ytdl_options_overrides=ytdl_options_overrides,
+                    uploader_url=uploader_url,
+                    cache_ttl_s=cache_ttl_s,
+                ),
+                uploader_urls,
+            )
+            return dict(zip(uploader_urls, uploader_dicts))
+
     @classmethod
     def extract_info_via_info_json(
         cls,
         working_directory: str,
         ytdl_options_overrides: Dict,
         log_prefix_on_info_json_dl: Optional[str] = None,
+        index_keys: Optional[Set[str]] = None,
+        metadata_keep_keys: Optional[Set[str]] = None,
+        uploader_cache_ttl_s: float = 0,
         **kwargs,
     ) -> List[Dict]:
         """
@@ -208,9 +569,18 @@ class YTDLP:
         log_prefix_on_info_json_dl
             Optional. Spin a new thread to listen for new info.json files. Log
             f'{log_prefix_on_info_json_dl} {title}' when a new one appears
+        index_keys
+            Optional. Only keep these keys of entry dicts. The rest of their metadata must be
+            loaded from their info.json files using ``Entry.load_info_json``
+        metadata_keep_keys
+            Optional. Only keep these metadata keys of entry dicts. If None, keep all of it
+        uploader_cache_ttl_s
+            Optional. How long to reuse cached uploader metadata for, in seconds. Uploader
+            metadata is not cached when 0
         **kwargs
             arguments passed directory to YoutubeDL extract_info
         """
+        # pylint: disable=too-many-locals
         try:
             with cls._listen_and_log_downloaded_info_json(
                 working_directory=working_directory, log_prefix=log_prefix_on_info_json_dl
@@ -230,11 +600,16 @@ class YTDLP:
             cls.logger.info("MaxDownloadsReached, stopping additional downloads.")
 
         parent_dicts: List[Dict] = []
-        entry_dicts = cls._get_entry_dicts_from_info_json_files(working_directory=working_directory)
+        entry_dicts = cls._get_entry_dicts_from_info_json_files(
+            working_directory=working_directory,
+            index_keys=index_keys,
+            metadata_keep_keys=metadata_keep_keys,
+        )
         entry_ids = {entry_dict.get("id") for entry_dict in entry_dicts}
 
         # Try to get additional uploader (source) metadata that yt-dlp does not fetch
-        # in a single request
+        # in a single request. Each uploader is only looked up once.
+        uploader_urls: Dict[str, str] = {}
         for entry_dict in entry_dicts:
             if not (uploader_id := entry_dict.get("uploader_id")):
                 continue
@@ -242,23 +617,20 @@ class YTDLP:
             if uploader_id in entry_ids or not (uploader_url := entry_dict.get("uploader_url")):
                 continue
 
-            cls.logger.debug("Attempting to get parent metadata from URL %s", uploader_url)
-            parent_dict: Optional[Dict] = None
-            try:
-                parent_dict = cls.extract_info(
-                    ytdl_options_overrides=ytdl_options_overrides | {"playlist_items": "0:0"},
-                    url=uploader_url,
-                )
-            except Exception:  # pylint: disable=broad-except
-                pass
+            uploader_urls.setdefault(uploader_id, uploader_url)
 
+        uploader_dicts = cls._extract_uploader_infos(
+            ytdl_options_overrides=ytdl_options_overrides,
+            uploader_urls=list(dict.fromkeys(uploader_urls.values())),
+            cache_ttl_s=uploader_cache_ttl_s,
+        )
+
+        for uploader_id, uploader_url in uploader_urls.items():
+            parent_dict = uploader_dicts[uploader_url]
             parent_id = parent_dict.get("id") if isinstance(parent_dict, dict) else None
             if parent_id and parent_id not in entry_ids:
                 parent_dicts.append(parent_dict)
                 entry_ids.add(parent_id)
                 cls.logger.debug("Adding parent metadata with ids [%s, %s]", uploader_id, parent_id)
 
-            # Always add the uploader_id since it has been tried
-            entry_ids.add(uploader_id)
-
         return entry_dicts + parent_dicts
@@ -1,14 +1,19 @@
 # pylint: disable=protected-access
+# pylint: disable=too-many-public-methods
 import copy
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional, Type, TypeVar, final
+from typing import Any, Dict, Iterable, Optional, Set, Type, TypeVar, final
 
 from ytdl_sub.entries.base_entry import BaseEntry
 from ytdl_sub.entries.script.variable_definitions import VARIABLES, VariableDefinitions
 from ytdl_sub.entries.script.variable_types import ArrayVariable, StringVariable, Variable
+from ytdl_sub.entries.sibling_metadata import SiblingMetadata
+from ytdl_sub.script.types.resolvable import Resolvable
 from ytdl_sub.script.utils.exceptions import ScriptVariableNotResolved
+from ytdl_sub.utils.ffmpeg_remux_plan import FFmpegRemuxPlan
+from ytdl_sub.utils.file_handler import FileHandler
 from ytdl_sub.utils.script import ScriptUtils
 from ytdl_sub.utils.scriptable import Scriptable
 from ytdl_sub.validators.audo_codec_validator import AUDIO_CODEC_EXTS, VIDEO_CODEC_EXTS
@@ -16,6 +21,7 @@ from ytdl_sub.validators.audo_codec_validator import AUDIO_CODEC_EXTS, VIDEO_COD
 v: VariableDefinitions = VARIABLES
 
 _YTDL_SUB_ENTRY_VARIABLES_KWARG_KEY: str = "ytdl_sub_entry_variables"
+_YTDL_SUB_INFO_JSON_PATH_KWARG_KEY: str = "ytdl_sub_info_json_path"
 ytdl_sub_chapters_from_comments = ArrayVariable(
     "ytdl_sub_chapters_from_comments", definition="{ [] }"
 )
@@ -31,10 +37,79 @@ class Entry(BaseEntry, Scriptable):
     Entry object to represent a single media object returned from yt-dlp.
     """
 
-    def __init__(self, entry_dict: Dict, working_directory: str):
-        BaseEntry.__init__(self, entry_dict=entry_dict, working_directory=working_directory)
+    def __init__(
+        self,
+        entry_dict: Dict,
+        working_directory: str,
+        metadata_keep_keys: Optional[Set[str]] = None,
+    ):
+        BaseEntry.__init__(
+            self,
+            entry_dict=self.prune_metadata(entry_dict, metadata_keep_keys=metadata_keep_keys),
+            working_directory=working_directory,
+        )
         Scriptable.__init__(self)
 
+        # Variables resolved on-demand, only containing the ones needed so far
+        self._resolved: Dict[str, Resolvable] = {}
+
+        # Sibling table shared with the entry's siblings, resolved only when a variable needs it
+        self._sibling_metadata: Optional[SiblingMetadata] = None
+
+        # ffmpeg operations added by plugins during post-processing
+        self._ffmpeg_remux_plan = FFmpegRemuxPlan()
+
+        # Snapshot of the entry's file names in the working directory, and the files version it
+        # was taken at
+        self._working_file_names: Set[str] = set()
+        self._working_file_names_version: Optional[int] = None
+
+    @classmethod
+    def default_metadata_keep_keys(cls) -> Set[str]:
+        """
+        Returns
+        -------
+        Metadata keys that are read by ytdl-sub's variables or used internally
+        """
+        return {var.metadata_key for var in v.metadata_variables()} | {
+            "_type",
+            "thumbnails",
+            _YTDL_SUB_ENTRY_VARIABLES_KWARG_KEY,
+            _YTDL_SUB_INFO_JSON_PATH_KWARG_KEY,
+        }
+
+    @classmethod
+    def metadata_keep_keys(cls, additional_keys: Iterable[str]) -> Set[str]:
+        """
+        Parameters
+        ----------
+        additional_keys
+            Metadata keys to keep in addition to the default ones
+
+        Returns
+        -------
+        Metadata keys to keep when pruning entry metadata
+        """
+        return cls.default_metadata_keep_keys() | set(additional_keys)
+
+    @classmethod
+    def prune_metadata(cls, entry_dict: Dict, metadata_keep_keys: Optional[Set[str]]) -> Dict:
+        """
+        Parameters
+        ----------
+        entry_dict
+            Entry metadata to prune
+        metadata_keep_keys
+            Metadata keys to keep. If None, do not prune any metadata
+
+        Returns
+        -------
+        The entry dict without the metadata keys that are not kept
+        """
+        if metadata_keep_keys is None:
+            return entry_dict
+        return {key: value for key, value in entry_dict.items() if key in metadata_keep_keys}
+
     def initialize_script(self, other: Optional[Scriptable] = None) -> "Entry":
         """
         Initializes the entry script using the Overrides script, then adding
@@ -42,26 +117,98 @@ class Entry(BaseEntry, Scriptable):
         """
         # Overrides contains added variables that are unresolvable, add them here
         if other:
-            self._script = copy.deepcopy(other.script)
-            self._unresolvable = copy.deepcopy(other.unresolvable)
+            self._script = other.script.fork()
+            self._unresolvable = set(other.unresolvable)
+            self._user_variable_names = other.user_variable_names
         else:
             self.initialize_base_script()
 
+        self._resolved = {}
         self._add_entry_kwargs_to_script()
         return self
 
     def _add_entry_kwargs_to_script(self) -> None:
         # Add entry metadata, but avoid the `.add()` helper since it also adds sanitized
         self.unresolvable.remove(v.entry_metadata.variable_name)
-        self.script.add({v.entry_metadata.variable_name: ScriptUtils.to_script(self._kwargs)})
-        self.update_script()
+
+        entry_metadata = self._kwargs
+        self._sibling_metadata = None
+        sibling_metadata = entry_metadata.get(v.sibling_metadata.metadata_key)
+        if isinstance(sibling_metadata, SiblingMetadata):
+            # Kept out of entry_metadata, see _resolve_sibling_metadata
+            self._sibling_metadata = sibling_metadata
+            entry_metadata = {
+                key: value
+                for key, value in entry_metadata.items()
+                if key != v.sibling_metadata.metadata_key
+            }
+
+        self.script.add_parsed(
+            {v.entry_metadata.variable_name: ScriptUtils.to_syntax_tree(entry_metadata)}
+        )
+        self._resolve_eager_variables()
+
+    def _resolve_eager_variables(self) -> None:
+        # Variables that throw or print, and ones defined by the user, are resolved as soon as
+        # they can be regardless of whether they get used. Errors within them surface when the
+        # entry is created rather than whenever (if ever) they get used. Only built-in variables
+        # are resolved on-demand.
+        for name in self.script.in_resolution_order(
+            set(self.script.side_effect_variables) | self.user_variable_names
+        ):
+            if name not in self._resolved:
+                try:
+                    _ = self._get_resolved(variable_name=name)
+                except ScriptVariableNotResolved:
+                    pass
+
+    def _before_variables_added(self, variable_names: Set[str]) -> None:
+        # Variables that are already resolvable keep their value when a variable they depend on
+        # gets redefined, so resolve the ones that have not been yet before it changes
+        for name in self.script.dependents_of(variable_names) - self._resolved.keys():
+            try:
+                _ = self._get_resolved(variable_name=name)
+            except ScriptVariableNotResolved:
+                pass
+
+    def _on_variables_added(self, variable_names: Set[str]) -> None:
+        for name in variable_names:
+            self._resolved.pop(name, None)
+        self._resolve_eager_variables()
+
+    def _resolve_sibling_metadata(self, variable_names: Optional[Set[str]] = None) -> None:
+        # The sibling table is converted to a script value once, shared by all siblings, and only
+        # when resolving a variable that depends on it. All variables get resolved if None
+        name = v.sibling_metadata.variable_name
+        if self._sibling_metadata is None or name in self._resolved:
+            return
+
+        if (
+            variable_names is None
+            or name in variable_names
+            or not variable_names.isdisjoint(self.script.dependents_of([name]))
+        ):
+            self._resolved[name] = self._sibling_metadata.resolvable
+
+    def _get_all_resolved(self, variable_names: Set[str]) -> Dict[str, Resolvable]:
+        self._resolve_sibling_metadata(variable_names)
+        if not variable_names <= self._resolved.keys():
+            self._resolved = self.script.resolve_subset(
+                variable_names=variable_names - self._resolved.keys(),
+                resolved=self._resolved,
+                unresolvable=self.unresolvable,
+            ).output
+        return self._resolved
+
+    def _get_resolved(self, variable_name: str) -> Resolvable:
+        return self._get_all_resolved({variable_name})[variable_name]
 
     def get(self, variable: Variable, expected_type: Type[TypeT]) -> TypeT:
         """
         Gets a variable of an expected type. Will error if it does not exist or is not resolved.
+        Only the variable and what it depends on get resolved, and are remembered for later use.
         """
-        out = self.script.resolve(unresolvable=self.unresolvable).get_native(variable.variable_name)
-        return expected_type(out)
+        return expected_type(self._get_resolved(variable.variable_name).native)
 
     def try_get(self, variable: Variable, expected_type: Type[TypeT]) -> Optional[TypeT]:
         """
@@ -72,19 +219,12 @@ class Entry(BaseEntry, Scriptable):
         except ScriptVariableNotResolved:
             return None
 
-    def add_injected_variables(
-        self, download_entry: "Entry", download_idx: int, upload_date_idx: int
-    ) -> "Entry":
+    def add_download_variables(self, download_entry: "Entry") -> "Entry":
         """
-        Adds variables that get injected into the Entry script that aren't available at
-        metadata scrape time (only after the actual download).
+        Adds variables from the downloaded entry that aren't available at metadata scrape time.
         """
         self.add(
             {
-                # Tracks number of entries downloaded
-                v.download_index: download_idx + 1,
-                # Tracks number of entries with the same upload date to make them unique
-                v.upload_date_index: upload_date_idx + 1,
                 v.requested_subtitles: download_entry._kwargs_get(
                     v.requested_subtitles.metadata_key, []
                 ),
@@ -100,6 +240,67 @@ class Entry(BaseEntry, Scriptable):
         )
         return self
 
+    def add_download_index_variables(self, download_idx: int, upload_date_idx: int) -> "Entry":
+        """
+        Adds variables that depend on what is in the download archive at the time the entry
+        gets post-processed.
+        """
+        self.add(
+            {
+                # Tracks number of entries downloaded
+                v.download_index: download_idx + 1,
+                # Tracks number of entries with the same upload date to make them unique
+                v.upload_date_index: upload_date_idx + 1,
+            }
+        )
+        return self
+
+    def add_injected_variables(
+        self, download_entry: "Entry", download_idx: int, upload_date_idx: int
+    ) -> "Entry":
+        """
+        Adds variables that get injected into the Entry script that aren't available at
+        metadata scrape time (only after the actual download).
+        """
+        return self.add_download_variables(download_entry).add_download_index_variables(
+            download_idx=download_idx, upload_date_idx=upload_date_idx
+        )
+
+    def _get_working_file_names(self) -> Set[str]:
+        """
+        Lists the entry's files in the working directory once, and reuses the listing until
+        files get written, moved, or deleted.
+        """
+        files_version = FileHandler.files_version(self.working_directory())
+        if self._working_file_names_version != files_version:
+            file_name_prefix = f"{self.uid_sanitized}."
+            try:
+                with os.scandir(self.working_directory()) as dir_entries:
+                    self._working_file_names = {
+                        dir_entry.name
+                        for dir_entry in dir_entries
+                        if dir_entry.name.startswith(file_name_prefix) and dir_entry.is_file()
+                    }
+            except FileNotFoundError:
+                self._working_file_names = set()
+            self._working_file_names_version = files_version
+
+        return self._working_file_names
+
+    def working_file_exists(self, ext: str) -> bool:
+        """
+        Parameters
+        ----------
+        ext
+            Extension of the entry's file
+
+        Returns
+        -------
+        True if the entry's file with this extension exists in the working directory.
+        False otherwise.
+        """
+        return self.base_filename(ext=ext) in self._get_working_file_names()
+
     @property
     def ext(self) -> str:
         """
@@ -112,9 +313,7 @@ class Entry(BaseEntry, Scriptable):
         for possible_ext in [
             ext,
         ] + list(VIDEO_CODEC_EXTS):
-            file_name = self.base_filename(ext=possible_ext)
-            file_path = str(Path(self.working_directory()) / file_name)
-            if os.path.isfile(file_path):
+            if self.working_file_exists(ext=possible_ext):
                 return possible_ext
 
         return ext
@@ -131,6 +330,15 @@ class Entry(BaseEntry, Scriptable):
         """Returns the entry's file path to where it was downloaded"""
         return str(Path(self.working_directory()) / self.get_download_file_name())
 
+    def ffmpeg_remux_plan(self) -> FFmpegRemuxPlan:
+        """
+        Returns
+        -------
+        ffmpeg operations to apply to the entry's file in a single pass after it is
+        post-processed, but before it is moved to the output directory
+        """
+        return self._ffmpeg_remux_plan
+
     def get_download_thumbnail_name(self) -> str:
         """
         Returns
@@ -155,12 +363,8 @@ class Entry(BaseEntry, Scriptable):
             possible_thumbnail_exts.add(thumbnail["url"].split(".")[-1])
 
         for ext in possible_thumbnail_exts:
-            possible_thumbnail_filename = self.base_filename(ext=ext)
-            possible_thumbnail_path = str(
-                Path(self.working_directory()) / possible_thumbnail_filename
-            )
-            if os.path.isfile(possible_thumbnail_path):
-                return possible_thumbnail_path
+            if self.working_file_exists(ext=ext):
+                return str(Path(self.working_directory()) / self.base_filename(ext=ext))
 
         return None
 
@@ -169,11 +373,16 @@ class Entry(BaseEntry, Scriptable):
         Write the entry's _kwargs back into the info.json file as well as its source variables
         """
         kwargs_dict = copy.deepcopy(self._kwargs)
+        if isinstance(
+            sibling_metadata := kwargs_dict.get(v.sibling_metadata.metadata_key), SiblingMetadata
+        ):
+            kwargs_dict[v.sibling_metadata.metadata_key] = sibling_metadata.to_list()
         kwargs_dict[_YTDL_SUB_ENTRY_VARIABLES_KWARG_KEY] = self.to_dict()
         kwargs_json = json.dumps(kwargs_dict, ensure_ascii=False, sort_keys=True, indent=2)
 
         with open(self.get_download_info_json_path(), "w", encoding="utf-8") as file:
             file.write(kwargs_json)
+        FileHandler.mark_files_changed(self.working_directory())
 
     @final
     def is_thumbnail_downloaded_via_ytdlp(self) -> bool:
@@ -200,17 +409,12 @@ class Entry(BaseEntry, Scriptable):
         -------
         True if the file exist locally. False otherwise.
         """
-        file_exists = os.path.isfile(self.get_download_file_path())
-
         # HACK: yt-dlp does not record extracted/converted extensions anywhere. If the file is not
         # found, try it using all possible extensions
-        if not file_exists:
-            for ext in AUDIO_CODEC_EXTS | VIDEO_CODEC_EXTS:
-                if os.path.isfile(self.get_download_file_path().removesuffix(self.ext) + ext):
-                    file_exists = True
-                    break
-
-        return file_exists
+        return any(
+            self.working_file_exists(ext=ext)
+            for ext in [self.ext] + list(AUDIO_CODEC_EXTS | VIDEO_CODEC_EXTS)
+        )
 
     def maybe_get_prior_variables(self) -> Dict[str, Any]:
         """
@@ -224,6 +428,31 @@ class Entry(BaseEntry, Scriptable):
 
         return maybe_prior_variables
 
+    def resolve_once(self, variable_definitions: Dict[str, str]) -> Dict[str, Resolvable]:
+        """
+        Resolves variable definitions using the entry's variables without adding them to the
+        entry's script. The definitions may redefine entry variables.
+
+        Parameters
+        ----------
+        variable_definitions
+            Variables to resolve
+
+        Returns
+        -------
+        Dict containing the variable names to their resolved values
+        """
+        self._resolve_sibling_metadata()
+        return self.script.resolve_once(
+            variable_definitions,
+            resolved={
+                name: value
+                for name, value in self._resolved.items()
+                if name not in variable_definitions
+            },
+            unresolvable=self.unresolvable,
+        )
+
     @final
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -231,7 +460,59 @@ class Entry(BaseEntry, Scriptable):
         -------
         Dictionary containing all variables
         """
-        return self.script.resolve().as_native()
+        self._resolve_sibling_metadata()
+        return self.script.resolve(resolved=self._resolved).as_native()
+
+    @classmethod
+    def info_json_index(cls, entry_dict: Dict, info_json_path: str, index_keys: Set[str]) -> Dict:
+        """
+        Parameters
+        ----------
+        entry_dict
+            Entry metadata read from the info.json
+        info_json_path
+            Path to the info.json
+        index_keys
+            Keys of the entry metadata to keep
+
+        Returns
+        -------
+        Entry dict containing only the index keys. The rest of the metadata is loaded from the
+        info.json using ``load_info_json``
+        """
+        index = {key: entry_dict[key] for key in index_keys if key in entry_dict}
+        index[_YTDL_SUB_INFO_JSON_PATH_KWARG_KEY] = info_json_path
+        return index
+
+    def load_info_json(self, metadata_keep_keys: Optional[Set[str]] = None) -> "Entry":
+        """
+        Parameters
+        ----------
+        metadata_keep_keys
+            Optional. Metadata keys to keep from the info.json. If None, keep all of it
+
+        Returns
+        -------
+        If this entry was created from an ``info_json_index``, a new entry with all of its
+        metadata read from the info.json. Otherwise, itself.
+        """
+        if (info_json_path := self._kwargs.get(_YTDL_SUB_INFO_JSON_PATH_KWARG_KEY)) is None:
+            return self
+
+        with open(info_json_path, "r", encoding="utf-8") as file:
+            entry_dict = json.load(file)
+
+        # Keep metadata added after indexing, i.e. parent and sibling metadata
+        entry_dict.update(
+            (key, value)
+            for key, value in self._kwargs.items()
+            if key != _YTDL_SUB_INFO_JSON_PATH_KWARG_KEY
+        )
+        return Entry(
+            entry_dict=entry_dict,
+            working_directory=self.working_directory(),
+            metadata_keep_keys=metadata_keep_keys,
+        )
 
     @classmethod
     def create_split_entry(cls, entry: "Entry", new_uid: str) -> "Entry":
@@ -1,4 +1,5 @@
 import math
+from collections import defaultdict
 from typing import Any, Dict, List, Optional, Set
 from urllib.parse import urlparse
 
@@ -6,6 +7,7 @@ from ytdl_sub.entries.base_entry import BaseEntry, BaseEntryT
 from ytdl_sub.entries.entry import Entry
 from ytdl_sub.entries.script.variable_definitions import VARIABLES, VariableDefinitions
 from ytdl_sub.entries.script.variable_types import MetadataVariable
+from ytdl_sub.entries.sibling_metadata import SiblingMetadata
 
 v: VariableDefinitions = VARIABLES
 
@@ -45,16 +47,23 @@ class EntryParent(BaseEntry):
             self.entry_children()
         )
 
-    def _sibling_entry_metadata(self) -> List[Dict[str, Any]]:
-        sibling_entry_metadata: List[Dict[str, Any]] = []
+    @classmethod
+    def sibling_metadata_keys(cls) -> Set[str]:
+        """
+        Returns
+        -------
+        Metadata keys of each entry that are included in their siblings' sibling_metadata
+        """
         variable_filter: Set[MetadataVariable] = (
             v.required_entry_variables() | v.default_entry_variables()
         )
-        for entry in self.entry_children():
-            sibling_entry_metadata.append(
-                {var.metadata_key: entry._kwargs_get(var.metadata_key) for var in variable_filter}
-            )
-        return sibling_entry_metadata
+        return {var.metadata_key for var in variable_filter}
+
+    def _sibling_entry_metadata(self) -> SiblingMetadata:
+        # A single table is shared by every child instead of each holding its own copy
+        return SiblingMetadata.from_entries(
+            entries=self.entry_children(), metadata_keys=self.sibling_metadata_keys()
+        )
 
     def _set_child_variables(
         self, include_sibling_metadata: bool, parents: Optional[List["EntryParent"]] = None
@@ -86,7 +95,21 @@ class EntryParent(BaseEntry):
 
         return self
 
-    def _read_children_from_entry_dicts(self, entry_dicts: List[Dict]) -> "EntryParent":
+    @classmethod
+    def _index_by_playlist_id(cls, entry_dicts: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Groups entry dicts by their playlist_id, maintaining their order. Ones without a
+        playlist_id are omitted.
+        """
+        entry_dicts_by_playlist_id: Dict[str, List[Dict]] = defaultdict(list)
+        for entry_dict in entry_dicts:
+            if playlist_id := entry_dict.get("playlist_id"):
+                entry_dicts_by_playlist_id[playlist_id].append(entry_dict)
+        return entry_dicts_by_playlist_id
+
+    def _read_children_from_entry_dicts(
+        self, entry_dicts_by_playlist_id: Dict[str, List[Dict]]
+    ) -> "EntryParent":
         """
         Populates a tree of EntryParents that belong to this instance
         """
@@ -94,9 +117,8 @@ class EntryParent(BaseEntry):
             EntryParent(
                 entry_dict=entry_dict,
                 working_directory=self.working_directory(),
-            )._read_children_from_entry_dicts(entry_dicts)
-            for entry_dict in entry_dicts
-            if entry_dict in self
+            )._read_children_from_entry_dicts(entry_dicts_by_playlist_id)
+            for entry_dict in entry_dicts_by_playlist_id.get(self.uid, [])
         ]
 
         self._parent_children = self._sort_entries(
@@ -138,6 +160,18 @@ class EntryParent(BaseEntry):
 
         return self.uid == playlist_id or any(item in child for child in self.parent_children())
 
+    def _nested_parent_uids(self) -> Set[str]:
+        """
+        Returns
+        -------
+        uids of this parent and all of its nested parent children, i.e. every playlist_id
+        that is ``in`` this parent
+        """
+        nested_parent_uids = {self.uid}
+        for parent_child in self.parent_children():
+            nested_parent_uids |= parent_child._nested_parent_uids()
+        return nested_parent_uids
+
     @classmethod
     def _get_disconnected_root_parent(
         cls, url: str, parents: List["EntryParent"]
@@ -188,10 +222,11 @@ class EntryParent(BaseEntry):
         """
         Reads all entry dicts and builds a tree of EntryParents
         """
+        entry_dicts_by_playlist_id = cls._index_by_playlist_id(entry_dicts)
         parents = [
             EntryParent(
                 entry_dict=entry_dict, working_directory=working_directory
-            )._read_children_from_entry_dicts(entry_dicts)
+            )._read_children_from_entry_dicts(entry_dicts_by_playlist_id)
             for entry_dict in entry_dicts
             if cls.is_entry_parent(entry_dict)
         ]
@@ -221,8 +256,13 @@ class EntryParent(BaseEntry):
         Reads all entries that do not have any parents
         """
 
+        parent_uids: Set[str] = set()
+        for parent in parents:
+            parent_uids |= parent._nested_parent_uids()
+
         def _in_any_parents(entry_dict: Dict):
-            return any(entry_dict in parent for parent in parents)
+            playlist_id = entry_dict.get("playlist_id")
+            return bool(playlist_id) and playlist_id in parent_uids
 
         return [
             Entry(
@@ -1145,6 +1145,17 @@ class VariableDefinitions(
             var_names |= {f"{name}_sanitized" for name in var_names}
         return var_names
 
+    @cache
+    def metadata_variables(self) -> Set[MetadataVariable]:
+        """
+        Returns all variables that are read from entry metadata
+        """
+        return {
+            getattr(self, attr)
+            for attr in dir(self)
+            if isinstance(getattr(self, attr), MetadataVariable)
+        }
+
     @cache
     def injected_variables(self) -> Set[MetadataVariable]:
         """
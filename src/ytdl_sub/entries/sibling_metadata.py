@@ -0,0 +1,84 @@
+from functools import cached_property
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from ytdl_sub.entries.base_entry import BaseEntry
+from ytdl_sub.script.types.array import Array
+from ytdl_sub.utils.script import ScriptUtils
+
+# pylint: disable=protected-access
+
+
+class SiblingMetadata(Sequence[Dict[str, Any]]):
+    """
+    Immutable table of the metadata of every entry in a playlist, stored by column. A single
+    instance is shared by all entries in the playlist rather than each holding its own copy.
+    Rows are only materialized as dicts when they are accessed.
+    """
+
+    def __init__(self, columns: Dict[str, Tuple[Any, ...]], num_rows: int):
+        self._columns = columns
+        self._num_rows = num_rows
+
+    @classmethod
+    def from_entries(
+        cls, entries: Sequence[BaseEntry], metadata_keys: Iterable[str]
+    ) -> "SiblingMetadata":
+        """
+        Parameters
+        ----------
+        entries
+            Sibling entries, one row per entry
+        metadata_keys
+            Metadata keys to include of each entry, one column per key
+
+        Returns
+        -------
+        Table containing the metadata of each entry
+        """
+        return cls(
+            columns={
+                metadata_key: tuple(entry._kwargs_get(metadata_key) for entry in entries)
+                for metadata_key in sorted(metadata_keys)
+            },
+            num_rows=len(entries),
+        )
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    def __getitem__(self, idx):  # type: ignore[override]
+        if isinstance(idx, slice):
+            return [self[row_idx] for row_idx in range(self._num_rows)[idx]]
+        row_idx = range(self._num_rows)[idx]  # raises IndexError if out of range
+        return {metadata_key: column[row_idx] for metadata_key, column in self._columns.items()}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self[row_idx] for row_idx in range(self._num_rows))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SiblingMetadata):
+            return self._columns == other._columns and self._num_rows == other._num_rows
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "SiblingMetadata":
+        # Immutable, safe to share between copies of entries
+        return self
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """
+        Returns
+        -------
+        Every row as a dict
+        """
+        return list(self)
+
+    @cached_property
+    def resolvable(self) -> Array:
+        """
+        Returns
+        -------
+        The table as a script Array, converted once and shared by every sibling entry
+        """
+        return ScriptUtils.to_resolvable(self.to_list())
@@ -132,7 +132,7 @@ class AudioExtractPlugin(Plugin[AudioExtractOptions]):
                     entry.get_download_file_path().removesuffix(entry.ext) + possible_ext
                 )
 
-                if os.path.isfile(extracted_audio_file):
+                if entry.working_file_exists(ext=possible_ext):
                     new_ext = possible_ext
                     break
         else:
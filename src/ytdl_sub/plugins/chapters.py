@@ -13,7 +13,7 @@ from ytdl_sub.entries.entry import (
 )
 from ytdl_sub.entries.script.variable_definitions import VARIABLES, VariableDefinitions
 from ytdl_sub.utils.chapters import Chapters
-from ytdl_sub.utils.ffmpeg import set_ffmpeg_metadata_chapters
+from ytdl_sub.utils.ffmpeg import set_ffmpeg_metadata_chapters, write_ffmpeg_metadata_chapters_file
 from ytdl_sub.utils.file_handler import FileMetadata
 from ytdl_sub.validators.regex_validator import RegexListValidator
 from ytdl_sub.validators.string_select_validator import StringSelectValidator
@@ -302,6 +302,23 @@ class ChaptersPlugin(Plugin[ChaptersOptions]):
             )
         )
 
+    def _embed_chapters(self, entry: Entry, chapters: Chapters) -> None:
+        # Split entries need the chapters in the file before it gets split. Otherwise, embed
+        # them alongside the other ffmpeg operations in a single remux
+        if self._is_entry_split:
+            set_ffmpeg_metadata_chapters(
+                file_path=entry.get_download_file_path(),
+                chapters=chapters,
+                file_duration_sec=entry.get(v.duration, int),
+            )
+        else:
+            entry.ffmpeg_remux_plan().set_chapters(
+                write_ffmpeg_metadata_chapters_file(
+                    chapters=chapters, file_duration_sec=entry.get(v.duration, int)
+                ),
+                is_temporary=True,
+            )
+
     def modify_entry(self, entry: Entry) -> Entry:
         """
         Parameters
@@ -331,11 +348,7 @@ class ChaptersPlugin(Plugin[ChaptersOptions]):
                 entry.add({ytdl_sub_chapters_from_comments: chapters.to_yt_dlp_chapter_metadata()})
 
                 if not self.is_dry_run:
-                    set_ffmpeg_metadata_chapters(
-                        file_path=entry.get_download_file_path(),
-                        chapters=chapters,
-                        file_duration_sec=entry.get(v.duration, int),
-                    )
+                    self._embed_chapters(entry=entry, chapters=chapters)
 
         if not has_chapters_from_comments:
             entry.add({ytdl_sub_chapters_from_comments: []})
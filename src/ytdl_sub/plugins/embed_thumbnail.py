@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Optional
 
 import mediafile
 
@@ -35,31 +35,15 @@ class EmbedThumbnailPlugin(Plugin[EmbedThumbnailOptions]):
 
     @classmethod
     def _embed_video_thumbnail(cls, entry: Entry) -> None:
-        file_path = entry.get_download_file_path()
+        # Embedded alongside other ffmpeg operations once all plugins have post-processed the
+        # entry. Snapshot the thumbnail so later plugins modifying it do not change what's embedded
         thumbnail_path = entry.get_download_thumbnail_path()
-        tmp_file_path = FFMPEG.tmp_file_path(file_path)
-        try:
-            ffmpeg_args: List[str] = [
-                "-i",
-                file_path,
-                "-i",
-                thumbnail_path,
-                "-map",
-                "1",
-                "-map",
-                "0",
-                "-dn",  # ignore data streams
-                "-c",
-                "copy",
-                "-bitexact",  # for reproducibility
-                "-disposition:0",
-                "attached_pic",
-                tmp_file_path,
-            ]
-            FFMPEG.run(ffmpeg_args)
-            FileHandler.move(tmp_file_path, file_path)
-        finally:
-            FileHandler.delete(tmp_file_path)
+        embed_thumbnail_path = FFMPEG.tmp_file_path(
+            relative_file_path=entry.get_download_file_path(),
+            extension=thumbnail_path.split(".")[-1],
+        )
+        FileHandler.copy(src_file_path=thumbnail_path, dst_file_path=embed_thumbnail_path)
+        entry.ffmpeg_remux_plan().set_attached_pic(embed_thumbnail_path, is_temporary=True)
 
     @classmethod
     def _embed_audio_file(cls, entry: Entry) -> None:
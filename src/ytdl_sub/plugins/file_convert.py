@@ -190,6 +190,8 @@ class FileConvertPlugin(Plugin[FileConvertOptions]):
             if not os.path.isfile(input_video_file_path):
                 raise FileNotDownloadedException("Failed to find the input file")
 
+            # Ran on its own instead of in the entry's ffmpeg remux plan, since user args can
+            # re-encode streams, which the plan's ``-codec copy`` would override
             if self.plugin_options.ffmpeg_post_process_args:
                 tmp_output_file = converted_video_file_path.removesuffix(new_ext) + f"tmp.{new_ext}"
                 ffmpeg_args_list = self.overrides.apply_formatter(
@@ -165,6 +165,7 @@ class SharedNfoTagsPlugin(Plugin[SharedNfoTagsOptions], ABC):
         os.makedirs(os.path.dirname(nfo_file_path), exist_ok=True)
         with open(nfo_file_path, "wb") as nfo_file:
             nfo_file.write(xml)
+        FileHandler.mark_files_changed(os.path.dirname(nfo_file_path))
 
         # Save the nfo file and log its metadata
         nfo_metadata = FileMetadata.from_dict(
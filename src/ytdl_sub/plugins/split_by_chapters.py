@@ -1,3 +1,5 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ytdl_sub.config.plugin.plugin import SplitPlugin
@@ -9,7 +11,9 @@ from ytdl_sub.utils.chapters import Chapters, Timestamp
 from ytdl_sub.utils.exceptions import ValidationException
 from ytdl_sub.utils.ffmpeg import FFMPEG
 from ytdl_sub.utils.file_handler import FileHandler, FileMetadata
+from ytdl_sub.utils.logger import Logger
 from ytdl_sub.validators.string_select_validator import StringSelectValidator
+from ytdl_sub.validators.validators import IntValidator
 
 v: VariableDefinitions = VARIABLES
 
@@ -55,9 +59,11 @@ class SplitByChaptersOptions(OptionsDictValidator):
 
        split_by_chapters:
          when_no_chapters: "pass"
+         max_concurrent_splits: 4
     """
 
     _required_keys = {"when_no_chapters"}
+    _optional_keys = {"max_concurrent_splits"}
 
     @classmethod
     def partial_validate(cls, name: str, value: Any) -> None:
@@ -70,6 +76,12 @@ class SplitByChaptersOptions(OptionsDictValidator):
         self._when_no_chapters = self._validate_key(
             key="when_no_chapters", validator=WhenNoChaptersValidator
         ).value
+        self._max_concurrent_splits = self._validate_key_if_present(
+            key="max_concurrent_splits", validator=IntValidator, default=4
+        ).value
+
+        if self._max_concurrent_splits < 1:
+            raise self._validation_exception("max_concurrent_splits must be at least 1")
 
     def added_variables(
         self,
@@ -100,6 +112,17 @@ class SplitByChaptersOptions(OptionsDictValidator):
         """
         return self._when_no_chapters
 
+    @property
+    def max_concurrent_splits(self) -> int:
+        """
+        :expected type: Integer
+        :description:
+          Defaults to 4. Maximum number of chapters to split into their own files at the same
+          time. Each chapter is split by its own ffmpeg process, set to 1 to split them one at
+          a time.
+        """
+        return self._max_concurrent_splits
+
     def modified_variables(self) -> Dict[PluginOperation, Set[str]]:
         return {
             PluginOperation.MODIFY_ENTRY: {
@@ -183,30 +206,17 @@ class SplitByChaptersPlugin(SplitPlugin[SplitByChaptersOptions]):
                 f"Tried to split '{entry.title}' by chapters but it has no chapters"
             )
 
-        for idx, title in enumerate(chapters.titles):
-            new_entry = Entry.create_split_entry(
+        new_entries = [
+            Entry.create_split_entry(
                 entry=entry, new_uid=_split_video_uid(source_uid=entry.uid, idx=idx)
             )
+            for idx in range(len(chapters.titles))
+        ]
 
-            if not self.is_dry_run:
-                # Run ffmpeg to create the split the video
-                FFMPEG.run(
-                    _split_video_ffmpeg_cmd(
-                        input_file=entry.get_download_file_path(),
-                        output_file=new_entry.get_download_file_path(),
-                        timestamps=chapters.timestamps,
-                        idx=idx,
-                    )
-                )
-
-                # Copy the original vid thumbnail to the working directory with the new uid. This so
-                # downstream logic thinks this split video has its own thumbnail
-                if entry.is_thumbnail_downloaded():
-                    FileHandler.copy(
-                        src_file_path=entry.get_download_thumbnail_path(),
-                        dst_file_path=new_entry.get_download_thumbnail_path(),
-                    )
+        if not self.is_dry_run:
+            self._split_files(entry=entry, new_entries=new_entries, chapters=chapters)
 
+        for idx, (new_entry, title) in enumerate(zip(new_entries, chapters.titles)):
             # Format the split video
             split_videos_and_metadata.append(
                 self._create_split_entry(
@@ -218,3 +228,54 @@ class SplitByChaptersPlugin(SplitPlugin[SplitByChaptersOptions]):
             )
 
         return split_videos_and_metadata
+
+    def _split_files(self, entry: Entry, new_entries: List[Entry], chapters: Chapters) -> None:
+        """
+        Runs ffmpeg to create each split video. Each chapter is cut independently from the same
+        input file, so up to max_concurrent_splits ffmpeg processes run at once.
+        """
+        # Resolve file paths up-front, entry scripts are not thread-safe
+        input_file = entry.get_download_file_path()
+        thumbnail_file = (
+            entry.get_download_thumbnail_path() if entry.is_thumbnail_downloaded() else None
+        )
+        split_file_paths: List[Tuple[str, Optional[str]]] = [
+            (
+                new_entry.get_download_file_path(),
+                new_entry.get_download_thumbnail_path() if thumbnail_file else None,
+            )
+            for new_entry in new_entries
+        ]
+
+        def _split_file(idx: int) -> None:
+            output_file, output_thumbnail_file = split_file_paths[idx]
+
+            # Run ffmpeg to create the split the video
+            FFMPEG.run(
+                _split_video_ffmpeg_cmd(
+                    input_file=input_file,
+                    output_file=output_file,
+                    timestamps=chapters.timestamps,
+                    idx=idx,
+                )
+            )
+
+            # Copy the original vid thumbnail to the working directory with the new uid. This so
+            # downstream logic thinks this split video has its own thumbnail
+            if thumbnail_file and output_thumbnail_file:
+                FileHandler.copy(src_file_path=thumbnail_file, dst_file_path=output_thumbnail_file)
+
+        max_workers = min(len(new_entries), self.plugin_options.max_concurrent_splits)
+        if max_workers <= 1:
+            for idx in range(len(new_entries)):
+                _split_file(idx)
+            return
+
+        split_file = Logger.with_current_debug_log(_split_file)
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"{threading.current_thread().name}-split",
+        ) as executor:
+            # Consume results in chapter order so the first failed chapter's error is raised
+            for _ in executor.map(split_file, range(len(new_entries))):
+                pass
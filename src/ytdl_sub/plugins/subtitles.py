@@ -1,4 +1,3 @@
-import os
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -224,10 +223,9 @@ class SubtitlesPlugin(Plugin[SubtitleOptions]):
             download_subtitle_lang_file_names: List[Tuple[str, str]] = []
 
             for lang in langs:
-                download_subtitle_file_name = entry.base_filename(
-                    ext=f"{lang}.{self.plugin_options.subtitles_type}"
-                )
-                if os.path.isfile(Path(self.working_directory) / download_subtitle_file_name):
+                subtitle_ext = f"{lang}.{self.plugin_options.subtitles_type}"
+                download_subtitle_file_name = entry.base_filename(ext=subtitle_ext)
+                if entry.working_file_exists(ext=subtitle_ext):
                     download_subtitle_lang_file_names.append((lang, download_subtitle_file_name))
                 elif lang in self.plugin_options.languages_required:
                     raise UserThrownRuntimeError(
@@ -252,8 +250,8 @@ class SubtitlesPlugin(Plugin[SubtitleOptions]):
         # Can happen for both file and embedded subs
         for lang in langs:
             for possible_ext in SUBTITLE_EXTENSIONS:
-                possible_subs_filename = entry.base_filename(ext=f"{lang}.{possible_ext}")
-                possible_subs_file = Path(self.working_directory) / possible_subs_filename
-                FileHandler.delete(possible_subs_file)
+                if entry.working_file_exists(ext=f"{lang}.{possible_ext}"):
+                    possible_subs_filename = entry.base_filename(ext=f"{lang}.{possible_ext}")
+                    FileHandler.delete(Path(self.working_directory) / possible_subs_filename)
 
         return file_metadata
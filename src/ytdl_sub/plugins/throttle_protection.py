@@ -323,7 +323,7 @@ class ThrottleProtectionPlugin(Plugin[ThrottleProtectionOptions]):
 
         return entry
 
-    def post_process_entry(self, entry: Entry) -> Optional[FileMetadata]:
+    def _count_download(self) -> None:
         if (
             self._subscription_max_downloads is not None
             and self._subscription_download_counter == 0
@@ -335,19 +335,36 @@ class ThrottleProtectionPlugin(Plugin[ThrottleProtectionOptions]):
         # Increment the counter
         self._subscription_download_counter += 1
 
+    def _get_sleep_time(self, entry: Entry) -> Optional[float]:
         if self.plugin_options.sleep_per_download_s:
-            self._entry_sleep_time = self.plugin_options.sleep_per_download_s.randomized_float(
+            return self.plugin_options.sleep_per_download_s.randomized_float(
                 overrides=self.overrides, entry=entry
             )
-
         return None
 
-    def post_completion_entry(self, file_metadata: FileMetadata) -> None:
-        if self._entry_sleep_time:
+    def _sleep_between_downloads(self, sleep_time: Optional[float]) -> None:
+        if sleep_time:
             # pylint: disable=logging-fstring-interpolation)
             # needed to test logs in unit test
-            logger.info(f"Sleeping between downloads for {self._entry_sleep_time:.2f} seconds")
-            self.perform_sleep(self._entry_sleep_time)
+            logger.info(f"Sleeping between downloads for {sleep_time:.2f} seconds")
+            self.perform_sleep(sleep_time)
+
+    def post_download_entry(self, entry: Entry) -> None:
+        # Post-processing runs alongside the next download, so count and sleep on the download
+        # stage instead
+        self._count_download()
+        self._sleep_between_downloads(self._get_sleep_time(entry))
+
+    def post_process_entry(self, entry: Entry) -> Optional[FileMetadata]:
+        if not self._is_download_pipelined:
+            self._count_download()
+            self._entry_sleep_time = self._get_sleep_time(entry)
+
+        return None
+
+    def post_completion_entry(self, file_metadata: FileMetadata) -> None:
+        if not self._is_download_pipelined:
+            self._sleep_between_downloads(self._entry_sleep_time)
 
     def post_process_subscription(self):
         # Reset counter to 0 for the next subscription
@@ -3,7 +3,6 @@ from typing import Dict
 from ytdl_sub.config.plugin.plugin import Plugin
 from ytdl_sub.config.validators.options import OptionsValidator
 from ytdl_sub.entries.entry import Entry
-from ytdl_sub.utils.ffmpeg import add_ffmpeg_metadata_key_values
 from ytdl_sub.utils.file_handler import FileMetadata
 from ytdl_sub.utils.logger import Logger
 from ytdl_sub.validators.string_formatter_validators import DictFormatterValidator
@@ -38,12 +37,10 @@ class VideoTagsPlugin(Plugin[VideoTagsOptions]):
             tag_value = self.overrides.apply_formatter(formatter=tag_formatter, entry=entry)
             tags_to_write[tag_name] = tag_value
 
-        # write the actual tags if its not a dry run
+        # write the actual tags if its not a dry run. They are written alongside other ffmpeg
+        # operations once all plugins have post-processed the entry
         if not self.is_dry_run:
-            add_ffmpeg_metadata_key_values(
-                file_path=entry.get_download_file_path(),
-                key_values=tags_to_write,
-            )
+            entry.ffmpeg_remux_plan().add_metadata(tags_to_write)
 
         # report the tags written
         return FileMetadata.from_dict(value_dict=tags_to_write, title="Video Tags")
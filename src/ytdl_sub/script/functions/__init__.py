@@ -39,6 +39,19 @@ class Functions(
         """
         return hasattr(cls, name) or hasattr(cls, f"{name}_") or name in cls._custom_functions
 
+    @classmethod
+    def has_side_effects(cls, name: str) -> bool:
+        """
+        Returns
+        -------
+        True if the function does more than return a value, i.e. throws or prints.
+        False otherwise.
+        """
+        return any(
+            name in vars(function_class) or f"{name}_" in vars(function_class)
+            for function_class in (ErrorFunctions, PrintFunctions)
+        )
+
     @classmethod
     def get(cls, name: str) -> Callable[..., Resolvable]:
         """
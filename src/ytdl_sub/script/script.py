@@ -1,6 +1,6 @@
-# pylint: disable=missing-raises-doc
-from collections import defaultdict
-from typing import Dict, List, Optional, Set
+# pylint: disable=missing-raises-doc,too-many-lines
+from collections import ChainMap, defaultdict
+from typing import Dict, FrozenSet, Iterable, List, MutableMapping, Optional, Set
 
 from ytdl_sub.script.functions import Functions
 from ytdl_sub.script.parser import parse
@@ -12,10 +12,12 @@ from ytdl_sub.script.types.variable_dependency import VariableDependency
 from ytdl_sub.script.utils.exceptions import (
     UNREACHABLE,
     CycleDetected,
+    FunctionDoesNotExist,
     IncompatibleFunctionArguments,
     InvalidCustomFunctionArguments,
     RuntimeException,
     ScriptVariableNotResolved,
+    VariableDoesNotExist,
 )
 from ytdl_sub.script.utils.name_validation import (
     is_function,
@@ -23,8 +25,30 @@ from ytdl_sub.script.utils.name_validation import (
     to_function_name,
     validate_variable_name,
 )
+from ytdl_sub.script.utils.resolution_order import ResolutionOrder
 from ytdl_sub.script.utils.type_checking import FunctionSpec
 
+# Max number of shared layers a forked Script can reference before they are flattened into one
+_MAX_SHARED_LAYERS = 4
+
+
+def _share_layers(definitions: MutableMapping[str, SyntaxTree]) -> List[Dict[str, SyntaxTree]]:
+    """
+    Returns the layers of definitions that can be shared with a fork. Once shared, a layer must
+    never be written to again.
+    """
+    if isinstance(definitions, ChainMap):
+        local, shared = definitions.maps[0], definitions.maps[1:]
+    else:
+        local, shared = definitions, []
+
+    if local:
+        shared = [local] + shared
+    if len(shared) > _MAX_SHARED_LAYERS:
+        shared = [dict(ChainMap(*shared))]
+
+    return shared
+
 
 class Script:
     """
@@ -230,7 +254,7 @@ class Script:
         variables = self._variables
         if added_variables is not None:
             variables = {
-                name: ast for name, ast in self._variables.items() if name in added_variables
+                name: self._variables[name] for name in added_variables if name in self._variables
             }
 
         if added_variables is None:
@@ -245,12 +269,15 @@ class Script:
 
         for prefix, definitions in to_validate:
             for name, definition in definitions.items():
-                self._ensure_custom_function_usage_num_input_arguments_valid(
-                    prefix=prefix, name=name, definition=definition
-                )
-                self._ensure_lambda_usage_num_input_arguments_valid(
-                    prefix=prefix, name=name, definition=definition
-                )
+                self._validate_function_usage(prefix=prefix, name=name, definition=definition)
+
+    def _validate_function_usage(self, prefix: str, name: str, definition: SyntaxTree) -> None:
+        self._ensure_custom_function_usage_num_input_arguments_valid(
+            prefix=prefix, name=name, definition=definition
+        )
+        self._ensure_lambda_usage_num_input_arguments_valid(
+            prefix=prefix, name=name, definition=definition
+        )
 
     def __init__(self, script: Dict[str, str]):
         function_names: Set[str] = {
@@ -260,7 +287,7 @@ class Script:
             validate_variable_name(name) for name in script.keys() if not is_function(name)
         }
 
-        self._functions: Dict[str, SyntaxTree] = {
+        self._functions: MutableMapping[str, SyntaxTree] = {
             # custom_function_name must be passed to properly type custom function
             # arguments uniquely if they're nested (i.e. $0 to $custom_func___0)
             to_function_name(function_key): parse(
@@ -273,7 +300,7 @@ class Script:
             if is_function(function_key)
         }
 
-        self._variables: Dict[str, SyntaxTree] = {
+        self._variables: MutableMapping[str, SyntaxTree] = {
             variable_key: parse(
                 text=variable_value,
                 name=variable_key,
@@ -283,14 +310,144 @@ class Script:
             for variable_key, variable_value in script.items()
             if not is_function(variable_key)
         }
+        self._resolution_order: Optional[ResolutionOrder] = None
         self._validate()
 
+    def fork(self) -> "Script":
+        """
+        Creates a copy of the Script that shares all current variable and function definitions
+        with this one. Definitions are immutable, so only variables that get added or resolved
+        afterwards are stored separately within each Script.
+
+        Returns
+        -------
+        Script
+            The forked script
+        """
+        variable_layers = _share_layers(self._variables)
+        function_layers = _share_layers(self._functions)
+
+        # This script's definitions are now shared, so it must also write to a new layer
+        self._variables = ChainMap({}, *variable_layers)
+        self._functions = ChainMap({}, *function_layers)
+
+        forked = Script.__new__(Script)
+        forked._variables = ChainMap({}, *variable_layers)  # pylint: disable=protected-access
+        forked._functions = ChainMap({}, *function_layers)  # pylint: disable=protected-access
+        # Sort once here so every fork can share it
+        forked._resolution_order = self._get_resolution_order()  # pylint: disable=protected-access
+        return forked
+
+    def __deepcopy__(self, memo) -> "Script":
+        return self.fork()
+
     def _update_internally(self, resolved_variables: Dict[str, Resolvable]) -> None:
         for variable_name, resolved in resolved_variables.items():
-            self._variables[variable_name] = ResolvedSyntaxTree(ast=[resolved])
+            # Avoid rewriting definitions that are already resolved to this value
+            if self._variables[variable_name].maybe_resolvable is not resolved:
+                self._variables[variable_name] = ResolvedSyntaxTree(ast=[resolved])
+
+    def _custom_function_closure(self, definition: SyntaxTree) -> List[SyntaxTree]:
+        """
+        Returns
+        -------
+        Definitions of all custom functions the definition uses, including ones used within
+        other custom functions.
+        """
+        visited: Set[str] = set()
+        closure: List[SyntaxTree] = []
+
+        to_visit = [definition]
+        while to_visit:
+            for custom_function in to_visit.pop().custom_function_dependencies(self._functions):
+                if custom_function.name not in visited:
+                    visited.add(custom_function.name)
+                    closure.append(self._functions[custom_function.name])
+                    to_visit.append(closure[-1])
+
+        return closure
+
+    def variable_dependencies(self, definition: SyntaxTree) -> FrozenSet[str]:
+        """
+        Returns
+        -------
+        Names of all variables the definition depends on, including ones used within
+        custom functions.
+        """
+        if definition.maybe_resolvable is not None:
+            return frozenset()
+
+        return frozenset(
+            var.name
+            for tree in [definition, *self._custom_function_closure(definition)]
+            for var in tree.variables
+        )
+
+    def _has_side_effects(self, definition: SyntaxTree) -> bool:
+        """
+        Returns
+        -------
+        True if the definition uses functions that throw or print, including within
+        custom functions. False otherwise.
+        """
+        if definition.maybe_resolvable is not None:
+            return False
+
+        for tree in [definition, *self._custom_function_closure(definition)]:
+            if any(Functions.has_side_effects(func.name) for func in tree.built_in_functions):
+                return True
+            if any(Functions.has_side_effects(lambda_func.value) for lambda_func in tree.lambdas):
+                return True
+        return False
+
+    def _get_resolution_order(self) -> ResolutionOrder:
+        if self._resolution_order is None:
+            self._resolution_order = ResolutionOrder.from_dependencies(
+                dependencies={
+                    name: self.variable_dependencies(definition)
+                    for name, definition in self._variables.items()
+                },
+                side_effects={
+                    name
+                    for name, definition in self._variables.items()
+                    if self._has_side_effects(definition)
+                },
+            )
+        return self._resolution_order
+
+    def _update_resolution_order(self, added_variable_names: Iterable[str]) -> None:
+        """
+        Keeps the resolution order up to date with newly added variables, only re-sorting
+        if they cannot be placed into the existing order.
+        """
+        if self._resolution_order is None:
+            return
+
+        added = {
+            name: self.variable_dependencies(self._variables[name]) for name in added_variable_names
+        }
+        # Resolved definitions have no dependencies, so their existing position remains valid
+        if all(
+            not deps
+            and name in self._resolution_order.positions
+            and name not in self._resolution_order.side_effects
+            for name, deps in added.items()
+        ):
+            return
+
+        self._resolution_order = self._resolution_order.with_variables(
+            variables=added,
+            side_effects={name for name in added if self._has_side_effects(self._variables[name])},
+            existing_names=self._variables,
+        )
 
     def _recursive_get_unresolved_output_filter_variables(
-        self, current_var: SyntaxTree, subset_to_resolve: Set[str], unresolvable: Set[Variable]
+        self,
+        current_var: SyntaxTree,
+        subset_to_resolve: Set[str],
+        unresolvable: Set[Variable],
+        pre_resolved: Set[str],
+        visited_functions: Set[str],
     ) -> Set[str]:
         for var_dep in current_var.variables:
             if var_dep in unresolvable:
@@ -299,56 +456,74 @@ class Script:
                     f"which is set as unresolvable"
                 )
 
-            # Do not recurse custom function arguments since they have no deps
-            if isinstance(var_dep, FunctionArgument):
+            # Do not recurse custom function arguments since they have no deps. Pre-resolved
+            # variables and ones already visited do not need to be recursed either
+            if (
+                isinstance(var_dep, FunctionArgument)
+                or var_dep.name in pre_resolved
+                or var_dep.name in subset_to_resolve
+            ):
                 continue
 
             subset_to_resolve.add(var_dep.name)
-            subset_to_resolve |= self._recursive_get_unresolved_output_filter_variables(
+            self._recursive_get_unresolved_output_filter_variables(
                 current_var=self._variables[var_dep.name],
                 subset_to_resolve=subset_to_resolve,
                 unresolvable=unresolvable,
+                pre_resolved=pre_resolved,
+                visited_functions=visited_functions,
             )
-        for custom_func_dep in current_var.custom_functions:
-            subset_to_resolve |= self._recursive_get_unresolved_output_filter_variables(
-                current_var=self._functions[custom_func_dep.name],
+
+        custom_function_names = [custom_func.name for custom_func in current_var.custom_functions]
+        custom_function_names.extend(
+            lambda_func.value
+            for lambda_func in current_var.lambdas
+            if lambda_func.value in self._functions
+        )
+        for custom_function_name in custom_function_names:
+            if custom_function_name in visited_functions:
+                continue
+
+            visited_functions.add(custom_function_name)
+            self._recursive_get_unresolved_output_filter_variables(
+                current_var=self._functions[custom_function_name],
                 subset_to_resolve=subset_to_resolve,
                 unresolvable=unresolvable,
+                pre_resolved=pre_resolved,
+                visited_functions=visited_functions,
             )
 
-        for lambda_func in current_var.lambdas:
-            if lambda_func.value in self._functions:
-                subset_to_resolve |= self._recursive_get_unresolved_output_filter_variables(
-                    current_var=self._functions[lambda_func.value],
-                    subset_to_resolve=subset_to_resolve,
-                    unresolvable=unresolvable,
-                )
-
         return subset_to_resolve
 
     def _get_unresolved_output_filter(
         self,
         output_filter: Set[str],
         unresolvable: Set[Variable],
+        pre_resolved: Set[str],
     ) -> Set[str]:
         """
         When an output filter is applied, only a subset of variables that the filter
-        depends on need to be resolved.
+        depends on need to be resolved. Pre-resolved variables are not re-resolved.
         """
         subset_to_resolve: Set[str] = set()
+        visited_functions: Set[str] = set()
 
         for output_filter_variable in output_filter:
-            subset_to_resolve.add(output_filter_variable)
-
             if output_filter_variable not in self._variables:
                 raise ScriptVariableNotResolved(
                     "Tried to specify an output filter variable that does not exist"
                 )
 
-            subset_to_resolve |= self._recursive_get_unresolved_output_filter_variables(
+            if output_filter_variable in pre_resolved:
+                continue
+
+            subset_to_resolve.add(output_filter_variable)
+            self._recursive_get_unresolved_output_filter_variables(
                 current_var=self._variables[output_filter_variable],
                 subset_to_resolve=subset_to_resolve,
                 unresolvable=unresolvable,
+                pre_resolved=pre_resolved,
+                visited_functions=visited_functions,
             )
 
         return subset_to_resolve
@@ -359,6 +534,7 @@ class Script:
         unresolvable: Optional[Set[str]] = None,
         update: bool = False,
         output_filter: Optional[Set[str]] = None,
+        include_dependencies: bool = False,
     ) -> ScriptOutput:
         """
         Parameters
@@ -371,6 +547,11 @@ class Script:
         update
             Optional. Whether to update the internal representation of variables with their
             resolved value (if they get resolved).
+        output_filter
+            Optional. Only resolve these variables and the variables they depend on.
+        include_dependencies
+            Optional. When using an output filter, also output the pre-resolved variables and
+            the dependencies that were resolved along the way.
 
         Returns
         -------
@@ -385,56 +566,51 @@ class Script:
             Variable(name): value for name, value in (pre_resolved or {}).items()
         }
 
-        unresolvable: Set[Variable] = {Variable(name) for name in (unresolvable or {})}
-        unresolved_filter = set(resolved.keys()).union(unresolvable)
+        unresolvable: Set[str] = set(unresolvable or {})
 
         if output_filter:
-            unresolved = {
-                Variable(name): self._variables[name]
-                for name in self._get_unresolved_output_filter(
+            to_resolve = (
+                self._get_unresolved_output_filter(
                     output_filter=output_filter,
-                    unresolvable=unresolvable,
+                    unresolvable={Variable(name) for name in unresolvable},
+                    pre_resolved=(pre_resolved or {}).keys(),
                 )
-            }
+                - unresolvable
+            )
         else:
-            unresolved = {
-                Variable(name): ast
-                for name, ast in self._variables.items()
-                if Variable(name) not in unresolved_filter
-            }
-
-        while unresolved:
-            unresolved_count: int = len(unresolved)
-
-            for variable in list(unresolved.keys()):
-                definition = unresolved[variable]
-
-                # If the definition is already a resolvable, mark it as such
-                if resolvable := definition.maybe_resolvable:
-                    resolved[variable] = resolvable
-                    del unresolved[variable]
-
-                # If the variable's variable dependencies contain an unresolvable variable,
-                # declare it as unresolvable and continue
-                elif definition.contains(unresolvable, custom_function_definitions=self._functions):
-                    unresolvable.add(variable)
-                    del unresolved[variable]
-
-                # Otherwise, if it has dependencies that are all resolved, then
-                # resolve the definition
-                elif definition.is_subset_of(
-                    variables=resolved, custom_function_definitions=self._functions
-                ):
-                    resolved[variable] = unresolved[variable].resolve(
-                        resolved_variables=resolved,
-                        custom_functions=self._functions,
-                    )
-                    del unresolved[variable]
-
-            if len(unresolved) == unresolved_count:
-                # Implies a cycle within the variables. Should never reach
-                # since cycles are detected in __init__
-                raise UNREACHABLE
+            to_resolve = self._variables.keys() - unresolvable - (pre_resolved or {}).keys()
+
+        resolution_order = self._get_resolution_order()
+        if not resolution_order.positions.keys() >= to_resolve:
+            # Should always be kept up to date when adding variables, but re-sort if not
+            self._resolution_order = None
+            resolution_order = self._get_resolution_order()
+
+        # Every variable comes after its dependencies, so each one only needs to be visited once
+        names_to_resolve: Iterable[str] = (
+            sorted(to_resolve, key=resolution_order.positions.__getitem__)
+            if output_filter
+            else (name for name in resolution_order.order if name in to_resolve)
+        )
+        for name in names_to_resolve:
+            variable = Variable(name)
+            definition = self._variables[name]
+
+            # If the definition is already a resolvable, mark it as such
+            if (resolvable := definition.maybe_resolvable) is not None:
+                resolved[variable] = resolvable
+
+            # If the variable's variable dependencies contain an unresolvable variable,
+            # declare it as unresolvable
+            elif not resolution_order.dependencies[name].isdisjoint(unresolvable):
+                unresolvable.add(name)
+
+            # Otherwise, all of its dependencies have been resolved, so resolve the definition
+            else:
+                resolved[variable] = definition.resolve(
+                    resolved_variables=resolved,
+                    custom_functions=self._functions,
+                )
 
         resolved_variables = {
             variable.name: resolvable for variable, resolvable in resolved.items()
@@ -447,6 +623,9 @@ class Script:
                 if name not in resolved_variables:
                     raise ScriptVariableNotResolved(f"Specified {name} to resolve, but it did not")
 
+            if include_dependencies:
+                return ScriptOutput(resolved_variables)
+
             return ScriptOutput(
                 {
                     name: resolvable
@@ -486,6 +665,99 @@ class Script:
             pre_resolved=resolved, unresolvable=unresolvable, update=update, output_filter=None
         )
 
+    def resolve_subset(
+        self,
+        variable_names: Set[str],
+        resolved: Optional[Dict[str, Resolvable]] = None,
+        unresolvable: Optional[Set[str]] = None,
+    ) -> ScriptOutput:
+        """
+        Resolves only the given variables and the variables they depend on.
+
+        Parameters
+        ----------
+        variable_names
+            Names of the variables to resolve.
+        resolved
+            Optional. Pre-resolved variables that should be used instead of what is in the script.
+            Their dependencies are not resolved again.
+        unresolvable
+            Optional. Unresolvable variables that will be ignored in resolution, including all
+            variables with a dependency to them.
+
+        Returns
+        -------
+        ScriptOutput
+            Containing the given variables, the pre-resolved variables, and all dependencies
+            that were resolved along the way.
+
+        Raises
+        ------
+        ScriptVariableNotResolved
+            If any of the given variables do not resolve.
+        """
+        return self._resolve(
+            pre_resolved=resolved,
+            unresolvable=unresolvable,
+            output_filter=variable_names,
+            include_dependencies=True,
+        )
+
+    @property
+    def side_effect_variables(self) -> List[str]:
+        """
+        Returns
+        -------
+        List[str]
+            Names of the variables that throw or print when resolved, in the order they
+            would resolve.
+        """
+        return self.in_resolution_order(self._get_resolution_order().side_effects)
+
+    def in_resolution_order(self, variable_names: Iterable[str]) -> List[str]:
+        """
+        Parameters
+        ----------
+        variable_names
+            Names of variables to order. Ones that do not exist in the script are dropped.
+
+        Returns
+        -------
+        List[str]
+            The variable names in the order they would resolve.
+        """
+        names = [name for name in variable_names if name in self._variables]
+        resolution_order = self._get_resolution_order()
+        if not resolution_order.positions.keys() >= set(names):
+            self._resolution_order = None
+            resolution_order = self._get_resolution_order()
+
+        return sorted(names, key=resolution_order.positions.__getitem__)
+
+    def dependents_of(self, variable_names: Iterable[str]) -> Set[str]:
+        """
+        Parameters
+        ----------
+        variable_names
+            Names of the variables to get dependents of.
+
+        Returns
+        -------
+        Set[str]
+            Names of all variables that directly or indirectly depend on the given variables.
+        """
+        direct_dependents = self._get_resolution_order().dependents
+        dependents: Set[str] = set()
+
+        to_visit = list(variable_names)
+        while to_visit:
+            for dependent in direct_dependents.get(to_visit.pop(), frozenset()):
+                if dependent not in dependents:
+                    dependents.add(dependent)
+                    to_visit.append(dependent)
+
+        return dependents
+
     def add(self, variables: Dict[str, str], unresolvable: Optional[Set[str]] = None) -> "Script":
         """
         Adds parses and adds new variables to the script.
@@ -536,11 +808,23 @@ class Script:
                 else:
                     self._variables[name] = parsed
 
+        self._on_definitions_added(
+            function_names=functions_to_add.keys(), variable_names=variables_to_add.keys()
+        )
         if added_variables_to_validate:
             self._validate(added_variables=added_variables_to_validate)
 
         return self
 
+    def _on_definitions_added(
+        self, function_names: Iterable[str], variable_names: Iterable[str]
+    ) -> None:
+        # Custom functions can change the dependencies of any variable, so re-sort everything
+        if function_names:
+            self._resolution_order = None
+        else:
+            self._update_resolution_order(added_variable_names=variable_names)
+
     def add_parsed(self, variables: Dict[str, SyntaxTree]) -> "Script":
         """
         Adds already parsed, new variables to the script.
@@ -576,6 +860,9 @@ class Script:
                 else:
                     self._variables[name] = parsed
 
+        self._on_definitions_added(
+            function_names=functions_to_add.keys(), variable_names=variables_to_add.keys()
+        )
         if added_variables_to_validate:
             self._validate(added_variables=added_variables_to_validate)
 
@@ -661,6 +948,64 @@ class Script:
             for name in variable_definitions.keys():
                 self._variables.pop(name, None)
 
+    def validate_parsed(self, name: str, definition: SyntaxTree) -> None:
+        """
+        Validates a parsed definition against the Script without adding it, so it can be
+        resolved repeatedly using ``resolve_parsed``.
+
+        Parameters
+        ----------
+        name
+            Name of the definition to use in error messages.
+        definition
+            Parsed definition to validate.
+
+        Raises
+        ------
+        UserException
+            If the definition uses variables or custom functions incorrectly.
+        """
+        for var in definition.variables:
+            if var.name not in self._variables:
+                raise VariableDoesNotExist(f"Variable {var.name} does not exist.")
+
+        for custom_function in definition.custom_functions:
+            if custom_function.name not in self._functions:
+                raise FunctionDoesNotExist(
+                    f"Function %{custom_function.name} does not exist as a built-in or "
+                    "custom function."
+                )
+
+        self._validate_function_usage(prefix="Variable ", name=name, definition=definition)
+
+    def resolve_parsed(self, definition: SyntaxTree, resolved: Dict[str, Resolvable]) -> Resolvable:
+        """
+        Resolves a parsed definition without adding it to the Script. It is not validated,
+        see ``validate_parsed``.
+
+        Parameters
+        ----------
+        definition
+            Parsed definition to resolve.
+        resolved
+            Resolved variables, which must include all of the definition's
+            ``variable_dependencies``.
+
+        Returns
+        -------
+        Resolvable
+            The resolved definition.
+        """
+        if (resolvable := definition.maybe_resolvable) is not None:
+            return resolvable
+
+        return definition.resolve(
+            resolved_variables={
+                Variable(name): resolved[name] for name in self.variable_dependencies(definition)
+            },
+            custom_functions=self._functions,
+        )
+
     def get(self, variable_name: str) -> Resolvable:
         """
         Parameters
@@ -818,6 +1163,8 @@ class Script:
         for var_name, definition in out.items():
             self._variables[var_name] = definition
 
+        self._resolution_order = None
+
         return self
 
     def resolve_partial_once(
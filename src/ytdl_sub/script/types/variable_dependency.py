@@ -1,6 +1,7 @@
+import functools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Set, Tuple, Type, TypeVar, final
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple, final
 
 from ytdl_sub.script.types.resolvable import (
     Argument,
@@ -14,8 +15,6 @@ from ytdl_sub.script.types.resolvable import (
 from ytdl_sub.script.types.variable import FunctionArgument, Variable
 from ytdl_sub.script.utils.exceptions import UNREACHABLE
 
-TypeT = TypeVar("TypeT")
-
 
 @dataclass(frozen=True)
 class VariableDependency(ABC):
@@ -28,70 +27,82 @@ class VariableDependency(ABC):
         Any arguments in the VariableDependency that may or may not need to be resolved.
         """
 
-    def _recurse_get(
-        self, ttype: Type[TypeT], subclass: bool = False, instance: bool = True
-    ) -> List[TypeT]:
-        output: List[TypeT] = []
-        for arg in self.iterable_arguments:
-            if subclass and issubclass(type(arg), ttype):
-                output.append(arg)
-            elif instance and isinstance(arg, ttype):
-                output.append(arg)
-            elif type(arg) is ttype:  # pylint: disable=unidiomatic-typecheck
-                output.append(arg)
-
-            if isinstance(arg, VariableDependency):
-                # pylint: disable=protected-access
-                output.extend(arg._recurse_get(ttype, subclass=subclass, instance=instance))
-                # pylint: enable=protected-access
-
-        return output
+    # Dependencies are computed once per node and cached. This is safe since
+    # VariableDependencies are frozen, and each node reuses the cached output of its children.
 
     @final
-    @property
-    def variables(self) -> Set[Variable]:
+    @functools.cached_property
+    def variables(self) -> FrozenSet[Variable]:
         """
         Returns
         -------
         All Variables that this depends on.
         """
-        return set(self._recurse_get(Variable, instance=False))
+        output: Set[Variable] = set()
+        for arg in self.iterable_arguments:
+            if type(arg) is Variable:  # pylint: disable=unidiomatic-typecheck
+                output.add(arg)
+            if isinstance(arg, VariableDependency):
+                output.update(arg.variables)
+
+        return frozenset(output)
 
     @final
-    @property
-    def built_in_functions(self) -> List[BuiltInFunctionType]:
+    @functools.cached_property
+    def built_in_functions(self) -> Tuple[BuiltInFunctionType, ...]:
         """
         Returns
         -------
         All BuiltInFunctions that this depends on.
         """
-        return self._recurse_get(BuiltInFunctionType)
+        output: List[BuiltInFunctionType] = []
+        for arg in self.iterable_arguments:
+            if isinstance(arg, BuiltInFunctionType):
+                output.append(arg)
+            if isinstance(arg, VariableDependency):
+                output.extend(arg.built_in_functions)
+
+        return tuple(output)
 
     @final
-    @property
-    def function_arguments(self) -> Set[FunctionArgument]:
+    @functools.cached_property
+    def function_arguments(self) -> FrozenSet[FunctionArgument]:
         """
         Returns
         -------
         All FunctionArguments that this depends on.
         """
-        return set(self._recurse_get(FunctionArgument))
+        output: Set[FunctionArgument] = set()
+        for arg in self.iterable_arguments:
+            if isinstance(arg, FunctionArgument):
+                output.add(arg)
+            if isinstance(arg, VariableDependency):
+                output.update(arg.function_arguments)
+
+        return frozenset(output)
 
     @final
-    @property
-    def lambdas(self) -> Set[Lambda]:
+    @functools.cached_property
+    def lambdas(self) -> FrozenSet[Lambda]:
         """
         Returns
         -------
         All Lambdas that this depends on.
         """
-        return set(self._recurse_get(Lambda, subclass=True))
+        output: Set[Lambda] = set()
+        for arg in self.iterable_arguments:
+            if isinstance(arg, Lambda):
+                output.add(arg)
+            if isinstance(arg, VariableDependency):
+                output.update(arg.lambdas)
+
+        return frozenset(output)
 
     # pylint: disable=missing-raises-doc
 
     @final
-    @property
-    def custom_functions(self) -> Set[ParsedCustomFunction]:
+    @functools.cached_property
+    def custom_functions(self) -> FrozenSet[ParsedCustomFunction]:
         """
         Returns
         -------
@@ -109,7 +120,7 @@ class VariableDependency(ABC):
             if isinstance(arg, VariableDependency):
                 output.update(arg.custom_functions)
 
-        return output
+        return frozenset(output)
 
     # pylint: enable=missing-raises-doc
 
@@ -190,7 +201,7 @@ class VariableDependency(ABC):
         -------
         All custom function dependencies
         """
-        custom_functions = self.custom_functions
+        custom_functions = set(self.custom_functions)
         for lambda_func in self.lambdas:
             if lambda_func.value in custom_function_definitions:
                 custom_functions.add(
@@ -0,0 +1,93 @@
+import functools
+from dataclasses import dataclass
+from graphlib import TopologicalSorter
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+
+@dataclass(frozen=True)
+class ResolutionOrder:
+    """
+    Order of variables where each one comes after all the variables it depends on, allowing
+    a Script to resolve in a single pass. Never modified in-place so forks can share it.
+    """
+
+    order: Tuple[str, ...]
+    positions: Dict[str, int]
+    dependencies: Dict[str, FrozenSet[str]]
+    referenced: FrozenSet[str]
+    side_effects: FrozenSet[str]
+
+    @functools.cached_property
+    def dependents(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Returns
+        -------
+        Mapping of each variable name to the variables that directly depend on it
+        """
+        dependents: Dict[str, Set[str]] = {}
+        for name, deps in self.dependencies.items():
+            for dep in deps:
+                dependents.setdefault(dep, set()).add(name)
+        return {name: frozenset(names) for name, names in dependents.items()}
+
+    @classmethod
+    def from_dependencies(
+        cls, dependencies: Dict[str, FrozenSet[str]], side_effects: Set[str]
+    ) -> "ResolutionOrder":
+        """
+        Topologically sorts the variables using their dependencies
+        """
+        order = tuple(
+            name for name in TopologicalSorter(dependencies).static_order() if name in dependencies
+        )
+        return ResolutionOrder(
+            order=order,
+            positions={name: idx for idx, name in enumerate(order)},
+            dependencies=dependencies,
+            referenced=frozenset().union(*dependencies.values()),
+            side_effects=frozenset(side_effects),
+        )
+
+    def with_variables(
+        self,
+        variables: Dict[str, FrozenSet[str]],
+        side_effects: Set[str],
+        existing_names: Iterable[str],
+    ) -> Optional["ResolutionOrder"]:
+        """
+        Returns
+        -------
+        New order that includes the added or redefined variables, or None if they cannot
+        be placed without re-sorting everything.
+        """
+        order = list(self.order)
+        positions = dict(self.positions)
+        dependencies = dict(self.dependencies)
+        referenced = set(self.referenced)
+
+        for name, deps in variables.items():
+            script_deps = [dep for dep in deps if dep in existing_names]
+            if any(dep not in positions for dep in script_deps):
+                return None
+
+            if name in positions:
+                # Redefined variables must still come after their dependencies
+                if any(positions[dep] >= positions[name] for dep in script_deps):
+                    return None
+            elif name in referenced:
+                # New variables can only be appended if nothing depends on them
+                return None
+            else:
+                positions[name] = len(order)
+                order.append(name)
+
+            dependencies[name] = deps
+            referenced.update(deps)
+
+        return ResolutionOrder(
+            order=tuple(order),
+            positions=positions,
+            dependencies=dependencies,
+            referenced=frozenset(referenced),
+            side_effects=(self.side_effects - variables.keys()) | side_effects,
+        )
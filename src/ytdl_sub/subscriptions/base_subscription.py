@@ -24,6 +24,8 @@ def _initialize_download_archive(
     overrides: Overrides,
     working_directory: str,
     output_directory: str,
+    subscription_name: str,
+    copy_strategy: str,
 ) -> EnhancedDownloadArchive:
     migrated_file_name: Optional[str] = None
     if migrated_file_name_option := output_options.migrated_download_archive_name:
@@ -34,6 +36,8 @@ def _initialize_download_archive(
         working_directory=working_directory,
         output_directory=output_directory,
         migrated_file_name=migrated_file_name,
+        subscription_name=subscription_name,
+        copy_strategy=copy_strategy,
     ).reinitialize(dry_run=True)
 
 
@@ -90,6 +94,8 @@ class BaseSubscription(ABC):
                 overrides=self.overrides,
                 working_directory=self.working_directory,
                 output_directory=self.output_directory,
+                subscription_name=self.name,
+                copy_strategy=self._config_options.experimental.file_copy_strategy,
             )
         )
 
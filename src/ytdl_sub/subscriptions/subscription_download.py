@@ -1,10 +1,12 @@
 import contextlib
 import logging
 import os
+import queue
 import shutil
+import threading
 from abc import ABC
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional, Set
 
 from ytdl_sub.config.plugin.plugin import Plugin, SplitPlugin
 from ytdl_sub.config.plugin.plugin_mapping import PluginMapping
@@ -16,12 +18,14 @@ from ytdl_sub.downloaders.info_json.info_json_downloader import (
 from ytdl_sub.downloaders.source_plugin import SourcePlugin
 from ytdl_sub.downloaders.url.downloader import MultiUrlDownloader
 from ytdl_sub.downloaders.ytdl_options_builder import YTDLOptionsBuilder
+from ytdl_sub.downloaders.ytdlp import YTDLP
 from ytdl_sub.entries.entry import Entry
 from ytdl_sub.entries.script.variable_definitions import VARIABLES
 from ytdl_sub.subscriptions.base_subscription import BaseSubscription
 from ytdl_sub.subscriptions.subscription_ytdl_options import SubscriptionYTDLOptions
 from ytdl_sub.utils.datetime import to_date_range
 from ytdl_sub.utils.exceptions import ValidationException
+from ytdl_sub.utils.ffmpeg import run_ffmpeg_remux_plan
 from ytdl_sub.utils.file_handler import FileHandler, FileHandlerTransactionLog, FileMetadata
 from ytdl_sub.utils.logger import Logger
 
@@ -38,11 +42,90 @@ def _get_split_plugin(plugins: List[Plugin]) -> Optional[SplitPlugin]:
     return None
 
 
+class _PostProcessingPipeline:
+    """
+    Hands downloaded entries off to a post-processing thread through a bounded queue, so the next
+    entry can download while the previous one gets post-processed. Entries are post-processed one
+    at a time, in the order they were downloaded, since download indices and the download archive
+    depend on every prior entry being complete.
+    """
+
+    _STOP = object()
+
+    def __init__(self, post_process: Callable[[Entry], None], max_queued_entries: int):
+        self._post_process = Logger.with_current_debug_log(post_process)
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queued_entries)
+        self._exception: Optional[Exception] = None
+        self._thread = threading.Thread(
+            target=self._run, name=f"{threading.current_thread().name}-post-process", daemon=True
+        )
+
+    def _run(self) -> None:
+        while True:
+            entry = self._queue.get()
+            try:
+                if entry is self._STOP:
+                    return
+                # Once an entry fails, keep consuming so the download stage never blocks
+                if self._exception is None:
+                    self._post_process(entry)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._exception = exc
+            finally:
+                self._queue.task_done()
+
+    def _raise_if_failed(self) -> None:
+        if self._exception is not None:
+            raise self._exception
+
+    def put(self, entry: Entry) -> None:
+        """
+        Queue a downloaded entry to post-process. Blocks while the queue is full.
+
+        Raises
+        ------
+        Exception
+            Any error raised while post-processing a prior entry
+        """
+        self._raise_if_failed()
+        self._queue.put(entry)
+
+    def drain(self) -> None:
+        """
+        Blocks until every queued entry is post-processed
+
+        Raises
+        ------
+        Exception
+            Any error raised while post-processing
+        """
+        self._queue.join()
+        self._raise_if_failed()
+
+    def __enter__(self) -> "_PostProcessingPipeline":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            # Entries that already downloaded still get post-processed if the download stage fails
+            self._queue.put(self._STOP)
+        finally:
+            # Never let post-processing outlive the subscription, even if stopping is interrupted
+            self._thread.join()
+
+        if exc_type is None:
+            self._raise_if_failed()
+
+
 class SubscriptionDownload(BaseSubscription, ABC):
     """
     Handles the subscription download logic
     """
 
+    # Number of downloaded entries that can wait on post-processing when downloads are pipelined
+    _PIPELINE_MAX_QUEUED_ENTRIES = 1
+
     def _move_entry_files_to_output_directory(
         self,
         dry_run: bool,
@@ -113,6 +196,7 @@ class SubscriptionDownload(BaseSubscription, ABC):
         _ = is_error
         if os.path.isdir(self.working_directory):
             shutil.rmtree(self.working_directory)
+            FileHandler.mark_files_changed(self.working_directory)
 
     @contextlib.contextmanager
     def _prepare_working_directory(self):
@@ -173,27 +257,78 @@ class SubscriptionDownload(BaseSubscription, ABC):
             self.download_archive.save_download_mappings()
             FileHandler.delete(self.download_archive.working_ytdl_file_path)
 
+    def _remove_all_empty_directories(self) -> None:
+        for root, dir_names, _ in os.walk(Path(self.output_directory), topdown=False):
+            for dir_name in dir_names:
+                dir_path = Path(root) / dir_name
+                if len(os.listdir(dir_path)) == 0:
+                    os.rmdir(dir_path)
+
+    def _remove_empty_parent_directories(self) -> None:
+        """
+        Deletes the directories of files removed from the output directory if they are now
+        empty, and their parent directories up to the output directory if those end up empty too.
+        """
+        output_directory = Path(self.output_directory)
+        dir_paths = {
+            (output_directory / file_name).parent
+            for file_name in self.download_archive.get_file_handler_transaction_log().files_removed
+        }
+
+        # Deepest first, so directories that share a parent are emptied before it is checked
+        for dir_path in sorted(dir_paths, key=lambda path: len(path.parts), reverse=True):
+            while output_directory in dir_path.parents:
+                if not os.path.isdir(dir_path) or len(os.listdir(dir_path)) > 0:
+                    break
+                os.rmdir(dir_path)
+                dir_path = dir_path.parent
+
     @contextlib.contextmanager
     def _remove_empty_directories_in_output_directory(self):
         try:
             yield
         finally:
             if not self.download_archive.is_dry_run:
-                for root, dir_names, _ in os.walk(Path(self.output_directory), topdown=False):
-                    for dir_name in dir_names:
-                        dir_path = Path(root) / dir_name
-                        if len(os.listdir(dir_path)) == 0:
-                            os.rmdir(dir_path)
+                if self._config_options.experimental.enable_full_empty_directory_pruning:
+                    self._remove_all_empty_directories()
+                else:
+                    self._remove_empty_parent_directories()
+
+    @contextlib.contextmanager
+    def _close_download_archive(self):
+        """
+        Context manager that closes the download archive's database, if any, once it is saved.
+        Subscriptions are all built up front, so it would otherwise stay open until the
+        subscription downloads again.
+        """
+        try:
+            yield
+        finally:
+            self.download_archive.close()
 
     @contextlib.contextmanager
     def _subscription_download_context_managers(self) -> None:
+        # Empty directories are removed after the archive's stale files are deleted
         with (
+            self._close_download_archive(),
             self._prepare_working_directory(),
-            self._maintain_archive_file(),
             self._remove_empty_directories_in_output_directory(),
+            self._maintain_archive_file(),
         ):
             yield
 
+    @property
+    def _metadata_keep_keys(self) -> Optional[Set[str]]:
+        """
+        Returns
+        -------
+        Entry metadata keys to keep if entry metadata pruning is enabled, otherwise None
+        """
+        experimental = self._config_options.experimental
+        if not experimental.enable_entry_metadata_pruning:
+            return None
+        return Entry.metadata_keep_keys(additional_keys=experimental.entry_metadata_keep_keys)
+
     def _initialize_plugins(self) -> List[Plugin]:
         """
         Returns
@@ -217,6 +352,10 @@ class SubscriptionDownload(BaseSubscription, ABC):
                     nulled_variable_set = {var_name: "" for var_name in variable_set}
                     self.overrides.add(nulled_variable_set)
 
+        is_entry_split = _get_split_plugin(initialized_plugins) is not None
+        for plugin in initialized_plugins:
+            plugin.set_entry_split(is_entry_split)
+
         return initialized_plugins
 
     @classmethod
@@ -259,14 +398,20 @@ class SubscriptionDownload(BaseSubscription, ABC):
             if optional_plugin_entry_metadata:
                 entry_metadata.extend(optional_plugin_entry_metadata)
 
+        # Apply the ffmpeg operations added by plugins in a single pass over the file
+        if not dry_run:
+            run_ffmpeg_remux_plan(
+                file_path=entry.get_download_file_path(), remux_plan=entry.ffmpeg_remux_plan()
+            )
+
         # Then, move it to the output directory
         self._move_entry_files_to_output_directory(
             dry_run=dry_run, entry=entry, entry_metadata=entry_metadata
         )
 
-        # Re-save the download archive after each entry is moved to the output directory
+        # Journal the download archive changes after each entry is moved to the output directory
         if self.maintain_download_archive:
-            self.download_archive.save_download_mappings()
+            self.download_archive.journal_download_mappings()
 
         for plugin in PluginMapping.order_plugins_by(plugins, PluginOperation.POST_COMPLETION):
             plugin.post_completion_entry(file_metadata=entry_metadata)
@@ -328,6 +473,23 @@ class SubscriptionDownload(BaseSubscription, ABC):
 
         self._cleanup_entry_files(entry)
 
+    @classmethod
+    def _post_download_entry(cls, plugins: List[Plugin], entry: Entry) -> None:
+        for plugin in plugins:
+            plugin.post_download_entry(entry)
+
+    def _process_downloaded_entry(
+        self, plugins: List[Plugin], dry_run: bool, entry: Entry, entry_metadata: FileMetadata
+    ) -> None:
+        if split_plugin := _get_split_plugin(plugins):
+            self._process_split_entry(
+                split_plugin=split_plugin, plugins=plugins, dry_run=dry_run, entry=entry
+            )
+        else:
+            self._process_entry(
+                plugins=plugins, dry_run=dry_run, entry=entry, entry_metadata=entry_metadata
+            )
+
     def _process_subscription(
         self,
         plugins: List[Plugin],
@@ -347,14 +509,52 @@ class SubscriptionDownload(BaseSubscription, ABC):
                 if isinstance(entry, tuple):
                     entry, entry_metadata = entry
 
-                if split_plugin := _get_split_plugin(plugins):
-                    self._process_split_entry(
-                        split_plugin=split_plugin, plugins=plugins, dry_run=dry_run, entry=entry
-                    )
-                else:
-                    self._process_entry(
-                        plugins=plugins, dry_run=dry_run, entry=entry, entry_metadata=entry_metadata
-                    )
+                self._process_downloaded_entry(
+                    plugins=plugins, dry_run=dry_run, entry=entry, entry_metadata=entry_metadata
+                )
+
+        for plugin in plugins:
+            plugin.post_process_subscription()
+
+        return self.download_archive.get_file_handler_transaction_log()
+
+    def _process_subscription_pipelined(
+        self,
+        plugins: List[Plugin],
+        downloader: MultiUrlDownloader,
+        dry_run: bool,
+    ) -> FileHandlerTransactionLog:
+        """
+        Same as ``_process_subscription``, but post-processes each entry on a separate thread
+        while the next one downloads. Download indices get added right before post-processing
+        so they are identical to a non-pipelined download.
+        """
+
+        def _post_process(entry: Entry) -> None:
+            self._process_downloaded_entry(
+                plugins=plugins,
+                dry_run=dry_run,
+                entry=downloader.add_download_indices(entry),
+                entry_metadata=FileMetadata(),
+            )
+
+        with (
+            self._subscription_download_context_managers(),
+            _PostProcessingPipeline(
+                post_process=_post_process,
+                max_queued_entries=self._PIPELINE_MAX_QUEUED_ENTRIES,
+            ) as pipeline,
+        ):
+            downloader.set_on_url_complete(pipeline.drain)
+            for entry in downloader.download_metadata():
+                if (entry := self._preprocess_entry(plugins=plugins, entry=entry)) is None:
+                    continue
+
+                if (entry := downloader.download_media(entry)) is None:
+                    continue
+
+                self._post_download_entry(plugins=plugins, entry=entry)
+                pipeline.put(entry)
 
         for plugin in plugins:
             plugin.post_process_subscription()
@@ -418,13 +618,33 @@ class SubscriptionDownload(BaseSubscription, ABC):
             overrides=self.overrides,
         )
 
+        downloader.set_stream_metadata(self._config_options.experimental.enable_streaming_metadata)
+        downloader.set_uploader_metadata_cache_ttl(
+            self._config_options.experimental.uploader_metadata_cache_ttl_s
+        )
+        downloader.set_metadata_url_concurrency(
+            self._config_options.experimental.metadata_url_concurrency
+        )
+        downloader.set_metadata_keep_keys(self._metadata_keep_keys)
         plugins.extend(downloader.added_plugins())
 
-        return self._process_subscription(
-            plugins=plugins,
-            downloader=downloader,
-            dry_run=dry_run,
-        )
+        is_download_pipelined = self._config_options.experimental.enable_pipelined_downloads
+        for plugin in plugins:
+            plugin.set_download_pipelined(is_download_pipelined)
+
+        with YTDLP.reuse_downloaders():
+            if is_download_pipelined:
+                return self._process_subscription_pipelined(
+                    plugins=plugins,
+                    downloader=downloader,
+                    dry_run=dry_run,
+                )
+
+            return self._process_subscription(
+                plugins=plugins,
+                downloader=downloader,
+                dry_run=dry_run,
+            )
 
     @contextlib.contextmanager
     def exception_handling(self) -> None:
@@ -473,6 +693,7 @@ class SubscriptionDownload(BaseSubscription, ABC):
             metadata_ytdl_options=YTDLOptionsBuilder(),
             overrides=self.overrides,
         )
+        downloader.set_metadata_keep_keys(self._metadata_keep_keys)
 
         return self._process_subscription(
             plugins=plugins,
@@ -1,17 +1,121 @@
+import ctypes
 import json
 import os.path
+import re
+import select
+import struct
+import sys
 import threading
 import time
 from json import JSONDecodeError
-from pathlib import Path
-from typing import Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from ytdl_sub.utils.logger import Logger
 
 logger = Logger.get(name="downloader")
 
+# Whitespace and separators between JSON object keys and values
+_JSON_SEPARATORS = re.compile(r"[\s,:]*")
+
+
+class _Inotify:
+    """
+    Minimal ctypes binding of Linux's inotify, used to get notified of files written to watched
+    directories instead of repeatedly walking them.
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+
+    _WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    _EVENT_HEADER = struct.Struct("iIII")
+    _READ_SIZE_BYTES = 64 * 1024
+
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not supported by this libc")
+
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            self._raise_errno()
+
+        self._watched_directories: Dict[int, str] = {}
+
+    @classmethod
+    def _raise_errno(cls, file_name: Optional[str] = None) -> None:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno), file_name)
+
+    def add_watch(self, directory: str) -> None:
+        """
+        Watches the directory for new files and directories
+        """
+        watch_descriptor = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), self._WATCH_MASK
+        )
+        if watch_descriptor < 0:
+            self._raise_errno(directory)
+        self._watched_directories[watch_descriptor] = directory
+
+    def read_events(self, timeout_sec: float) -> List[Tuple[str, int]]:
+        """
+        Returns
+        -------
+        (path, mask) of each event that occurred, waiting up to timeout_sec for one to occur
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout_sec)
+        if not readable:
+            return []
+
+        try:
+            data = os.read(self._fd, self._READ_SIZE_BYTES)
+        except BlockingIOError:
+            return []
+
+        events: List[Tuple[str, int]] = []
+        offset = 0
+        while offset + self._EVENT_HEADER.size <= len(data):
+            watch_descriptor, mask, _, name_length = self._EVENT_HEADER.unpack_from(data, offset)
+            offset += self._EVENT_HEADER.size
+            name = data[offset : offset + name_length].rstrip(b"\0")
+            offset += name_length
+
+            if mask & self.IN_IGNORED:
+                # The watched directory was deleted, which removes its watch
+                self._watched_directories.pop(watch_descriptor, None)
+                continue
+
+            directory = self._watched_directories.get(watch_descriptor)
+            if directory is not None or mask & self.IN_Q_OVERFLOW:
+                events.append((os.path.join(directory or "", os.fsdecode(name)), mask))
+
+        return events
+
+    def close(self) -> None:
+        """
+        Closes the inotify file descriptor, which removes all watches
+        """
+        os.close(self._fd)
+
 
 class LogEntriesDownloadedListener(threading.Thread):
+    _POLL_INTERVAL_SEC: float = 0.1
+    _TITLE_READ_SIZE_BYTES: int = 64 * 1024
+
+    # Directories modified this recently are re-scanned even if their mtime is unchanged, in case
+    # the filesystem's mtime resolution is too coarse to distinguish multiple writes
+    _RECENTLY_MODIFIED_SEC: float = 2.0
+
     def __init__(self, working_directory: str, log_prefix: str):
         """
         To be ran in a thread while download via ytdl-sub. Listens for new .info.json files in the
@@ -30,41 +134,174 @@ class LogEntriesDownloadedListener(threading.Thread):
         self.log_prefix = log_prefix
         self.complete = False
 
-        self._files_read: Set[str] = set()
+        # File names already read per directory. Pruned as files and directories get removed
+        self._files_read: Dict[str, Set[str]] = {}
+        self._directory_mtimes: Dict[str, int] = {}
+        self._subdirectories: Dict[str, List[str]] = {}
 
     @classmethod
-    def _get_title_from_info_json(cls, path: Path) -> Optional[str]:
+    def _get_title_from_info_json(cls, path: str) -> Optional[str]:
+        """
+        Reads the top-level title of the info.json without loading the entire file. yt-dlp writes
+        the title as one of the first keys, so only the start of the file is read.
+
+        Raises
+        ------
+        ValueError
+            If the file is not valid JSON, i.e. is not completely written yet
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            prefix = file.read(cls._TITLE_READ_SIZE_BYTES)
+        is_entire_file = len(prefix) < cls._TITLE_READ_SIZE_BYTES
+
+        decoder = json.JSONDecoder()
         try:
-            with open(path, "r", encoding="utf-8") as file:
-                file_json = json.load(file)
-        except JSONDecodeError:
-            # swallow the error since this is only printing logs
-            return None
+            idx = _JSON_SEPARATORS.match(prefix).end()
+            if not prefix.startswith("{", idx):
+                raise JSONDecodeError("Expecting '{'", prefix, idx)
 
-        return file_json.get("title")
+            # Decode one top-level key and value at a time until the title is found
+            idx += 1
+            while not prefix.startswith("}", idx := _JSON_SEPARATORS.match(prefix, idx).end()):
+                key, idx = decoder.raw_decode(prefix, idx)
+                value, idx = decoder.raw_decode(prefix, _JSON_SEPARATORS.match(prefix, idx).end())
+                if key == "title":
+                    return value if isinstance(value, str) else None
+        except JSONDecodeError:
+            if is_entire_file:
+                raise
+            # The title is not within the read prefix
+        return None
 
     @classmethod
-    def _is_info_json(cls, path: Path) -> bool:
-        if path.is_file():
-            _, ext = os.path.splitext(path)
-            return ext == ".json"
-        return False
+    def _is_info_json(cls, file_name: str) -> bool:
+        _, ext = os.path.splitext(file_name)
+        return ext == ".json"
+
+    def _log_title(self, path: str) -> None:
+        directory, file_name = os.path.split(path)
+        if not self._is_info_json(file_name):
+            return
+
+        files_read = self._files_read.setdefault(directory, set())
+        if file_name in files_read:
+            return
+
+        try:
+            title = self._get_title_from_info_json(path)
+        except (OSError, ValueError):
+            # Retry once it's completely written, otherwise swallow the error since this is only
+            # printing logs
+            return
+
+        files_read.add(file_name)
+        if title:
+            logger.info("%s %s", self.log_prefix, title)
+
+    def _forget_file(self, path: str) -> None:
+        directory, file_name = os.path.split(path)
+        self._files_read.get(directory, set()).discard(file_name)
+
+    def _forget_directory(self, directory: str) -> None:
+        self._files_read.pop(directory, None)
+        self._directory_mtimes.pop(directory, None)
+        for subdirectory in self._subdirectories.pop(directory, []):
+            self._forget_directory(subdirectory)
+
+    def _scan_directory(self, directory: str, inotify: Optional[_Inotify] = None) -> None:
+        """
+        Logs the titles of new files within the directory. Subdirectories are scanned if their
+        mtime changed since they were last scanned, and watched if inotify is given.
+        """
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
+            self._forget_directory(directory)
+            return
+
+        is_modified = self._directory_mtimes.get(directory) != mtime or (
+            time.time_ns() - mtime < self._RECENTLY_MODIFIED_SEC * 1e9
+        )
+        if is_modified:
+            self._directory_mtimes[directory] = mtime
+            subdirectories: List[str] = []
+            file_names: Set[str] = set()
+            try:
+                with os.scandir(directory) as dir_entries:
+                    for dir_entry in dir_entries:
+                        if dir_entry.is_dir(follow_symlinks=False):
+                            subdirectories.append(dir_entry.path)
+                        else:
+                            file_names.add(dir_entry.name)
+                            if self._is_info_json(dir_entry.name) and dir_entry.is_file():
+                                self._log_title(dir_entry.path)
+            except FileNotFoundError:
+                self._forget_directory(directory)
+                return
+
+            # Only remember files that still exist
+            self._files_read[directory] = self._files_read.get(directory, set()) & file_names
+            for subdirectory in set(self._subdirectories.get(directory, [])) - set(subdirectories):
+                self._forget_directory(subdirectory)
+
+            for subdirectory in subdirectories:
+                if inotify and subdirectory not in self._subdirectories:
+                    inotify.add_watch(subdirectory)
+            self._subdirectories[directory] = subdirectories
+
+        for subdirectory in self._subdirectories.get(directory, []):
+            self._scan_directory(subdirectory, inotify=inotify)
 
     def loop(self) -> None:
         """
         Read new files in the directory and print their titles
         """
-        for path in Path(self.working_directory).rglob("*"):
-            if path.name not in self._files_read and self._is_info_json(path):
-                title = self._get_title_from_info_json(path)
-                self._files_read.add(path.name)
-                if title:
-                    logger.info("%s %s", self.log_prefix, title)
+        self._scan_directory(self.working_directory)
+
+    def _run_inotify(self, inotify: _Inotify) -> None:
+        """
+        Logs titles as inotify reports new files. Directories are only scanned on start, when
+        they are created, or if events overflowed.
+        """
+        inotify.add_watch(self.working_directory)
+        self._scan_directory(self.working_directory, inotify=inotify)
+
+        while not self.complete:
+            for path, mask in inotify.read_events(timeout_sec=self._POLL_INTERVAL_SEC):
+                if mask & _Inotify.IN_Q_OVERFLOW:
+                    self._directory_mtimes.clear()
+                    self._scan_directory(self.working_directory, inotify=inotify)
+                elif mask & _Inotify.IN_ISDIR:
+                    if mask & (_Inotify.IN_CREATE | _Inotify.IN_MOVED_TO):
+                        inotify.add_watch(path)
+                        self._scan_directory(path, inotify=inotify)
+                    elif mask & (_Inotify.IN_DELETE | _Inotify.IN_MOVED_FROM):
+                        self._forget_directory(path)
+                elif mask & (_Inotify.IN_CLOSE_WRITE | _Inotify.IN_MOVED_TO):
+                    self._log_title(path)
+                elif mask & (_Inotify.IN_DELETE | _Inotify.IN_MOVED_FROM):
+                    self._forget_file(path)
 
     def run(self):
         """
-        Loops over new files and prints their titles
+        Loops over new files and prints their titles. Uses inotify when available, otherwise
+        polls the working directory.
         """
+        try:
+            inotify = _Inotify()
+        except OSError:
+            inotify = None
+
+        if inotify is not None:
+            try:
+                self._run_inotify(inotify)
+                return
+            except OSError as exc:
+                # i.e. the inotify watch limit was reached
+                logger.debug("Falling back to polling for new info.json files: %s", exc)
+            finally:
+                inotify.close()
+
         while not self.complete:
             self.loop()
-            time.sleep(0.1)
+            time.sleep(self._POLL_INTERVAL_SEC)
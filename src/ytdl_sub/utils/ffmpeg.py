@@ -1,9 +1,11 @@
+import os
 import subprocess
 import tempfile
-from typing import Dict, List, Optional
+from typing import List, Optional
 
 from ytdl_sub.utils.chapters import Chapters
 from ytdl_sub.utils.exceptions import ValidationException
+from ytdl_sub.utils.ffmpeg_remux_plan import FFmpegRemuxPlan
 from ytdl_sub.utils.file_handler import FileHandler
 from ytdl_sub.utils.logger import Logger
 
@@ -87,8 +89,12 @@ class FFMPEG:
         cmd = [cls.ffmpeg_path()]
         cmd.extend(ffmpeg_args)
         logger.debug("Running %s", " ".join(cmd))
-        with Logger.handle_external_logs(name="ffmpeg"):
-            subprocess.run(cmd, check=True, capture_output=True, timeout=timeout)
+        try:
+            with Logger.handle_external_logs(name="ffmpeg"):
+                subprocess.run(cmd, check=True, capture_output=True, timeout=timeout)
+        finally:
+            # ffmpeg's output file is always its last argument
+            FileHandler.mark_files_changed(os.path.dirname(ffmpeg_args[-1]))
 
 
 def _create_metadata_chapter_entry(start_sec: int, end_sec: int, title: str) -> List[str]:
@@ -129,82 +135,81 @@ def _create_metadata_chapters(chapters: Chapters, file_duration_sec: int) -> Lis
     return lines
 
 
-def set_ffmpeg_metadata_chapters(
-    file_path: str, chapters: Optional[Chapters], file_duration_sec: int
-) -> None:
+def write_ffmpeg_metadata_chapters_file(
+    chapters: Optional[Chapters], file_duration_sec: int
+) -> str:
     """
-    Sets ffmetadata chapters to a file. Note that this will (I think) wipe all prior
-    metadata.
-
     Parameters
     ----------
-    file_path
-        Full path to the file to add metadata to
     chapters
-        Chapters to embed in the file. If a chapter for 0:00 does not exist, one is created
+        Chapters to write. If a chapter for 0:00 does not exist, one is created
     file_duration_sec
-        Length of the file in seconds
+        Length of the file the chapters are for, in seconds
+
+    Returns
+    -------
+    Path to a temporary ffmetadata file containing the chapters. The caller must delete it
     """
     lines = [";FFMETADATA1"]
 
     if chapters:
         lines += _create_metadata_chapters(chapters=chapters, file_duration_sec=file_duration_sec)
 
-    tmp_file_path = FFMPEG.tmp_file_path(relative_file_path=file_path)
     with tempfile.NamedTemporaryFile(
         mode="w", suffix=".txt", encoding="utf-8", delete=False
     ) as metadata_file:
         metadata_file.write("\n".join(lines))
         metadata_file.flush()
 
-    try:
-        FFMPEG.run(
-            [
-                "-i",
-                file_path,
-                "-i",
-                metadata_file.name,
-                "-map",
-                "0",
-                "-dn",  # ignore data streams
-                "-map_chapters",
-                "1",
-                "-bitexact",  # for reproducibility
-                "-codec",
-                "copy",
-                tmp_file_path,
-            ]
-        )
-        FileHandler.move(tmp_file_path, file_path)
-    finally:
-        FileHandler.delete(metadata_file.name)
+    return metadata_file.name
 
 
-def add_ffmpeg_metadata_key_values(file_path: str, key_values: Dict[str, str]) -> None:
+def set_ffmpeg_metadata_chapters(
+    file_path: str, chapters: Optional[Chapters], file_duration_sec: int
+) -> None:
     """
+    Sets ffmetadata chapters to a file. Note that this will (I think) wipe all prior
+    metadata.
+
     Parameters
     ----------
     file_path
-        File to add metadata key/values to
-    key_values
-        The key/values to add
+        Full path to the file to add metadata to
+    chapters
+        Chapters to embed in the file. If a chapter for 0:00 does not exist, one is created
+    file_duration_sec
+        Length of the file in seconds
     """
-    tmp_file_path = FFMPEG.tmp_file_path(file_path)
+    run_ffmpeg_remux_plan(
+        file_path=file_path,
+        remux_plan=FFmpegRemuxPlan().set_chapters(
+            write_ffmpeg_metadata_chapters_file(
+                chapters=chapters, file_duration_sec=file_duration_sec
+            ),
+            is_temporary=True,
+        ),
+    )
 
-    ffmpeg_args = [
-        "-i",
-        file_path,
-        "-map",
-        "0",
-        "-dn",  # ignore data streams
-    ]
-    for key, value in key_values.items():
-        # Some special characters (utf-16 maybe?) have null-byte
-        # which results in ffmpeg error, remove them outright
-        value_null_byte_removed = value.replace("\0", "")
-        ffmpeg_args.extend(["-metadata", f"{key}={value_null_byte_removed}"])
 
-    ffmpeg_args.extend(["-codec", "copy", "-bitexact", tmp_file_path])
+def run_ffmpeg_remux_plan(file_path: str, remux_plan: FFmpegRemuxPlan) -> None:
+    """
+    Parameters
+    ----------
+    file_path
+        File to apply the remux plan's operations to, in a single ffmpeg pass
+    remux_plan
+        Operations to apply. Nothing is ran if it is empty
+    """
+    if remux_plan.is_empty():
+        return
 
-    FFMPEG.run(ffmpeg_args)
-    FileHandler.move(tmp_file_path, file_path)
+    tmp_file_path = FFMPEG.tmp_file_path(file_path)
+    try:
+        FFMPEG.run(
+            remux_plan.ffmpeg_args(input_file_path=file_path, output_file_path=tmp_file_path)
+        )
+        FileHandler.move(tmp_file_path, file_path)
+    finally:
+        FileHandler.delete(tmp_file_path)
+        for temporary_file_path in remux_plan.temporary_file_paths:
+            FileHandler.delete(temporary_file_path)
@@ -0,0 +1,121 @@
+from typing import Dict, List, Optional
+
+
+class FFmpegRemuxPlan:
+    """
+    ffmpeg operations that plugins add to an entry's file while post-processing it. They are all
+    applied in a single ``-codec copy`` remux of the file, instead of each operation rewriting the
+    entire file on its own.
+    """
+
+    def __init__(self):
+        self._metadata: Dict[str, str] = {}
+        self._attached_pic_file_path: Optional[str] = None
+        self._chapters_file_path: Optional[str] = None
+        self._temporary_file_paths: List[str] = []
+
+    def add_metadata(self, key_values: Dict[str, str]) -> "FFmpegRemuxPlan":
+        """
+        Parameters
+        ----------
+        key_values
+            Metadata key/values to add to the file via ``-metadata key=value``
+        """
+        for key, value in key_values.items():
+            # Some special characters (utf-16 maybe?) have null-byte
+            # which results in ffmpeg error, remove them outright
+            self._metadata[key] = value.replace("\0", "")
+        return self
+
+    def set_attached_pic(
+        self, thumbnail_file_path: str, is_temporary: bool = False
+    ) -> "FFmpegRemuxPlan":
+        """
+        Parameters
+        ----------
+        thumbnail_file_path
+            Thumbnail to embed into the file as its attached picture
+        is_temporary
+            Whether the thumbnail file should be deleted once the plan is ran
+        """
+        self._attached_pic_file_path = thumbnail_file_path
+        if is_temporary:
+            self._temporary_file_paths.append(thumbnail_file_path)
+        return self
+
+    def set_chapters(
+        self, chapters_file_path: str, is_temporary: bool = False
+    ) -> "FFmpegRemuxPlan":
+        """
+        Parameters
+        ----------
+        chapters_file_path
+            ffmetadata file whose chapters replace the file's chapters
+        is_temporary
+            Whether the ffmetadata file should be deleted once the plan is ran
+        """
+        self._chapters_file_path = chapters_file_path
+        if is_temporary:
+            self._temporary_file_paths.append(chapters_file_path)
+        return self
+
+    @property
+    def temporary_file_paths(self) -> List[str]:
+        """
+        Returns
+        -------
+        Files only used by the plan, to delete once it is ran
+        """
+        return self._temporary_file_paths
+
+    def is_empty(self) -> bool:
+        """
+        Returns
+        -------
+        True if no operations have been added. False otherwise.
+        """
+        return (
+            not self._metadata
+            and self._attached_pic_file_path is None
+            and self._chapters_file_path is None
+        )
+
+    def ffmpeg_args(self, input_file_path: str, output_file_path: str) -> List[str]:
+        """
+        Parameters
+        ----------
+        input_file_path
+            File to remux
+        output_file_path
+            Where to write the remuxed file
+
+        Returns
+        -------
+        ffmpeg args that apply every operation in one pass
+        """
+        ffmpeg_args: List[str] = ["-i", input_file_path]
+        if self._attached_pic_file_path:
+            ffmpeg_args.extend(["-i", self._attached_pic_file_path])
+        if self._chapters_file_path:
+            ffmpeg_args.extend(["-i", self._chapters_file_path])
+
+        if self._attached_pic_file_path:
+            ffmpeg_args.extend(["-map", "1", "-map", "0"])
+        else:
+            ffmpeg_args.extend(["-map", "0"])
+
+        if self._chapters_file_path:
+            # The chapters file is the last input
+            chapters_input_index = 2 if self._attached_pic_file_path else 1
+            ffmpeg_args.extend(["-map_chapters", str(chapters_input_index)])
+
+        ffmpeg_args.append("-dn")  # ignore data streams
+        for key, value in self._metadata.items():
+            ffmpeg_args.extend(["-metadata", f"{key}={value}"])
+
+        ffmpeg_args.extend(["-codec", "copy", "-bitexact"])  # bitexact for reproducibility
+        if self._attached_pic_file_path:
+            ffmpeg_args.extend(["-disposition:0", "attached_pic"])
+
+        ffmpeg_args.append(output_file_path)
+        return ffmpeg_args
@@ -1,12 +1,29 @@
 import hashlib
+import itertools
 import json
 import os
 import shutil
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from ytdl_sub.utils.subtitles import SUBTITLE_EXTENSIONS
+from ytdl_sub.utils.system import IS_WINDOWS
+
+if not IS_WINDOWS:
+    import fcntl
+
+# ioctl to clone a file's extents into another on copy-on-write filesystems (btrfs, xfs, etc)
+_FICLONE = 0x40049409
+
+# Max bytes to copy per copy_file_range call
+_COPY_FILE_RANGE_CHUNK_BYTES = 1024 * 1024 * 1024
+
+# Bytes of each block sampled from the head, middle, and tail of files when comparing them
+_SAMPLE_BLOCK_BYTES = 64 * 1024
+
+# Bytes read at a time when hashing a file's contents
+_CONTENT_HASH_BLOCK_BYTES = 1024 * 1024
 
 
 def get_file_extension(file_name: Path | str) -> str:
@@ -54,12 +71,119 @@ def get_file_md5_hash(full_file_path: Path | str) -> str:
     return md5hash.hexdigest()
 
 
-def files_equal(full_file_path_a: Path | str, full_file_path_b: Path | str) -> bool:
+def get_file_content_hash(full_file_path: Path | str) -> str:
     """
+    Parameters
+    ----------
+    full_file_path
+        Path to the file
+
+    Returns
+    -------
+    blake2b hash of its contents
+    """
+    content_hash = hashlib.blake2b()
+    with open(full_file_path, "rb") as file:
+        while chunk := file.read(_CONTENT_HASH_BLOCK_BYTES):
+            content_hash.update(chunk)
+    return content_hash.hexdigest()
+
+
+def _sampled_blocks(full_file_path: Path | str, file_size: int) -> List[bytes]:
+    """
+    Reads a block from the head, middle, and tail of the file. Files that differ usually differ in
+    at least one of them, which avoids reading both files in full.
+    """
+    offsets = sorted({0, max(file_size // 2 - _SAMPLE_BLOCK_BYTES // 2, 0)})
+    offsets.append(max(file_size - _SAMPLE_BLOCK_BYTES, 0))
+
+    blocks: List[bytes] = []
+    with open(full_file_path, "rb") as file:
+        for offset in offsets:
+            file.seek(offset)
+            blocks.append(file.read(_SAMPLE_BLOCK_BYTES))
+    return blocks
+
+
+class FileContentHashes:
+    """
+    Cache of file content hashes keyed by the file's path, size, and mtime, so unchanged files do
+    not get rehashed. Stored in-memory, subclasses can persist it elsewhere.
+    """
+
+    def __init__(self):
+        self._content_hashes: Dict[str, Tuple[int, int, str]] = {}
+
+    def _lookup(self, file_path: str) -> Optional[Tuple[int, int, str]]:
+        return self._content_hashes.get(file_path)
+
+    def _store(self, file_path: str, size: int, mtime_ns: int, content_hash: str) -> None:
+        self._content_hashes[file_path] = (size, mtime_ns, content_hash)
+
+    def _discard(self, file_path: str) -> None:
+        self._content_hashes.pop(file_path, None)
+
+    def get(self, file_path: Union[str, Path]) -> str:
+        """
+        Parameters
+        ----------
+        file_path
+            File to get the content hash of
+
+        Returns
+        -------
+        The file's cached content hash if its size and mtime are unchanged. Otherwise hashes
+        the file and caches it.
+        """
+        file_stat = os.stat(file_path)
+        if (cached := self._lookup(str(file_path))) is not None:
+            size, mtime_ns, content_hash = cached
+            if size == file_stat.st_size and mtime_ns == file_stat.st_mtime_ns:
+                return content_hash
+
+        content_hash = get_file_content_hash(file_path)
+        self._store(str(file_path), file_stat.st_size, file_stat.st_mtime_ns, content_hash)
+        return content_hash
+
+    def rekey(self, src_file_path: Union[str, Path], dst_file_path: Union[str, Path]) -> None:
+        """
+        Re-records the cached hash of the source file under the destination file's current size
+        and mtime. Only call once the destination is known to have the same contents, i.e. after
+        the source was moved or copied to it, or had its mtime set.
+
+        Parameters
+        ----------
+        src_file_path
+            File whose cached hash to use
+        dst_file_path
+            File to cache the hash for. Can be the same as the source
+        """
+        cached = self._lookup(str(src_file_path))
+        self._discard(str(src_file_path))
+        if cached is None or not os.path.isfile(dst_file_path):
+            return
+
+        file_stat = os.stat(dst_file_path)
+        self._store(str(dst_file_path), file_stat.st_size, file_stat.st_mtime_ns, cached[2])
+
+
+def files_equal(
+    full_file_path_a: Path | str,
+    full_file_path_b: Path | str,
+    content_hashes: Optional[FileContentHashes] = None,
+) -> bool:
+    """
+    Compares the files' sizes first, then a sample of their blocks, and only hashes both files in
+    full if neither differ.
+
     Parameters
     ----------
     full_file_path_a
+        File to compare
     full_file_path_b
+        File to compare against
+    content_hashes
+        Optional. Cache to get the files' full content hashes from
 
     Returns
     -------
@@ -67,11 +191,21 @@ def files_equal(full_file_path_a: Path | str, full_file_path_b: Path | str) -> b
     """
     if not (os.path.isfile(full_file_path_a) and os.path.isfile(full_file_path_b)):
         return False
-    if os.path.getsize(full_file_path_a) != os.path.getsize(full_file_path_b):
+    if os.path.samefile(full_file_path_a, full_file_path_b):
+        return True
+
+    file_size = os.path.getsize(full_file_path_a)
+    if file_size != os.path.getsize(full_file_path_b):
         return False
-    if get_file_md5_hash(full_file_path_a) != get_file_md5_hash(full_file_path_b):
+    if _sampled_blocks(full_file_path_a, file_size) != _sampled_blocks(full_file_path_b, file_size):
         return False
-    return True
+
+    # The sampled blocks cover the entire file
+    if file_size <= 3 * _SAMPLE_BLOCK_BYTES:
+        return True
+
+    content_hashes = content_hashes or FileContentHashes()
+    return content_hashes.get(full_file_path_a) == content_hashes.get(full_file_path_b)
 
 
 class FileMetadata:
@@ -359,11 +493,26 @@ class FileHandler:
     Performs and tracks all file moving/copying/deleting
     """
 
-    def __init__(self, working_directory: str, output_directory: str, dry_run: bool):
+    # Changes each time files are written, moved, or deleted. Used to invalidate snapshots of
+    # directory listings. Tracked per directory, with a separate version for changes made to
+    # directories that are not known
+    _FILES_VERSION_COUNTER = itertools.count(1)
+    _FILES_VERSION: int = 0
+    _DIRECTORY_FILES_VERSIONS: Dict[str, int] = {}
+
+    def __init__(
+        self,
+        working_directory: str,
+        output_directory: str,
+        dry_run: bool,
+        copy_strategy: str = "copy",
+    ):
         self.dry_run = dry_run
         self.working_directory = working_directory
         self.output_directory = output_directory
+        self.copy_strategy = copy_strategy
         self._file_handler_transaction_log = FileHandlerTransactionLog()
+        self.content_hashes = FileContentHashes()
 
     @property
     def file_handler_transaction_log(self) -> FileHandlerTransactionLog:
@@ -405,7 +554,109 @@ class FileHandler:
         return cls.is_file_existent(file_path) and os.access(file_path, os.R_OK)
 
     @classmethod
-    def copy(cls, src_file_path: Union[str, Path], dst_file_path: Union[str, Path]):
+    def mark_files_changed(cls, directory: Optional[Union[str, Path]] = None) -> None:
+        """
+        Records that files were written, moved, or deleted. Must be called when files are changed
+        without FileHandler, i.e. by ffmpeg or yt-dlp.
+
+        Parameters
+        ----------
+        directory
+            Optional. Directory containing the changed files. Marks files in every directory as
+            changed if not known
+        """
+        files_version = next(cls._FILES_VERSION_COUNTER)
+        if directory is None:
+            cls._FILES_VERSION = files_version
+        else:
+            cls._DIRECTORY_FILES_VERSIONS[os.path.abspath(directory)] = files_version
+
+    @classmethod
+    def files_version(cls, directory: Union[str, Path]) -> int:
+        """
+        Parameters
+        ----------
+        directory
+            Directory to get the version of
+
+        Returns
+        -------
+        Version that changes whenever files in the directory get written, moved, or deleted.
+        Listings of the directory taken at the same version are still up to date.
+        """
+        return max(
+            cls._FILES_VERSION,
+            cls._DIRECTORY_FILES_VERSIONS.get(os.path.abspath(directory), 0),
+        )
+
+    @classmethod
+    def _hardlink_file(cls, src_file_path: Union[str, Path], dst_file_path: str) -> bool:
+        try:
+            os.link(src=src_file_path, dst=dst_file_path)
+        except OSError:
+            # Different filesystems, or hardlinks are not supported by it
+            return False
+        return True
+
+    @classmethod
+    def _reflink_file(cls, src_file_path: Union[str, Path], dst_file_path: str) -> bool:
+        if IS_WINDOWS:
+            return False
+        try:
+            with open(src_file_path, "rb") as src, open(dst_file_path, "wb") as dst:
+                # pylint: disable=possibly-used-before-assignment
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            # Not a copy-on-write filesystem, or the files reside on different ones
+            return False
+        return True
+
+    @classmethod
+    def _copy_file_range(cls, src_file_path: Union[str, Path], dst_file_path: str) -> bool:
+        if not hasattr(os, "copy_file_range"):
+            return False
+        try:
+            with open(src_file_path, "rb") as src, open(dst_file_path, "wb") as dst:
+                src_size = os.fstat(src.fileno()).st_size
+                while os.copy_file_range(src.fileno(), dst.fileno(), _COPY_FILE_RANGE_CHUNK_BYTES):
+                    pass
+                # Some filesystems report no bytes copied rather than erroring
+                return os.fstat(dst.fileno()).st_size == src_size
+        except OSError:
+            return False
+
+    @classmethod
+    def _copy_file(
+        cls,
+        src_file_path: Union[str, Path],
+        dst_file_path: str,
+        copy_strategy: str,
+        allow_hardlink: bool,
+    ):
+        """
+        Copies the file using the given copy strategy, falling back to a regular copy if the
+        strategy is not supported by the file's filesystem.
+        """
+        if copy_strategy == "hardlink" and allow_hardlink:
+            if cls._hardlink_file(src_file_path, dst_file_path):
+                return
+
+        if copy_strategy == "reflink":
+            if cls._reflink_file(src_file_path, dst_file_path):
+                return
+            if cls._copy_file_range(src_file_path, dst_file_path):
+                return
+
+        shutil.copyfile(src=src_file_path, dst=dst_file_path)
+
+    @classmethod
+    def copy(
+        cls,
+        src_file_path: Union[str, Path],
+        dst_file_path: Union[str, Path],
+        copy_strategy: str = "copy",
+        allow_hardlink: bool = False,
+    ):
         """
         Parameters
         ----------
@@ -413,12 +664,27 @@ class FileHandler:
             Source file
         dst_file_path
             Destination file
+        copy_strategy
+            Optional. How to copy the file, one of ``copy``, ``reflink``, or ``hardlink``.
+            Defaults to a regular copy
+        allow_hardlink
+            Optional. Whether the destination can be a hardlink of the source when using the
+            ``hardlink`` copy strategy. Only allow if neither file gets modified in-place after.
         """
         # Perform the copy by first writing to a temp file, then moving it.
         # This tries to prevent corrupted writes if the processed dies mid-write,
         atomic_dst = f"{dst_file_path}-ytdl-sub-incomplete"
-        shutil.copyfile(src=src_file_path, dst=atomic_dst)
-        shutil.move(src=atomic_dst, dst=dst_file_path)
+        cls.delete(atomic_dst)
+        try:
+            cls._copy_file(
+                src_file_path,
+                atomic_dst,
+                copy_strategy=copy_strategy,
+                allow_hardlink=allow_hardlink,
+            )
+            shutil.move(src=atomic_dst, dst=dst_file_path)
+        finally:
+            cls.mark_files_changed(os.path.dirname(dst_file_path))
 
     @classmethod
     def move(cls, src_file_path: Union[str, Path], dst_file_path: Union[str, Path]):
@@ -437,6 +703,8 @@ class FileHandler:
         """
         try:
             shutil.move(src=src_file_path, dst=dst_file_path)
+            cls.mark_files_changed(os.path.dirname(src_file_path))
+            cls.mark_files_changed(os.path.dirname(dst_file_path))
         except OSError:
             # Invalid cross-device link
             # Can happen from using os.rename under the hood, which requires the two file on the
@@ -454,6 +722,7 @@ class FileHandler:
         """
         if os.path.isfile(file_path):
             os.remove(file_path)
+            cls.mark_files_changed(os.path.dirname(file_path))
 
     @classmethod
     def set_mtime(cls, file_path: Union[str, Path], mtime: float):
@@ -511,7 +780,9 @@ class FileHandler:
             os.path.isfile(output_file_path)
             and output_file_name not in self.file_handler_transaction_log.files_created
         ):
-            if not files_equal(source_file_path, output_file_path):
+            if not files_equal(
+                source_file_path, output_file_path, content_hashes=self.content_hashes
+            ):
                 self.file_handler_transaction_log.log_modified_file(
                     file_name=output_file_name, file_metadata=file_metadata
                 )
@@ -525,9 +796,16 @@ class FileHandler:
         if not self.dry_run:
             os.makedirs(os.path.dirname(output_file_path), exist_ok=True)
             if copy_file:
-                self.copy(src_file_path=source_file_path, dst_file_path=output_file_path)
+                # Output files only ever get replaced, never modified in-place
+                self.copy(
+                    src_file_path=source_file_path,
+                    dst_file_path=output_file_path,
+                    copy_strategy=self.copy_strategy,
+                    allow_hardlink=True,
+                )
             else:
                 self.move(src_file_path=source_file_path, dst_file_path=output_file_path)
+            self.content_hashes.rekey(source_file_path, output_file_path)
         # Simulate the file being moved during dry run by deleting it
         elif self.dry_run and not copy_file:
             FileHandler.delete(source_file_path)
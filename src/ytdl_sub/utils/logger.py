@@ -1,16 +1,20 @@
 import contextlib
+import functools
 import io
 import logging
 import sys
 import tempfile
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, Any, Callable, Iterator, List, Optional, TextIO, TypeVar
 
 from ytdl_sub import __local_version__
 from ytdl_sub.utils.exceptions import ValidationException
 from ytdl_sub.utils.file_handler import FileHandler
 
+TypeT = TypeVar("TypeT")
+
 
 @dataclass
 class LoggerLevel:
@@ -82,6 +86,68 @@ class StreamToLogger(io.StringIO):
         return super().write(__s)
 
 
+class _ThreadLocalLogs(threading.local):
+    def __init__(self):
+        super().__init__()
+        self.debug_log_file: Optional[IO[str]] = None
+        self.redirect_streams: List[StreamToLogger] = []
+
+
+_THREAD_LOCAL_LOGS = _ThreadLocalLogs()
+
+
+class _RedirectedStream:
+    """
+    Replaces sys.stdout/sys.stderr while any thread is redirecting external logs. Writes go to the
+    calling thread's innermost redirect. Threads without one (i.e. helper threads spawned by
+    yt-dlp) use the most recently started redirect, or the original stream if there are none.
+    """
+
+    def __init__(self, original: TextIO, active_redirects: List[StreamToLogger]):
+        self._original = original
+        self._active_redirects = active_redirects
+
+    def _target(self) -> TextIO:
+        if _THREAD_LOCAL_LOGS.redirect_streams:
+            return _THREAD_LOCAL_LOGS.redirect_streams[-1]
+        if self._active_redirects:
+            return self._active_redirects[-1]
+        return self._original
+
+    def write(self, __s: str) -> int:
+        """
+        Writes to the target stream
+        """
+        return self._target().write(__s)
+
+    def flush(self) -> None:
+        """
+        Flushes the target stream
+        """
+        self._target().flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+
+class _DebugFileHandler(logging.FileHandler):
+    """
+    Writes to the calling thread's separate debug log if one is set, and the shared debug log
+    file otherwise.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if (debug_log_file := _THREAD_LOCAL_LOGS.debug_log_file) is None:
+            super().emit(record)
+            return
+
+        try:
+            debug_log_file.write(self.format(record) + self.terminator)
+            debug_log_file.flush()
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+
 class Logger:
     # The level set via CLI arguments
     _LOGGER_LEVEL: LoggerLevel = LoggerLevels.DEBUG
@@ -95,13 +161,22 @@ class Logger:
     # Keep track of all Loggers created
     _LOGGERS: List[logging.Logger] = []
 
+    # Guards swapping sys.stdout/sys.stderr and appending to the error log across threads
+    _LOCK = threading.Lock()
+    _ACTIVE_REDIRECTS: List[StreamToLogger] = []
+    _ORIGINAL_STDOUT: TextIO = sys.stdout
+    _ORIGINAL_STDERR: TextIO = sys.stderr
+
     @classmethod
     def debug_log_filename(cls) -> str:
         """
         Returns
         -------
-        File name of the debug log file
+        File name of the debug log file. If the calling thread is within
+        ``separate_debug_log``, returns that thread's debug log file instead.
         """
+        if (debug_log_file := _THREAD_LOCAL_LOGS.debug_log_file) is not None:
+            return debug_log_file.name
         return cls._DEBUG_LOGGER_FILE.name
 
     @classmethod
@@ -146,7 +221,7 @@ class Logger:
 
     @classmethod
     def _get_debug_file_handler(cls) -> logging.FileHandler:
-        handler = logging.FileHandler(filename=cls.debug_log_filename(), encoding="utf-8")
+        handler = _DebugFileHandler(filename=cls._DEBUG_LOGGER_FILE.name, encoding="utf-8")
         handler.setLevel(logging.DEBUG)
         handler.setFormatter(cls._get_formatter())
         return handler
@@ -202,16 +277,83 @@ class Logger:
 
         with StreamToLogger(logger=logger) as redirect_stream:
             try:
-                with contextlib.redirect_stdout(new_target=redirect_stream):
-                    with contextlib.redirect_stderr(new_target=redirect_stream):
-                        yield
+                with cls._redirect_stdout_and_stderr(redirect_stream):
+                    yield
             finally:
                 redirect_stream.flush()
 
+    @classmethod
+    @contextlib.contextmanager
+    def _redirect_stdout_and_stderr(cls, redirect_stream: StreamToLogger) -> Iterator[None]:
+        """
+        Thread-safe equivalent of contextlib.redirect_stdout + redirect_stderr. Swapping
+        sys.stdout per-thread would clobber other threads' redirects, so it is replaced once by a
+        _RedirectedStream for as long as any thread is redirecting.
+        """
+        with cls._LOCK:
+            if not cls._ACTIVE_REDIRECTS:
+                cls._ORIGINAL_STDOUT, cls._ORIGINAL_STDERR = sys.stdout, sys.stderr
+                sys.stdout = _RedirectedStream(sys.stdout, cls._ACTIVE_REDIRECTS)
+                sys.stderr = _RedirectedStream(sys.stderr, cls._ACTIVE_REDIRECTS)
+            cls._ACTIVE_REDIRECTS.append(redirect_stream)
+        _THREAD_LOCAL_LOGS.redirect_streams.append(redirect_stream)
+
+        try:
+            yield
+        finally:
+            _THREAD_LOCAL_LOGS.redirect_streams.pop()
+            with cls._LOCK:
+                cls._ACTIVE_REDIRECTS.remove(redirect_stream)
+                if not cls._ACTIVE_REDIRECTS:
+                    sys.stdout, sys.stderr = cls._ORIGINAL_STDOUT, cls._ORIGINAL_STDERR
+
+    @classmethod
+    @contextlib.contextmanager
+    def separate_debug_log(cls) -> Iterator[str]:
+        """
+        Writes all debug logs from the calling thread to their own file instead of the shared
+        one, so concurrent subscriptions each get a debug log of their own. The file gets
+        deleted on exit.
+
+        Yields
+        ------
+        File name of the thread's debug log
+        """
+        with tempfile.NamedTemporaryFile(
+            mode="w", encoding="utf-8", prefix="ytdl-sub.", delete=False
+        ) as debug_log_file:
+            _THREAD_LOCAL_LOGS.debug_log_file = debug_log_file
+            try:
+                yield debug_log_file.name
+            finally:
+                _THREAD_LOCAL_LOGS.debug_log_file = None
+                debug_log_file.close()
+                FileHandler.delete(debug_log_file.name)
+
+    @classmethod
+    def with_current_debug_log(cls, func: Callable[..., TypeT]) -> Callable[..., TypeT]:
+        """
+        Wraps a function that runs on another thread so that its debug logs go to the calling
+        thread's debug log, i.e. the one of the subscription that spawned the thread.
+        """
+        debug_log_file = _THREAD_LOCAL_LOGS.debug_log_file
+
+        @functools.wraps(func)
+        def _func_with_debug_log(*args, **kwargs) -> TypeT:
+            previous_debug_log_file = _THREAD_LOCAL_LOGS.debug_log_file
+            _THREAD_LOCAL_LOGS.debug_log_file = debug_log_file
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _THREAD_LOCAL_LOGS.debug_log_file = previous_debug_log_file
+
+        return _func_with_debug_log
+
     @classmethod
     def _append_to_error_log(cls):
         # Any time an exception occurs, dump all debug logs into the error log
         with (
+            cls._LOCK,
             open(cls.debug_log_filename(), mode="r", encoding="utf-8") as debug_logs,
             open(cls.error_log_filename(), mode="a", encoding="utf-8") as error_logs,
         ):
@@ -260,9 +402,18 @@ class Logger:
     @classmethod
     def cleanup(cls, has_error: bool = False):
         """
-        Cleans up debug log file left behind
+        Cleans up debug log file left behind. Within ``separate_debug_log``, only closes the
+        calling thread's debug log and appends it to the error log if there is an error, since
+        other threads still use the shared loggers and log files.
         """
-        for logger in cls._LOGGERS:
+        if (debug_log_file := _THREAD_LOCAL_LOGS.debug_log_file) is not None:
+            debug_log_file.flush()
+            if has_error:
+                cls._append_to_error_log()
+            debug_log_file.close()
+            return
+
+        for logger in list(cls._LOGGERS):
             for handler in logger.handlers:
                 handler.close()
 
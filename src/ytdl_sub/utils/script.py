@@ -9,8 +9,16 @@ from ytdl_sub.script.parser import parse
 from ytdl_sub.script.types.array import Array, UnresolvedArray
 from ytdl_sub.script.types.function import BuiltInFunction, Function
 from ytdl_sub.script.types.map import Map, UnresolvedMap
-from ytdl_sub.script.types.resolvable import Argument, Boolean, Float, Integer, Lambda, String
-from ytdl_sub.script.types.syntax_tree import SyntaxTree
+from ytdl_sub.script.types.resolvable import (
+    Argument,
+    Boolean,
+    Float,
+    Integer,
+    Lambda,
+    Resolvable,
+    String,
+)
+from ytdl_sub.script.types.syntax_tree import ResolvedSyntaxTree, SyntaxTree
 from ytdl_sub.script.types.variable import Variable
 from ytdl_sub.script.utils.exceptions import UNREACHABLE
 from ytdl_sub.script.utils.name_validation import is_function
@@ -72,6 +80,57 @@ class ScriptUtils:
 
         return out
 
+    @classmethod
+    def _to_json_like_resolvable(cls, value: Any, sort_keys: bool) -> Resolvable:
+        # Mirrors %from_json(...) type conversion so the output is identical to
+        # dumping the value via to_script and resolving it
+        if value is None:
+            return String("")
+        if isinstance(value, Resolvable):
+            # Already converted, i.e. shared between multiple values
+            return value
+        if isinstance(value, int):
+            return Integer(value)
+        if isinstance(value, float):
+            return Float(value)
+        if isinstance(value, str):
+            return String(value)
+        if isinstance(value, (list, tuple)):
+            return Array([cls._to_json_like_resolvable(val, sort_keys=sort_keys) for val in value])
+        if isinstance(value, dict):
+            items = sorted(value.items(), key=lambda item: item[0]) if sort_keys else value.items()
+            return Map(
+                {
+                    # JSON keys are always strings
+                    String(key if isinstance(key, str) else json.dumps(key)): (
+                        cls._to_json_like_resolvable(val, sort_keys=sort_keys)
+                    )
+                    for key, val in items
+                }
+            )
+
+        raise UNREACHABLE
+
+    @classmethod
+    def to_resolvable(cls, value: Any, sort_keys: bool = True) -> Resolvable:
+        """
+        Converts a native python value directly into a Resolvable, without
+        serializing it into script and parsing it back. Strings are treated as literals.
+        """
+        if isinstance(value, bool):
+            return Boolean(value)
+        return cls._to_json_like_resolvable(value, sort_keys=sort_keys)
+
+    @classmethod
+    def to_syntax_tree(cls, value: Any, sort_keys: bool = True) -> SyntaxTree:
+        """
+        Converts a python value to a SyntaxTree. Strings are parsed as script, any other
+        native value is converted directly to an already-resolved SyntaxTree.
+        """
+        if isinstance(value, str):
+            return parse(text=value)
+        return ResolvedSyntaxTree(ast=[cls.to_resolvable(value, sort_keys=sort_keys)])
+
     @classmethod
     def _to_script_argument(cls, value: Any) -> Argument:
         # Handle simple types as above
@@ -1,12 +1,13 @@
-import copy
 from abc import ABC
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, FrozenSet, Optional, Set
 
 from ytdl_sub.entries.script.function_scripts import CUSTOM_FUNCTION_SCRIPTS
 from ytdl_sub.entries.script.variable_definitions import UNRESOLVED_VARIABLES, VARIABLE_SCRIPTS
 from ytdl_sub.entries.script.variable_types import Variable
 from ytdl_sub.entries.variables.override_variables import REQUIRED_OVERRIDE_VARIABLE_DEFINITIONS
 from ytdl_sub.script.script import Script
+from ytdl_sub.script.types.resolvable import Resolvable
+from ytdl_sub.script.types.syntax_tree import SyntaxTree
 from ytdl_sub.script.utils.exceptions import RuntimeException
 from ytdl_sub.utils.exceptions import StringFormattingException
 from ytdl_sub.utils.script import ScriptUtils
@@ -26,6 +27,8 @@ class Scriptable(ABC):
     def __init__(self, initialize_base_script: bool = False):
         self._script: Optional[Script] = None
         self._unresolvable: Optional[Set[str]] = None
+        # Variables defined by the user rather than built into ytdl-sub
+        self._user_variable_names: FrozenSet[str] = frozenset()
 
         if initialize_base_script:
             self.initialize_base_script()
@@ -34,8 +37,8 @@ class Scriptable(ABC):
         """
         Initializes with base values
         """
-        self._script = copy.deepcopy(BASE_SCRIPT)
-        self._unresolvable = copy.deepcopy(UNRESOLVED_VARIABLES)
+        self._script = BASE_SCRIPT.fork()
+        self._unresolvable = set(UNRESOLVED_VARIABLES)
 
     @property
     def script(self) -> Script:
@@ -53,6 +56,13 @@ class Scriptable(ABC):
         assert self._unresolvable is not None, "Not initialized"
         return self._unresolvable
 
+    @property
+    def user_variable_names(self) -> FrozenSet[str]:
+        """
+        Names of the variables defined by the user, i.e. overrides, rather than built-in ones
+        """
+        return self._user_variable_names
+
     def update_script(self) -> None:
         """
         Updates any potential variables to a resolvable. This is done
@@ -60,6 +70,49 @@ class Scriptable(ABC):
         """
         self.script.resolve(unresolvable=self.unresolvable, update=True)
 
+    # pylint: disable=unused-argument
+    def _before_variables_added(self, variable_names: Set[str]) -> None:
+        """
+        Called before variables are added to the script
+        """
+
+    def _on_variables_added(self, variable_names: Set[str]) -> None:
+        """
+        Called after variables are added to the script
+        """
+        self.update_script()
+
+    # pylint: enable=unused-argument
+
+    def _get_resolved(self, variable_name: str) -> Resolvable:
+        """
+        Returns
+        -------
+        The resolved variable. Raises a RuntimeException if it cannot be resolved.
+        """
+        return self.script.get(variable_name=variable_name)
+
+    def _get_all_resolved(self, variable_names: Set[str]) -> Dict[str, Resolvable]:
+        """
+        Returns
+        -------
+        Resolved variables, including at least the given ones. Raises a
+        ScriptVariableNotResolved if any of them cannot be resolved.
+        """
+        return self.script.resolve_subset(
+            variable_names=variable_names, unresolvable=self.unresolvable
+        ).output
+
+    def resolve_parsed(self, definition: SyntaxTree) -> Resolvable:
+        """
+        Resolves an already parsed and validated definition, like a formatter, without adding it
+        to the script.
+        """
+        return self.script.resolve_parsed(
+            definition=definition,
+            resolved=self._get_all_resolved(self.script.variable_dependencies(definition)),
+        )
+
     def add(self, values: Dict[str | Variable, Any]) -> None:
         """
         Add new values to the script
@@ -69,21 +122,32 @@ class Scriptable(ABC):
             for var, definition in values.items()
         }
 
+        self._before_variables_added(variable_names=set(values_as_str.keys()))
         self._unresolvable -= set(list(values_as_str.keys()))
-        self.script.add(
-            ScriptUtils.add_sanitized_variables(
-                {
-                    name: ScriptUtils.to_script(definition)
-                    for name, definition in values_as_str.items()
-                }
-            ),
-            unresolvable=self.unresolvable,
+
+        # Native values (i.e. metadata lists/dicts) are converted directly into resolved
+        # definitions. Only strings need to be parsed as script.
+        parsed_variables = ScriptUtils.add_sanitized_parsed_variables(
+            {
+                name: ScriptUtils.to_syntax_tree(definition)
+                for name, definition in values_as_str.items()
+                if not isinstance(definition, str)
+            }
         )
-        self.update_script()
+        string_variables = ScriptUtils.add_sanitized_variables(
+            {
+                name: definition
+                for name, definition in values_as_str.items()
+                if isinstance(definition, str)
+            }
+        )
+        self.script.add_parsed(parsed_variables)
+        self.script.add(string_variables, unresolvable=self.unresolvable)
+        self._on_variables_added(variable_names=parsed_variables.keys() | string_variables.keys())
 
         for name, definition in values_as_str.items():
             try:
-                _ = self.script.get(variable_name=name)
+                _ = self._get_resolved(variable_name=name)
             except RuntimeException as exc:
                 raise StringFormattingException(
                     f"Tried to create the variable with name {name} and definition:\n"
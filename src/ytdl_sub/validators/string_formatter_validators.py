@@ -276,6 +276,12 @@ def _validate_formatter(
             f"formatter: {', '.join(sorted(unresolved))}"
         )
 
+    # Validate once here so the parsed formatter can be resolved directly at runtime
+    try:
+        mock_script.validate_parsed(name=formatter_validator.leaf_name, definition=parsed)
+    except UserException as exc:
+        raise formatter_validator._validation_exception(exc) from exc
+
     if partial_resolve_entry_formatters and not is_static_formatter:
         parsed = mock_script.resolve_partial_once(
             variable_definitions={"tmp_var": formatter_validator.parsed},
@@ -1,18 +1,26 @@
-import copy
+# pylint: disable=too-many-lines
 import json
 import os.path
+import sqlite3
 import time
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional, Set, Tuple
 
 from yt_dlp import DateRange
 from yt_dlp.utils import make_archive_id
 
 from ytdl_sub.entries.entry import Entry, ytdl_sub_split_by_chapters_parent_uid
 from ytdl_sub.entries.script.variable_definitions import VARIABLES, VariableDefinitions
-from ytdl_sub.utils.file_handler import FileHandler, FileHandlerTransactionLog, FileMetadata
+from ytdl_sub.utils.file_handler import (
+    FileContentHashes,
+    FileHandler,
+    FileHandlerTransactionLog,
+    FileMetadata,
+)
 from ytdl_sub.utils.logger import Logger
 
 logger = Logger.get("archive")
@@ -79,6 +87,101 @@ class DownloadMapping:
         )
 
 
+class _EntryMappingIndex(MutableMapping[str, DownloadMapping]):
+    """
+    Dict of entry_id: mapping that keeps a per-upload-date count and an upload-date-sorted view
+    of its entries in sync on every insert and delete.
+    """
+
+    def __init__(self, entry_mappings: Optional[Dict[str, DownloadMapping]] = None):
+        self._mappings: Dict[str, DownloadMapping] = {}
+        self._upload_date_counts: Counter = Counter()
+        # (upload_date, -insertion_order, uid) in ascending order. Negating the insertion order
+        # makes a reversed walk go newest-first while keeping same-date entries in insertion
+        # order, which matches a stable sort of the dict by upload date.
+        self._sorted_keys: List[Tuple[str, int, str]] = []
+        self._sort_key_by_uid: Dict[str, Tuple[str, int, str]] = {}
+        self._num_insertions = 0
+
+        for uid, mapping in (entry_mappings or {}).items():
+            self[uid] = mapping
+
+    def __getitem__(self, uid: str) -> DownloadMapping:
+        return self._mappings[uid]
+
+    def __setitem__(self, uid: str, mapping: DownloadMapping) -> None:
+        if (
+            self._mappings.get(uid) is mapping
+            and self._sort_key_by_uid[uid][0] == mapping.upload_date
+        ):
+            return
+
+        if uid in self._mappings:
+            insertion_order = self._unindex(uid)[1]
+        else:
+            self._num_insertions += 1
+            insertion_order = -self._num_insertions
+
+        sort_key = (mapping.upload_date, insertion_order, uid)
+        insort(self._sorted_keys, sort_key)
+        self._sort_key_by_uid[uid] = sort_key
+        self._upload_date_counts[mapping.upload_date] += 1
+        self._mappings[uid] = mapping
+
+    def __delitem__(self, uid: str) -> None:
+        self._unindex(uid)
+        del self._mappings[uid]
+
+    def __contains__(self, uid: object) -> bool:
+        return uid in self._mappings
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._mappings)
+
+    def __len__(self) -> int:
+        return len(self._mappings)
+
+    def _unindex(self, uid: str) -> Tuple[str, int, str]:
+        sort_key = self._sort_key_by_uid.pop(uid)
+        del self._sorted_keys[bisect_left(self._sorted_keys, sort_key)]
+
+        self._upload_date_counts[sort_key[0]] -= 1
+        if self._upload_date_counts[sort_key[0]] == 0:
+            del self._upload_date_counts[sort_key[0]]
+
+        return sort_key
+
+    def count_upload_date(self, upload_date: str) -> int:
+        """
+        Returns
+        -------
+        Number of entries with this upload date
+        """
+        return self._upload_date_counts[upload_date]
+
+    def uids_outside_upload_dates(self, start: str, end: str) -> List[str]:
+        """
+        Returns
+        -------
+        Entry ids whose upload date is before start or after end, oldest first
+        """
+        num_before = bisect_left(self._sorted_keys, start, key=lambda sort_key: sort_key[0])
+        num_until_end = bisect_right(self._sorted_keys, end, key=lambda sort_key: sort_key[0])
+        return [
+            sort_key[2]
+            for sort_key in self._sorted_keys[:num_before] + self._sorted_keys[num_until_end:]
+        ]
+
+    def newest_uids_after(self, num_entries: int) -> List[str]:
+        """
+        Returns
+        -------
+        Entry ids ordered newest-first by upload date, skipping the first num_entries
+        """
+        num_remaining = max(len(self._sorted_keys) - num_entries, 0)
+        return [sort_key[2] for sort_key in reversed(self._sorted_keys[:num_remaining])]
+
+
 class DownloadArchive:
     """
     Class to handle any operations to the ytdl download archive. Try to keep it as barebones as
@@ -147,13 +250,13 @@ class DownloadArchive:
 
 
 class DownloadMappings:
-    _strptime_format = "%Y-%m-%d"
-
     def __init__(self):
         """
         Initializes an empty mapping
         """
-        self._entry_mappings: Dict[str, DownloadMapping] = {}
+        self._entry_mappings = _EntryMappingIndex()
+        # Entry ids changed since the last write, in the order they were changed
+        self._unsaved_uids: Dict[str, None] = {}
 
     @classmethod
     def from_file(cls, json_file_path: str) -> "DownloadMappings":
@@ -170,17 +273,17 @@ class DownloadMappings:
         with open(json_file_path, "r", encoding="utf8") as json_file:
             entry_mappings_json = json.load(json_file)
 
-        for uid in entry_mappings_json.keys():
-            entry_mappings_json[uid] = DownloadMapping.from_dict(
-                mapping_dict=entry_mappings_json[uid]
-            )
-
         download_mappings = DownloadMappings()
-        download_mappings._entry_mappings = entry_mappings_json
+        download_mappings._entry_mappings = _EntryMappingIndex(
+            entry_mappings={
+                uid: DownloadMapping.from_dict(mapping_dict=mapping_dict)
+                for uid, mapping_dict in entry_mappings_json.items()
+            }
+        )
         return download_mappings
 
     @property
-    def entry_mappings(self) -> Dict[str, DownloadMapping]:
+    def entry_mappings(self) -> MutableMapping[str, DownloadMapping]:
         """
         Returns
         -------
@@ -225,10 +328,12 @@ class DownloadMappings:
         if parent_uid := entry.try_get(ytdl_sub_split_by_chapters_parent_uid, str):
             uid = parent_uid
 
-        if uid not in self.entry_ids:
-            self._entry_mappings[uid] = DownloadMapping.from_entry(entry=entry)
+        mapping = self._entry_mappings.get(uid) or DownloadMapping.from_entry(entry=entry)
+        mapping.file_names.add(entry_file_path)
 
-        self._entry_mappings[uid].file_names.add(entry_file_path)
+        # Always (re)assign so storage-backed mappings persist the added file name
+        self._entry_mappings[uid] = mapping
+        self._unsaved_uids[uid] = None
         return self
 
     def remove_entry(self, entry_id: str) -> "DownloadMappings":
@@ -242,8 +347,9 @@ class DownloadMappings:
         -------
         self
         """
-        if entry_id in self.entry_ids:
+        if entry_id in self._entry_mappings:
             del self._entry_mappings[entry_id]
+            self._unsaved_uids[entry_id] = None
         return self
 
     def get_num_entries_with_date(self, standardized_date: str) -> int:
@@ -257,7 +363,7 @@ class DownloadMappings:
         -------
         Number of entries in the mapping with this upload date
         """
-        return len([_ for _ in self._entry_mappings.values() if _.upload_date == standardized_date])
+        return self._entry_mappings.count_upload_date(standardized_date)
 
     def get_num_entries(self) -> int:
         """
@@ -278,17 +384,64 @@ class DownloadMappings:
         -------
         Dict of entry_id: mapping if the upload date is not in the date range
         """
-        out_of_range_entry_mappings = copy.deepcopy(self._entry_mappings)
-        for uid in list(out_of_range_entry_mappings.keys()):
-            upload_date = datetime.strptime(
-                out_of_range_entry_mappings[uid].upload_date,
-                self._strptime_format,
-            ).date()
+        # Standardized upload dates are YYYY-mm-dd, so they sort and compare chronologically
+        # as strings
+        return {
+            uid: self._entry_mappings[uid]
+            for uid in self._entry_mappings.uids_outside_upload_dates(
+                start=date_range.start.isoformat(), end=date_range.end.isoformat()
+            )
+        }
+
+    def has_playlist_indices(self) -> bool:
+        """
+        Returns
+        -------
+        True if any entry in the mapping has a playlist index. False otherwise.
+        """
+        return any(mapping.playlist_index is not None for mapping in self._entry_mappings.values())
 
-            if upload_date in date_range:
-                del out_of_range_entry_mappings[uid]
+    def get_entries_over_max(
+        self, max_entries: int, sort_by: str = "upload_date"
+    ) -> Dict[str, DownloadMapping]:
+        """
+        Parameters
+        ----------
+        max_entries
+            Number of entries to keep
+        sort_by
+            Which entries to keep. "upload_date" (default) keeps the most recent,
+            "playlist_index_asc" the lowest playlist indices, and "playlist_index_desc" the highest.
+            Entries without a playlist index are always the first to go.
 
-        return out_of_range_entry_mappings
+        Returns
+        -------
+        Dict of entry_id: mapping for all entries beyond the first max_entries, in sorted order
+        """
+        if sort_by == "playlist_index_desc":
+            sorted_entries = sorted(
+                self._entry_mappings.items(),
+                key=lambda kv_: (
+                    kv_[1].playlist_index is not None,
+                    kv_[1].playlist_index if kv_[1].playlist_index is not None else 0,
+                ),
+                reverse=True,
+            )
+        elif sort_by == "playlist_index_asc":
+            sorted_entries = sorted(
+                self._entry_mappings.items(),
+                key=lambda kv_: (
+                    kv_[1].playlist_index is None,
+                    kv_[1].playlist_index if kv_[1].playlist_index is not None else 0,
+                ),
+            )
+        else:
+            return {
+                uid: self._entry_mappings[uid]
+                for uid in self._entry_mappings.newest_uids_after(num_entries=max_entries)
+            }
+
+        return dict(sorted_entries[max_entries:])
 
     def to_file(self, output_json_file: str) -> "DownloadMappings":
         """
@@ -318,6 +471,79 @@ class DownloadMappings:
         with open(output_json_file, "w", encoding="utf8") as file:
             file.write(json_str)
 
+        self._unsaved_uids.clear()
+        return self
+
+    def to_journal(self, journal_file_path: str) -> "DownloadMappings":
+        """
+        Appends every entry changed since the last write to a JSON-lines journal as either a
+        ``set`` or ``remove`` operation, then fsyncs it. Much cheaper than ``to_file`` when called
+        per-entry, and replayed on top of the json file via ``replay_journal``.
+
+        Parameters
+        ----------
+        journal_file_path
+            Path to the journal file to append to
+
+        Returns
+        -------
+        self
+        """
+        if not self._unsaved_uids:
+            return self
+
+        operations: List[str] = []
+        for uid in self._unsaved_uids:
+            if uid in self._entry_mappings:
+                operation = {"op": "set", "uid": uid, "mapping": self._entry_mappings[uid].dict}
+            else:
+                operation = {"op": "remove", "uid": uid}
+            operations.append(json.dumps(operation, sort_keys=True) + "\n")
+
+        with open(journal_file_path, "a+b") as file:
+            # Terminate a line left partially written by a crash so it does not corrupt this one
+            if file.seek(0, os.SEEK_END) > 0:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    file.write(b"\n")
+
+            file.write("".join(operations).encode("utf8"))
+            file.flush()
+            os.fsync(file.fileno())
+
+        self._unsaved_uids.clear()
+        return self
+
+    def replay_journal(self, journal_file_path: str) -> "DownloadMappings":
+        """
+        Parameters
+        ----------
+        journal_file_path
+            Path to a journal file written by ``to_journal``
+
+        Returns
+        -------
+        self
+        """
+        with open(journal_file_path, "r", encoding="utf8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+
+                try:
+                    operation = json.loads(line)
+                except json.JSONDecodeError:
+                    # Only possible for a line that was partially written during a crash
+                    logger.warning("Skipping partially written line in %s", journal_file_path)
+                    continue
+
+                if operation["op"] == "remove":
+                    self._entry_mappings.pop(operation["uid"], None)
+                else:
+                    self._entry_mappings[operation["uid"]] = DownloadMapping.from_dict(
+                        mapping_dict=operation["mapping"]
+                    )
+
         return self
 
     def to_download_archive(self) -> DownloadArchive:
@@ -334,6 +560,285 @@ class DownloadMappings:
         return DownloadArchive(download_archive_lines=lines)
 
 
+SQLITE_ARCHIVE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS download_mappings (
+    subscription TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    upload_date TEXT NOT NULL,
+    extractor TEXT NOT NULL,
+    file_names TEXT NOT NULL,
+    playlist_index INTEGER,
+    PRIMARY KEY (subscription, uid)
+);
+CREATE INDEX IF NOT EXISTS download_mappings_upload_date
+    ON download_mappings (subscription, upload_date);
+CREATE INDEX IF NOT EXISTS download_mappings_playlist_index
+    ON download_mappings (subscription, playlist_index);
+CREATE TABLE IF NOT EXISTS file_content_hashes (
+    file_path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL
+);
+"""
+
+_SQLITE_COLUMNS = "uid, upload_date, extractor, file_names, playlist_index"
+
+_SQLITE_KEEP_MAX_ORDER_BY: Dict[str, str] = {
+    "upload_date": "upload_date DESC",
+    "playlist_index_asc": "playlist_index IS NULL, playlist_index ASC",
+    "playlist_index_desc": "playlist_index IS NULL, playlist_index DESC",
+}
+
+
+def is_sqlite_archive(file_name: str) -> bool:
+    """
+    Returns
+    -------
+    True if the download archive file name refers to a SQLite database. False otherwise.
+    """
+    return file_name.lower().endswith(SQLITE_ARCHIVE_EXTENSIONS)
+
+
+class _SqliteEntryMappings(MutableMapping[str, DownloadMapping]):
+    """
+    Dict of entry_id: mapping for a single subscription, stored in a SQLite table
+    """
+
+    def __init__(self, connection: sqlite3.Connection, subscription_name: str):
+        self._connection = connection
+        self._subscription_name = subscription_name
+
+    @classmethod
+    def _to_mapping(cls, row: Tuple[str, str, str, str, Optional[int]]) -> DownloadMapping:
+        return DownloadMapping(
+            upload_date=row[1],
+            extractor=row[2],
+            file_names=set(json.loads(row[3])),
+            playlist_index=row[4],
+        )
+
+    def select(
+        self, condition: str = "1", params: Tuple = (), suffix: str = ""
+    ) -> Dict[str, DownloadMapping]:
+        """
+        Returns
+        -------
+        Dict of entry_id: mapping for this subscription's entries matching the SQL condition,
+        ordered by insertion unless the suffix says otherwise
+        """
+        rows = self._connection.execute(
+            f"SELECT {_SQLITE_COLUMNS} FROM download_mappings "
+            f"WHERE subscription = ? AND ({condition}) {suffix or 'ORDER BY rowid'}",
+            (self._subscription_name, *params),
+        ).fetchall()
+        return {row[0]: self._to_mapping(row) for row in rows}
+
+    def count(self, condition: str = "1", params: Tuple = ()) -> int:
+        """
+        Returns
+        -------
+        Number of this subscription's entries matching the SQL condition
+        """
+        return self._connection.execute(
+            f"SELECT COUNT(*) FROM download_mappings WHERE subscription = ? AND ({condition})",
+            (self._subscription_name, *params),
+        ).fetchone()[0]
+
+    def __getitem__(self, uid: str) -> DownloadMapping:
+        if not (mappings := self.select("uid = ?", (uid,))):
+            raise KeyError(uid)
+        return mappings[uid]
+
+    def __setitem__(self, uid: str, mapping: DownloadMapping) -> None:
+        # Upsert rather than replace to keep the rowid, which orders entries by insertion
+        self._connection.execute(
+            f"INSERT INTO download_mappings (subscription, {_SQLITE_COLUMNS}) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (subscription, uid) DO UPDATE SET "
+            "upload_date = excluded.upload_date, "
+            "extractor = excluded.extractor, "
+            "file_names = excluded.file_names, "
+            "playlist_index = excluded.playlist_index",
+            (
+                self._subscription_name,
+                uid,
+                mapping.upload_date,
+                mapping.extractor,
+                json.dumps(sorted(mapping.file_names)),
+                mapping.playlist_index,
+            ),
+        )
+
+    def __delitem__(self, uid: str) -> None:
+        cursor = self._connection.execute(
+            "DELETE FROM download_mappings WHERE subscription = ? AND uid = ?",
+            (self._subscription_name, uid),
+        )
+        if cursor.rowcount == 0:
+            raise KeyError(uid)
+
+    def __contains__(self, uid: object) -> bool:
+        return self.count("uid = ?", (uid,)) > 0
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.select().keys())
+
+    def __len__(self) -> int:
+        return self.count()
+
+
+class _SqliteFileContentHashes(FileContentHashes):
+    """
+    Content hash cache stored in a SQLite table, so output files that are unchanged between
+    downloads do not get rehashed
+    """
+
+    def __init__(self, connection: sqlite3.Connection):
+        super().__init__()
+        self._connection = connection
+
+    def _lookup(self, file_path: str) -> Optional[Tuple[int, int, str]]:
+        return self._connection.execute(
+            "SELECT size, mtime_ns, content_hash FROM file_content_hashes WHERE file_path = ?",
+            (file_path,),
+        ).fetchone()
+
+    def _store(self, file_path: str, size: int, mtime_ns: int, content_hash: str) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO file_content_hashes (file_path, size, mtime_ns, content_hash) "
+            "VALUES (?, ?, ?, ?)",
+            (file_path, size, mtime_ns, content_hash),
+        )
+
+    def _discard(self, file_path: str) -> None:
+        self._connection.execute(
+            "DELETE FROM file_content_hashes WHERE file_path = ?", (file_path,)
+        )
+
+
+class SqliteDownloadMappings(DownloadMappings):
+    """
+    DownloadMappings stored in a SQLite database instead of a json file. Queries run against the
+    database rather than loading every entry into memory, and changes only persist once
+    ``commit`` is called. A single database can hold the mappings of many subscriptions, keyed by
+    subscription name.
+    """
+
+    def __init__(self, database_path: str, subscription_name: str, dry_run: bool = False):
+        """
+        Parameters
+        ----------
+        database_path
+            Path to the SQLite database. Gets created if it does not exist
+        subscription_name
+            Name of the subscription whose mappings to use within the database
+        dry_run
+            Optional. Work on an in-memory copy of the subscription's mappings, so the database
+            is never written to or locked
+        """
+        super().__init__()
+        # The connection may be closed by a different thread than the one that opened it when
+        # subscriptions download in parallel. It is only ever used by one thread at a time.
+        if dry_run:
+            self._connection = sqlite3.connect(":memory:", check_same_thread=False)
+            self._connection.executescript(_SQLITE_SCHEMA)
+            self._copy_from_database(database_path, subscription_name)
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(database_path)), exist_ok=True)
+            self._connection = sqlite3.connect(database_path, timeout=60, check_same_thread=False)
+            self._connection.executescript(_SQLITE_SCHEMA)
+        self._entry_mappings = _SqliteEntryMappings(
+            connection=self._connection, subscription_name=subscription_name
+        )
+        self._content_hashes = _SqliteFileContentHashes(connection=self._connection)
+        self._num_entries_when_closed: Optional[int] = None
+
+    def _copy_from_database(self, database_path: str, subscription_name: str) -> None:
+        if not os.path.isfile(database_path):
+            return
+
+        database_uri = f"{Path(database_path).absolute().as_uri()}?mode=ro"
+        source = sqlite3.connect(database_uri, uri=True, timeout=60)
+        try:
+            rows = source.execute(
+                f"SELECT subscription, {_SQLITE_COLUMNS} FROM download_mappings "
+                "WHERE subscription = ? ORDER BY rowid",
+                (subscription_name,),
+            ).fetchall()
+        except sqlite3.OperationalError:
+            rows = []  # Database exists but has no download_mappings table yet
+        finally:
+            source.close()
+
+        if rows:
+            placeholders = ", ".join("?" * len(rows[0]))
+            self._connection.executemany(
+                f"INSERT INTO download_mappings (subscription, {_SQLITE_COLUMNS}) "
+                f"VALUES ({placeholders})",
+                rows,
+            )
+            self._connection.commit()
+
+    @property
+    def content_hashes(self) -> FileContentHashes:
+        """
+        Returns
+        -------
+        Content hash cache of output files, persisted alongside the mappings
+        """
+        return self._content_hashes
+
+    def get_num_entries(self) -> int:
+        if self._num_entries_when_closed is not None:
+            return self._num_entries_when_closed
+        return super().get_num_entries()
+
+    def get_num_entries_with_date(self, standardized_date: str) -> int:
+        return self._entry_mappings.count("upload_date = ?", (standardized_date,))
+
+    def get_entries_out_of_range(self, date_range: DateRange) -> Dict[str, DownloadMapping]:
+        return self._entry_mappings.select(
+            "upload_date < ? OR upload_date > ?",
+            (date_range.start.isoformat(), date_range.end.isoformat()),
+        )
+
+    def has_playlist_indices(self) -> bool:
+        return self._entry_mappings.count("playlist_index IS NOT NULL") > 0
+
+    def get_entries_over_max(
+        self, max_entries: int, sort_by: str = "upload_date"
+    ) -> Dict[str, DownloadMapping]:
+        order_by = _SQLITE_KEEP_MAX_ORDER_BY.get(sort_by, _SQLITE_KEEP_MAX_ORDER_BY["upload_date"])
+        return self._entry_mappings.select(
+            params=(max_entries,), suffix=f"ORDER BY {order_by}, rowid LIMIT -1 OFFSET ?"
+        )
+
+    def commit(self) -> "SqliteDownloadMappings":
+        """
+        Persists all changes made since the last commit in a single transaction
+
+        Returns
+        -------
+        self
+        """
+        self._connection.commit()
+        return self
+
+    def close(self) -> None:
+        """
+        Closes the database connection, discarding any uncommitted changes. The number of
+        entries remains available afterwards.
+        """
+        if self._num_entries_when_closed is not None:
+            return
+
+        self._num_entries_when_closed = self.get_num_entries()
+        self._connection.close()
+
+
 class EnhancedDownloadArchive:
     """
     Maintains ytdl's download archive file as well as create an additional mapping file to map
@@ -362,31 +867,82 @@ class EnhancedDownloadArchive:
     5. self.save_download_archive()
         a. Save the updated mapping file to the output directory.
     6. ( Delete the working directory )
+
+    Between 3 and 5, self.journal_download_mappings() can be called after each entry to append
+    its changes to a journal next to the mapping file. The journal is replayed when loading, and
+    folded back into the mapping file when saving.
     """
 
+    # Compact the journal into the mapping file once it grows past this size
+    _journal_compaction_size_bytes: int = 1024 * 1024
+
     @classmethod
     def _maybe_load_download_mappings(
-        cls, mapping_file_path: str, migrated_mapping_file_path: Optional[str]
+        cls,
+        mapping_file_path: str,
+        migrated_mapping_file_path: Optional[str],
+        journal_file_path: Optional[str] = None,
     ) -> DownloadMappings:
         """
-        Tries to load download mappings if a file exists. Otherwise returns empty mappings.
+        Tries to load download mappings if a file exists, and replays its journal on top of it if
+        one exists. Otherwise returns empty mappings.
         """
-        if migrated_mapping_file_path is not None:
-            if os.path.isfile(migrated_mapping_file_path):
+        download_mappings = DownloadMappings()
+        if migrated_mapping_file_path is not None and os.path.isfile(migrated_mapping_file_path):
+            logger.warning(
+                "MIGRATION SUCCESSFUL, loading migrated archive file. Can now set "
+                "`output_options.migrated_download_archive` to "
+                "`output_options.download_archive`"
+            )
+            download_mappings = DownloadMappings.from_file(migrated_mapping_file_path)
+        else:
+            if migrated_mapping_file_path is not None:
                 logger.warning(
-                    "MIGRATION SUCCESSFUL, loading migrated archive file. Can now set "
-                    "`output_options.migrated_download_archive` to "
-                    "`output_options.download_archive`"
+                    "MIGRATION DETECTED, will write archive file to %s", migrated_mapping_file_path
                 )
-                return DownloadMappings.from_file(migrated_mapping_file_path)
+            if os.path.isfile(mapping_file_path):
+                download_mappings = DownloadMappings.from_file(json_file_path=mapping_file_path)
+
+        if journal_file_path is not None and os.path.isfile(journal_file_path):
+            logger.info("Replaying unsaved download archive changes from %s", journal_file_path)
+            download_mappings.replay_journal(journal_file_path=journal_file_path)
+
+        return download_mappings
 
+    @classmethod
+    def _load_sqlite_download_mappings(
+        cls,
+        database_path: str,
+        subscription_name: str,
+        json_file_path: Optional[str],
+        dry_run: bool,
+    ) -> SqliteDownloadMappings:
+        """
+        Loads download mappings from a SQLite database. If the subscription has no entries in it
+        yet and a json archive file is being migrated from, import that file's entries.
+        """
+        download_mappings = SqliteDownloadMappings(
+            database_path=database_path, subscription_name=subscription_name, dry_run=dry_run
+        )
+        if json_file_path is None or is_sqlite_archive(json_file_path):
+            return download_mappings
+
+        if not download_mappings.is_empty:
             logger.warning(
-                "MIGRATION DETECTED, will write archive file to %s", migrated_mapping_file_path
+                "MIGRATION SUCCESSFUL, loading migrated archive database. Can now set "
+                "`output_options.migrated_download_archive` to "
+                "`output_options.download_archive`"
             )
+        elif os.path.isfile(json_file_path):
+            logger.warning(
+                "MIGRATION DETECTED, will import archive file %s into %s",
+                json_file_path,
+                database_path,
+            )
+            for uid, mapping in DownloadMappings.from_file(json_file_path).entry_mappings.items():
+                download_mappings.entry_mappings[uid] = mapping
 
-        if os.path.isfile(mapping_file_path):
-            return DownloadMappings.from_file(json_file_path=mapping_file_path)
-        return DownloadMappings()
+        return download_mappings
 
     def __init__(
         self,
@@ -395,13 +951,19 @@ class EnhancedDownloadArchive:
         output_directory: str,
         dry_run: bool = False,
         migrated_file_name: Optional[str] = None,
+        subscription_name: str = "",
+        copy_strategy: str = "copy",
     ):
         self._file_name = file_name
         self._file_handler = FileHandler(
-            working_directory=working_directory, output_directory=output_directory, dry_run=dry_run
+            working_directory=working_directory,
+            output_directory=output_directory,
+            dry_run=dry_run,
+            copy_strategy=copy_strategy,
         )
         self._download_mapping = DownloadMappings()  # gets reinitialized
         self._migrated_file_name = migrated_file_name
+        self._subscription_name = subscription_name
 
         self.num_entries_added: int = 0
         self.num_entries_modified: int = 0
@@ -434,11 +996,24 @@ class EnhancedDownloadArchive:
             working_directory=self.working_directory,
             output_directory=self.output_directory,
             dry_run=dry_run,
+            copy_strategy=self.copy_strategy,
         )
-        self._download_mapping = self._maybe_load_download_mappings(
-            mapping_file_path=self._output_file_path,
-            migrated_mapping_file_path=self._migrated_file_path,
-        )
+        self.close()
+
+        if self._is_sqlite_archive:
+            self._download_mapping = self._load_sqlite_download_mappings(
+                database_path=self._archive_file_path,
+                subscription_name=self._subscription_name,
+                json_file_path=self._output_file_path if self._migrated_file_name else None,
+                dry_run=dry_run,
+            )
+            self._file_handler.content_hashes = self._download_mapping.content_hashes
+        else:
+            self._download_mapping = self._maybe_load_download_mappings(
+                mapping_file_path=self._output_file_path,
+                migrated_mapping_file_path=self._migrated_file_path,
+                journal_file_path=self._journal_file_path,
+            )
         return self
 
     @property
@@ -468,6 +1043,15 @@ class EnhancedDownloadArchive:
         """
         return self._file_handler.output_directory
 
+    @property
+    def copy_strategy(self) -> str:
+        """
+        Returns
+        -------
+        How files get copied, one of ``copy``, ``reflink``, or ``hardlink``
+        """
+        return self._file_handler.copy_strategy
+
     @property
     def file_name(self) -> str:
         """
@@ -497,6 +1081,45 @@ class EnhancedDownloadArchive:
             return str(Path(self.output_directory) / self._migrated_file_name)
         return None
 
+    @property
+    def _archive_file_path(self) -> str:
+        """
+        Returns
+        -------
+        The file path the download mapping gets saved to, the migrated one if present.
+        """
+        return str(Path(self.output_directory) / (self._migrated_file_name or self.file_name))
+
+    @property
+    def sqlite_database_path(self) -> Optional[str]:
+        """
+        Returns
+        -------
+        Absolute path to the SQLite database the download mappings get saved to, or None if they
+        get saved to a json file
+        """
+        if not self._is_sqlite_archive:
+            return None
+        return os.path.abspath(self._archive_file_path)
+
+    @property
+    def _is_sqlite_archive(self) -> bool:
+        """
+        Returns
+        -------
+        True if the download mapping gets saved to a SQLite database. False otherwise.
+        """
+        return is_sqlite_archive(self._archive_file_path)
+
+    @property
+    def _journal_file_path(self) -> str:
+        """
+        Returns
+        -------
+        The download mapping journal's file path in the output directory.
+        """
+        return f"{self._archive_file_path}.journal"
+
     @property
     def working_file_path(self) -> str:
         """
@@ -591,52 +1214,30 @@ class EnhancedDownloadArchive:
 
         if keep_max_files is not None and keep_max_files > 0:
             is_playlist_sort = sort_by in ("playlist_index_asc", "playlist_index_desc")
-            if is_playlist_sort:
-                all_none = all(
-                    m.playlist_index is None for m in self.mapping.entry_mappings.values()
-                )
-                if all_none:
-                    logger.warning(
-                        "keep_max_files_sort_by is '%s' but no entries have a "
-                        "playlist index. Falling back to 'upload_date'.",
-                        sort_by,
-                    )
-                    sort_by = "upload_date"
-                    is_playlist_sort = False
-
-            if is_playlist_sort:
-                if sort_by == "playlist_index_desc":
-                    sorted_entries = sorted(
-                        self.mapping.entry_mappings.items(),
-                        key=lambda kv_: (
-                            kv_[1].playlist_index is not None,
-                            kv_[1].playlist_index if kv_[1].playlist_index is not None else 0,
-                        ),
-                        reverse=True,
-                    )
-                else:
-                    sorted_entries = sorted(
-                        self.mapping.entry_mappings.items(),
-                        key=lambda kv_: (
-                            kv_[1].playlist_index is None,
-                            kv_[1].playlist_index if kv_[1].playlist_index is not None else 0,
-                        ),
-                    )
-            else:
-                sorted_entries = sorted(
-                    self.mapping.entry_mappings.items(),
-                    key=lambda kv_: kv_[1].upload_date,
-                    reverse=True,
+            if is_playlist_sort and not self.mapping.has_playlist_indices():
+                logger.warning(
+                    "keep_max_files_sort_by is '%s' but no entries have a "
+                    "playlist index. Falling back to 'upload_date'.",
+                    sort_by,
                 )
+                sort_by = "upload_date"
 
-            num_files = 0
-            for uid, mapping in sorted_entries:
-                num_files += 1
-                if num_files > keep_max_files:
-                    self._remove_entry(uid=uid, mapping=mapping)
+            stale_mappings = self.mapping.get_entries_over_max(
+                max_entries=keep_max_files, sort_by=sort_by
+            )
+            for uid, mapping in stale_mappings.items():
+                self._remove_entry(uid=uid, mapping=mapping)
 
         return self
 
+    def close(self) -> None:
+        """
+        Closes the download mappings' database connection if the archive is a SQLite database.
+        Gets reopened by ``reinitialize``.
+        """
+        if isinstance(self._download_mapping, SqliteDownloadMappings):
+            self._download_mapping.close()
+
     def save_download_mappings(self) -> "EnhancedDownloadArchive":
         """
         Saves the updated download mappings to the output directory if any files were changed.
@@ -645,8 +1246,16 @@ class EnhancedDownloadArchive:
         -------
         self
         """
+        # SQLite databases are updated in place, and only need their changes committed
+        if self._is_sqlite_archive:
+            if not self.is_dry_run:
+                self._download_mapping.commit()
+
+            # Remove the json archive file once it has been migrated into the database
+            if self._migrated_file_name and not is_sqlite_archive(self.file_name):
+                self.delete_file_from_output_directory(file_name=self.file_name)
         # If a migrated file name is present, always save to that file
-        if self._migrated_file_name:
+        elif self._migrated_file_name:
             self._download_mapping.to_file(output_json_file=self.working_file_path)
             self.save_file_to_output_directory(
                 file_name=self.file_name, output_file_name=self._migrated_file_name, copy_file=True
@@ -656,11 +1265,43 @@ class EnhancedDownloadArchive:
             # and delete the old one if the name differs
             if self._file_name != self._migrated_file_name:
                 self.delete_file_from_output_directory(file_name=self.file_name)
-        # Otherwise, only save if there are changes to the transaction log
-        elif not self.get_file_handler_transaction_log().is_empty:
+        # Otherwise, only save if there are changes to the transaction log, or journaled changes
+        # that have not made it into the mapping file yet
+        elif not self.get_file_handler_transaction_log().is_empty or os.path.isfile(
+            self._journal_file_path
+        ):
             self._download_mapping.to_file(output_json_file=self.working_file_path)
             self.save_file_to_output_directory(file_name=self.file_name, copy_file=True)
             FileHandler.delete(file_path=self.working_file_path)
+
+        # The mapping file now contains everything the journal did
+        if not self.is_dry_run:
+            FileHandler.delete(file_path=self._journal_file_path)
+        return self
+
+    def journal_download_mappings(self) -> "EnhancedDownloadArchive":
+        """
+        Durably records download mapping changes since the last save to the journal in the output
+        directory. Cheap enough to call after every entry. Compacts the journal into the mapping
+        file once it grows too large.
+
+        Returns
+        -------
+        self
+        """
+        if self.is_dry_run:
+            return self
+
+        if self._is_sqlite_archive:
+            self._download_mapping.commit()
+            return self
+
+        self._download_mapping.to_journal(journal_file_path=self._journal_file_path)
+        if (
+            os.path.isfile(self._journal_file_path)
+            and os.path.getsize(self._journal_file_path) > self._journal_compaction_size_bytes
+        ):
+            self.save_download_mappings()
         return self
 
     def delete_file_from_output_directory(self, file_name: str):
@@ -728,6 +1369,7 @@ class EnhancedDownloadArchive:
                     # Set mtime on the output file
                     output_file_path = Path(self._file_handler.output_directory) / output_file_name
                     FileHandler.set_mtime(output_file_path, upload_timestamp)
+                    self._file_handler.content_hashes.rekey(output_file_path, output_file_path)
                 except (ValueError, OSError):
                     # If date parsing or file operation fails, silently continue
                     pass
@@ -8,8 +8,10 @@ import pytest
 
 from ytdl_sub.cli.entrypoint import _download_subscriptions_from_yaml_files, main
 from ytdl_sub.config.config_file import ConfigFile
+from ytdl_sub.main import main as ytdl_sub_main
 from ytdl_sub.subscriptions.subscription import Subscription
-from ytdl_sub.utils.exceptions import ExperimentalFeatureNotEnabled
+from ytdl_sub.utils.exceptions import ExperimentalFeatureNotEnabled, ValidationException
+from ytdl_sub.utils.logger import Logger
 
 ####################################################################################################
 # SHARED FIXTURES
@@ -156,3 +158,100 @@ def test_subscription_shuffle(
         )
 
     assert [sub.name for sub in out1] != [sub.name for sub in out2]
+
+
+def test_subscription_parallel(
+    persist_logs_directory: str,
+    persist_logs_config_factory: Callable,
+    mock_subscription_download_factory: Callable,
+    music_video_subscription_path: Path,
+):
+    config = persist_logs_config_factory(keep_successful_logs=True)
+
+    with (
+        patch.object(
+            Subscription,
+            "download",
+            new=mock_subscription_download_factory(mock_success_output=True),
+        ),
+        patch("ytdl_sub.cli.entrypoint._log_time", return_value="0"),
+    ):
+        subscriptions = _download_subscriptions_from_yaml_files(
+            config=config,
+            subscription_paths=[str(music_video_subscription_path)],
+            subscription_matches=[],
+            subscription_override_dict={},
+            update_with_info_json=False,
+            dry_run=False,
+            shuffle=False,
+            parallel=2,
+        )
+
+    assert all(subscription.exception is None for subscription in subscriptions)
+
+    log_file_names = sorted(path.name for path in Path(persist_logs_directory).rglob("*"))
+    assert log_file_names == sorted(
+        f"0.{subscription.name.lower().replace(' ', '_')}.success.log"
+        for subscription in subscriptions
+    )
+    for log_file_path in Path(persist_logs_directory).rglob("*"):
+        with open(log_file_path, "r", encoding="utf-8") as log_file:
+            assert log_file.readlines()[-1].endswith("success=True dry_run=False\n")
+
+
+def test_subscription_parallel_errors(
+    default_config_path: Path,
+    mock_subscription_download_factory: Callable,
+    music_video_subscription_path: Path,
+):
+    with (
+        patch.object(
+            Subscription,
+            "download",
+            new=mock_subscription_download_factory(mock_success_output=False),
+        ),
+        patch.object(
+            sys,
+            "argv",
+            [
+                "ytdl-sub",
+                "--config",
+                str(default_config_path),
+                "sub",
+                str(music_video_subscription_path),
+                "--parallel",
+                "2",
+            ],
+        ),
+        patch.object(Logger, "set_log_level"),
+        patch("ytdl_sub.cli.entrypoint.output_summary") as mock_output_summary,
+        pytest.raises(SystemExit) as system_exit,
+    ):
+        ytdl_sub_main()
+
+    assert system_exit.value.code == 1
+
+    subscriptions: List[Subscription] = mock_output_summary.call_args.args[0]
+    assert len(subscriptions) == 4
+    for subscription in subscriptions:
+        assert isinstance(subscription.exception, ValueError)
+
+
+def test_subscription_parallel_shared_sqlite_archive(
+    default_config: ConfigFile,
+    music_video_subscription_path: Path,
+    tmp_path: Path,
+):
+    with pytest.raises(ValidationException, match="share the download archive database"):
+        _download_subscriptions_from_yaml_files(
+            config=default_config,
+            subscription_paths=[str(music_video_subscription_path)],
+            subscription_matches=[],
+            subscription_override_dict={
+                "output_options": {"download_archive_name": str(tmp_path / "archive.db")}
+            },
+            update_with_info_json=False,
+            dry_run=False,
+            shuffle=False,
+            parallel=2,
+        )
@@ -31,6 +31,23 @@ def config(working_directory) -> ConfigFile:
     )
 
 
+@pytest.fixture
+def experimental_config_factory(working_directory) -> Callable[..., ConfigFile]:
+    def _experimental_config_factory(**experimental: Any) -> ConfigFile:
+        return ConfigFile(
+            name="config",
+            value={
+                "configuration": {
+                    "working_directory": working_directory,
+                    "experimental": experimental,
+                },
+                "presets": {},
+            },
+        )
+
+    return _experimental_config_factory
+
+
 @pytest.fixture
 def mock_downloaded_file_path(working_directory: str, subscription_name: str):
     def _mock_downloaded_file_path(file_name: str) -> Path:
@@ -1,4 +1,7 @@
-from typing import Dict
+import subprocess
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import patch
 
 import pytest
 from expected_download import assert_expected_downloads
@@ -8,6 +11,7 @@ from mergedeep import mergedeep
 
 from ytdl_sub.entries.entry import ytdl_sub_chapters_from_comments
 from ytdl_sub.subscriptions.subscription import Subscription
+from ytdl_sub.utils.ffmpeg import FFMPEG
 
 
 @pytest.fixture
@@ -122,3 +126,77 @@ class TestChapters:
             dry_run=dry_run,
             expected_download_summary_file_name="plugins/chapters/test_chapters_from_comments.json",
         )
+
+    @pytest.mark.usefixtures(mock_chapters_class.__name__)
+    @pytest.mark.parametrize("dry_run", [True, False])
+    def test_chapters_from_comments_with_tags_and_thumbnail(
+        self,
+        config,
+        subscription_name,
+        chapters_from_comments_subscription_dict,
+        mock_download_collection_entries,
+        output_directory,
+        dry_run,
+    ):
+        # Chapters, video_tags and embed_thumbnail are all written by the entry's combined
+        # remux. All three together must still produce the same files.
+        chapters_from_comments_subscription_dict["embed_thumbnail"] = True
+        subscription = Subscription.from_dict(
+            config=config,
+            preset_name=subscription_name,
+            preset_dict=chapters_from_comments_subscription_dict,
+        )
+
+        ffmpeg_run = FFMPEG.run
+        ffmpeg_runs: List[List[str]] = []
+
+        def _record_ffmpeg_run(ffmpeg_args: List[str], *args, **kwargs):
+            ffmpeg_runs.append(ffmpeg_args)
+            return ffmpeg_run(ffmpeg_args, *args, **kwargs)
+
+        with (
+            mock_download_collection_entries(
+                is_youtube_channel=False, num_urls=1, is_dry_run=dry_run
+            ),
+            patch.object(FFMPEG, "run", side_effect=_record_ffmpeg_run),
+        ):
+            transaction_log = subscription.download(dry_run=dry_run)
+
+        # Each entry's chapters, tags and thumbnail are applied in one remux
+        remux_runs = [args for args in ffmpeg_runs if "-map_chapters" in args]
+        assert len(remux_runs) == (0 if dry_run else 4)
+        assert all("-metadata" in args and "attached_pic" in args for args in remux_runs)
+
+        assert_transaction_log_matches(
+            output_directory=output_directory,
+            transaction_log=transaction_log,
+            transaction_log_summary_file_name=(
+                "plugins/chapters/test_chapters_from_comments_with_tags_and_thumbnail.txt"
+            ),
+        )
+        assert_expected_downloads(
+            output_directory=output_directory,
+            dry_run=dry_run,
+            expected_download_summary_file_name=(
+                "plugins/chapters/test_chapters_from_comments_with_tags_and_thumbnail.json"
+            ),
+        )
+
+        if not dry_run:
+            # Dump the file's metadata and chapters, which also logs its streams to stderr
+            probe = subprocess.run(
+                [
+                    FFMPEG.ffmpeg_path(),
+                    "-i",
+                    str(Path(output_directory) / "JMC" / "Mock Entry 20-1.mp4"),
+                    "-f",
+                    "ffmetadata",
+                    "-",
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            assert probe.stdout.count("[CHAPTER]") == 4
+            assert "title=Mock Entry 20-1" in probe.stdout.splitlines()
+            assert "(attached pic)" in probe.stderr
@@ -1,4 +1,5 @@
 import re
+import sqlite3
 from pathlib import Path
 from typing import Dict
 from unittest.mock import patch
@@ -80,6 +81,35 @@ class TestOutputOptions:
             expected_download_summary_file_name="youtube/test_playlist_archive_migrated.json",
         )
 
+    def test_sqlite_download_archive_closed_after_download(
+        self,
+        config: ConfigFile,
+        subscription_name: str,
+        output_options_subscription_dict: Dict,
+        mock_download_collection_entries,
+    ):
+        output_options_subscription_dict["output_options"]["download_archive_name"] = (
+            ".ytdl-sub-{tv_show_name_sanitized}-download-archive.db"
+        )
+        subscription = Subscription.from_dict(
+            config=config,
+            preset_name=subscription_name,
+            preset_dict=output_options_subscription_dict,
+        )
+
+        with mock_download_collection_entries(
+            is_youtube_channel=False,
+            num_urls=1,
+            is_extracted_audio=False,
+            is_dry_run=False,
+        ):
+            subscription.download(dry_run=False)
+
+        # The count remains available for the output summary
+        assert subscription.num_entries == 4
+        with pytest.raises(sqlite3.ProgrammingError, match="closed database"):
+            _ = subscription.download_archive.mapping.entry_ids
+
     def test_download_archive_migration(
         self,
         config: ConfigFile,
@@ -0,0 +1,65 @@
+import os
+import threading
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from integration.plugins.conftest import mock_chapters_class
+
+from ytdl_sub.subscriptions.subscription import Subscription
+from ytdl_sub.utils.ffmpeg import FFMPEG
+
+
+@pytest.mark.usefixtures(mock_chapters_class.__name__)
+class TestSplitByChapters:
+    def test_concurrent_splits_match_serial_splits(
+        self,
+        config,
+        subscription_name,
+        tmp_path,
+        mock_download_collection_entries,
+    ):
+        ffmpeg_run = FFMPEG.run
+        ffmpeg_thread_names: List[str] = []
+
+        def _record_ffmpeg_run(*args, **kwargs):
+            ffmpeg_thread_names.append(threading.current_thread().name)
+            return ffmpeg_run(*args, **kwargs)
+
+        def _split_files(max_concurrent_splits: int) -> str:
+            music_directory = str(tmp_path / f"max_concurrent_splits_{max_concurrent_splits}")
+            subscription = Subscription.from_dict(
+                config=config,
+                preset_name=subscription_name,
+                preset_dict={
+                    "preset": ["YouTube Full Albums"],
+                    "split_by_chapters": {"max_concurrent_splits": max_concurrent_splits},
+                    "overrides": {
+                        "url": "https://your.name.here",
+                        "music_directory": music_directory,
+                    },
+                },
+            )
+
+            ffmpeg_thread_names.clear()
+            with (
+                mock_download_collection_entries(
+                    is_youtube_channel=False, num_urls=1, is_extracted_audio=True
+                ),
+                patch.object(FFMPEG, "run", side_effect=_record_ffmpeg_run),
+            ):
+                transaction_log = subscription.download(dry_run=False)
+
+            return transaction_log.to_output_message(output_directory="{music_directory}")
+
+        serial_output = _split_files(max_concurrent_splits=1)
+        assert not any("-split_" in thread_name for thread_name in ffmpeg_thread_names)
+
+        concurrent_output = _split_files(max_concurrent_splits=4)
+        assert any("-split_" in thread_name for thread_name in ffmpeg_thread_names)
+
+        assert "01 - " in concurrent_output
+        assert concurrent_output == serial_output
+        assert sorted(os.listdir(tmp_path / "max_concurrent_splits_4")) == sorted(
+            os.listdir(tmp_path / "max_concurrent_splits_1")
+        )
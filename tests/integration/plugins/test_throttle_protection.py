@@ -38,16 +38,20 @@ def throttle_subscription_dict(output_directory) -> Dict:
 
 
 class TestThrottleProtectionPlugin:
+    @pytest.mark.parametrize("enable_pipelined_downloads", [False, True])
     def test_sleeps_log(
         self,
-        config,
+        experimental_config_factory,
         subscription_name,
         throttle_subscription_dict,
         output_directory,
         mock_download_collection_entries,
+        enable_pipelined_downloads: bool,
     ):
         subscription = Subscription.from_dict(
-            config=config,
+            config=experimental_config_factory(
+                enable_pipelined_downloads=enable_pipelined_downloads
+            ),
             preset_name=subscription_name,
             preset_dict=throttle_subscription_dict,
         )
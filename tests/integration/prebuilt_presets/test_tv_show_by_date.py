@@ -169,6 +169,24 @@ class TestPrebuiltTVShowPresets:
                 episode_ordering=episode_ordering,
             )
 
+    def test_pipelined_downloads(
+        self,
+        experimental_config_factory,
+        subscription_name,
+        output_directory,
+        mock_download_collection_entries,
+    ):
+        pipelined_config = experimental_config_factory(enable_pipelined_downloads=True)
+        with mock_download_collection_entries(is_youtube_channel=True):
+            self.run(
+                config=pipelined_config,
+                subscription_name=subscription_name,
+                output_directory=output_directory,
+                tv_show_preset="Kodi TV Show by Date",
+                season_ordering="upload-year",
+                episode_ordering="download-index",
+            )
+
     def test_invalid_season_ordering(
         self, config, subscription_name, output_directory, mock_download_collection_entries
     ):
@@ -1,11 +1,14 @@
 import re
-from typing import Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
 
 import pytest
 from expected_download import assert_expected_downloads
 from expected_transaction_log import assert_transaction_log_matches
 
 from ytdl_sub.config.config_file import ConfigFile
+from ytdl_sub.downloaders.ytdlp import YTDLP
 from ytdl_sub.prebuilt_presets.tv_show import TvShowCollectionPresets
 from ytdl_sub.script.utils.exceptions import UserThrownRuntimeError
 from ytdl_sub.subscriptions.subscription import Subscription
@@ -23,6 +26,7 @@ class TestPrebuiltTvShowCollectionPresets:
         episode_ordering: str,
         season_indices: List[int],
         is_youtube_channel: bool = True,
+        extra_overrides: Optional[Dict[str, Any]] = None,
     ):
         expected_summary_name = "integration/collection/{}/{}/s_{}/is_yt_{}".format(
             media_player_preset.split(" ")[0],
@@ -31,7 +35,7 @@ class TestPrebuiltTvShowCollectionPresets:
             int(is_youtube_channel),
         )
 
-        overrides: Dict[str, str] = {}
+        overrides: Dict[str, Any] = dict(extra_overrides or {})
         for season_index in season_indices:
             overrides = dict(
                 overrides,
@@ -167,6 +171,79 @@ class TestPrebuiltTvShowCollectionPresets:
                 season_indices=season_indices,
             )
 
+    def test_pipelined_downloads(
+        self,
+        experimental_config_factory,
+        subscription_name,
+        output_directory,
+        mock_download_collection_entries,
+    ):
+        pipelined_config = experimental_config_factory(enable_pipelined_downloads=True)
+        with mock_download_collection_entries(is_youtube_channel=True, num_urls=2):
+            self.run(
+                config=pipelined_config,
+                subscription_name=subscription_name,
+                output_directory=output_directory,
+                media_player_preset="Kodi TV Show Collection",
+                episode_ordering=DEFAULT_EPISODE_ORDERING,
+                season_indices=[1, 2],
+            )
+
+    def test_entry_metadata_pruning(
+        self,
+        experimental_config_factory,
+        subscription_name,
+        output_directory,
+        mock_download_collection_entries,
+    ):
+        pruning_config = experimental_config_factory(enable_entry_metadata_pruning=True)
+        with mock_download_collection_entries(is_youtube_channel=True, num_urls=2):
+            self.run(
+                config=pruning_config,
+                subscription_name=subscription_name,
+                output_directory=output_directory,
+                media_player_preset="Kodi TV Show Collection",
+                episode_ordering=DEFAULT_EPISODE_ORDERING,
+                season_indices=[1, 2],
+            )
+
+    def test_streaming_metadata(
+        self,
+        experimental_config_factory,
+        working_directory,
+        subscription_name,
+        output_directory,
+        mock_download_collection_entries,
+    ):
+        streaming_config = experimental_config_factory(enable_streaming_metadata=True)
+        metadata_calls: List[Dict[str, Any]] = []
+
+        with mock_download_collection_entries(is_youtube_channel=True, num_urls=2):
+            mock_extract_info_via_info_json = YTDLP.extract_info_via_info_json
+
+            def _record_extract_info_via_info_json(**kwargs) -> List[Dict]:
+                metadata_calls.append(kwargs)
+                return mock_extract_info_via_info_json(**kwargs)
+
+            with patch.object(
+                YTDLP, "extract_info_via_info_json", new=_record_extract_info_via_info_json
+            ):
+                self.run(
+                    config=streaming_config,
+                    subscription_name=subscription_name,
+                    output_directory=output_directory,
+                    media_player_preset="Kodi TV Show Collection",
+                    episode_ordering=DEFAULT_EPISODE_ORDERING,
+                    season_indices=[1, 2],
+                    extra_overrides={"enable_throttle_protection": False},
+                )
+
+        # Streamed entries read their info.json from the working directory, so URLs are serial
+        assert len(metadata_calls) == 2
+        for call in metadata_calls:
+            assert call["working_directory"] == str(Path(working_directory) / subscription_name)
+            assert "id" in call["index_keys"]
+
     def test_invalid_episode_ordering(
         self, config, subscription_name, output_directory, mock_download_collection_entries
     ):
@@ -17,7 +17,9 @@ def test_working_directory_lock(default_config: ConfigFile):
     if new_pid == 0:  # is child
         with working_directory_lock(config=default_config):
             time.sleep(3)
-        return
+        # Exit without returning to pytest, otherwise the child runs the remaining tests alongside
+        # the parent, and cleans up log files the parent is still using
+        os._exit(0)
 
     time.sleep(1)
     with pytest.raises(ValidationException, match="Cannot run two instances of ytdl-sub"):
@@ -27,3 +29,5 @@ def test_working_directory_lock(default_config: ConfigFile):
     time.sleep(3)
     with working_directory_lock(config=default_config):
         pass
+
+    os.waitpid(new_pid, 0)
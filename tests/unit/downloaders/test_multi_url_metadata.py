@@ -0,0 +1,141 @@
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from ytdl_sub.config.config_file import ConfigFile
+from ytdl_sub.downloaders.url.downloader import MultiUrlDownloader
+from ytdl_sub.downloaders.ytdl_options_builder import YTDLOptionsBuilder
+from ytdl_sub.subscriptions.subscription import Subscription
+
+
+@pytest.fixture
+def downloader(working_directory: str, output_directory: str) -> MultiUrlDownloader:
+    subscription = Subscription.from_dict(
+        config=ConfigFile.from_dict({"configuration": {"working_directory": working_directory}}),
+        preset_name="test_multi_url_metadata",
+        preset_dict={
+            "download": ["https://your.name.here/1", "https://your.name.here/2"],
+            "output_options": {
+                "output_directory": output_directory,
+                "file_name": "file.mp4",
+            },
+        },
+    )
+    return MultiUrlDownloader(
+        options=subscription.downloader_options,
+        enhanced_download_archive=subscription.download_archive,
+        download_ytdl_options=YTDLOptionsBuilder(),
+        metadata_ytdl_options=YTDLOptionsBuilder(),
+        overrides=subscription.overrides,
+    )
+
+
+class TestMultiUrlMetadata:
+    @pytest.mark.parametrize(
+        "outtmpl, expected_outtmpl",
+        [
+            ("{working_directory}/%(id)s.%(ext)s", "{metadata_directory}/%(id)s.%(ext)s"),
+            (
+                {
+                    "default": "{working_directory}/%(id)s.%(ext)s",
+                    "pl_thumbnail": "{working_directory}/%(id)s.pl.%(ext)s",
+                },
+                {
+                    "default": "{metadata_directory}/%(id)s.%(ext)s",
+                    "pl_thumbnail": "{metadata_directory}/%(id)s.pl.%(ext)s",
+                },
+            ),
+        ],
+    )
+    def test_isolate_metadata_ytdl_options(
+        self, downloader: MultiUrlDownloader, outtmpl: Any, expected_outtmpl: Any
+    ):
+        working_directory = downloader.working_directory
+        metadata_directory = str(Path(working_directory) / ".ytdl-sub-metadata" / "0")
+        archive_path = str(Path(working_directory) / "ytdl-archive.txt")
+
+        os.makedirs(working_directory, exist_ok=True)
+        Path(archive_path).write_text("youtube before\n", encoding="utf-8")
+        Path(f"{archive_path}.backup").write_text("youtube backup\n", encoding="utf-8")
+
+        def _format(template: str, directory: str) -> str:
+            return template.format(
+                working_directory=working_directory, metadata_directory=directory
+            )
+
+        if isinstance(outtmpl, dict):
+            outtmpl = {key: _format(value, "") for key, value in outtmpl.items()}
+            expected_outtmpl = {
+                key: _format(value, metadata_directory) for key, value in expected_outtmpl.items()
+            }
+        else:
+            outtmpl = _format(outtmpl, "")
+            expected_outtmpl = _format(expected_outtmpl, metadata_directory)
+
+        ytdl_options = {"outtmpl": outtmpl, "download_archive": archive_path}
+        isolated_ytdl_options = downloader._isolate_metadata_ytdl_options(
+            ytdl_options_overrides=ytdl_options, metadata_directory=metadata_directory
+        )
+
+        assert isolated_ytdl_options == {
+            "outtmpl": expected_outtmpl,
+            "download_archive": str(Path(metadata_directory) / "ytdl-archive.txt"),
+        }
+        assert ytdl_options == {"outtmpl": outtmpl, "download_archive": archive_path}
+        assert (
+            Path(metadata_directory, "ytdl-archive.txt").read_text(encoding="utf-8")
+            == "youtube backup\n"
+        )
+
+    @pytest.mark.parametrize(
+        "metadata_url_concurrency, ytdl_options, is_concurrent",
+        [
+            (1, {}, False),
+            (3, {}, True),
+            (3, {"sleep_interval_requests": 1}, False),
+        ],
+    )
+    def test_urls_metadata_yielded_in_order(
+        self,
+        downloader: MultiUrlDownloader,
+        metadata_url_concurrency: int,
+        ytdl_options: Dict,
+        is_concurrent: bool,
+    ):
+        downloader.set_metadata_url_concurrency(metadata_url_concurrency)
+        threads: List[str] = []
+        urls = [f"https://your.name.here/{url_idx}" for url_idx in range(3)]
+
+        def _download_url_metadata(url: str, **kwargs) -> Tuple[List, List]:
+            # Later URLs finish first
+            time.sleep(0.01 * (len(urls) - urls.index(url)))
+            threads.append(threading.current_thread().name)
+            return [url], [kwargs.get("metadata_directory")]
+
+        with patch.object(downloader, "_download_url_metadata", new=_download_url_metadata):
+            urls_metadata = list(
+                downloader._download_urls_metadata(
+                    [
+                        {
+                            "url": url,
+                            "include_sibling_metadata": False,
+                            "ytdl_options_overrides": ytdl_options,
+                        }
+                        for url in urls
+                    ]
+                )
+            )
+
+        assert [parents for parents, _ in urls_metadata] == [[url] for url in urls]
+        metadata_directories = [orphans[0] for _, orphans in urls_metadata]
+        if is_concurrent:
+            assert len(set(metadata_directories)) == len(urls)
+            assert threading.current_thread().name not in threads
+        else:
+            assert metadata_directories == [None] * len(urls)
+            assert set(threads) == {threading.current_thread().name}
@@ -0,0 +1,116 @@
+from typing import Any, Dict
+
+import pytest
+import yt_dlp
+
+from ytdl_sub.downloaders.ytdlp import YTDLP
+
+# Types of YoutubeDL attributes that can be compared between instances
+_COMPARABLE_TYPES = (int, float, bool, str, type(None), set, frozenset, tuple, list, dict)
+
+
+def _comparable_state(ytdl_downloader: yt_dlp.YoutubeDL) -> Dict[str, Any]:
+    return {
+        attribute: value
+        for attribute, value in vars(ytdl_downloader).items()
+        if isinstance(value, _COMPARABLE_TYPES)
+    }
+
+
+@pytest.fixture
+def ytdl_options(tmp_path) -> dict:
+    return {"quiet": True, "download_archive": str(tmp_path / "ytdl-archive.txt")}
+
+
+class TestYTDLPDownloaderPool:
+    def test_downloaders_not_reused_by_default(self, ytdl_options):
+        with YTDLP.ytdlp_downloader(ytdl_options) as first:
+            pass
+        with YTDLP.ytdlp_downloader(ytdl_options) as second:
+            pass
+
+        assert first is not second
+
+    def test_downloaders_reused_by_options(self, ytdl_options):
+        with YTDLP.reuse_downloaders():
+            with YTDLP.ytdlp_downloader(ytdl_options) as first:
+                pass
+            with YTDLP.ytdlp_downloader(dict(reversed(ytdl_options.items()))) as second:
+                pass
+            with YTDLP.ytdlp_downloader(ytdl_options | {"check_formats": True}) as third:
+                pass
+
+        assert first is second
+        assert first is not third
+
+    def test_reused_downloader_state_is_reset(self, ytdl_options):
+        with YTDLP.reuse_downloaders():
+            with YTDLP.ytdlp_downloader(ytdl_options) as first:
+                first._num_downloads = 3
+                first.archive.add("youtube abc")
+
+            with open(ytdl_options["download_archive"], "w", encoding="utf-8") as archive_file:
+                archive_file.write("youtube def\n")
+
+            with YTDLP.ytdlp_downloader(ytdl_options) as second:
+                assert second is first
+                assert second._num_downloads == 0
+                assert second.archive == {"youtube def"}
+
+    def test_downloader_not_reused_after_exception(self, ytdl_options):
+        with YTDLP.reuse_downloaders():
+            with pytest.raises(ValueError):
+                with YTDLP.ytdlp_downloader(ytdl_options) as first:
+                    raise ValueError("failed download")
+
+            with YTDLP.ytdlp_downloader(ytdl_options) as second:
+                pass
+
+        assert first is not second
+
+    def test_reused_downloader_matches_new_downloader(self, ytdl_options):
+        # Fails if yt-dlp adds per-session state that is not reset before reusing an instance
+        ytdl_options["simulate"] = True
+        playlist = {
+            "_type": "playlist",
+            "id": "playlist",
+            "title": "playlist",
+            "webpage_url": "https://your.name.here/playlist",
+            "extractor": "generic",
+            "extractor_key": "Generic",
+            "entries": [
+                {
+                    "id": f"entry_{idx}",
+                    "title": f"entry {idx}",
+                    "url": f"https://your.name.here/{idx}.mp4",
+                    "ext": "mp4",
+                    "webpage_url": f"https://your.name.here/{idx}",
+                    "extractor": "generic",
+                    "extractor_key": "Generic",
+                }
+                for idx in range(2)
+            ],
+        }
+
+        with YTDLP.reuse_downloaders():
+            with YTDLP.ytdlp_downloader(ytdl_options) as first:
+                first.process_ie_result(playlist, download=True)
+                assert _comparable_state(first) != _comparable_state(
+                    yt_dlp.YoutubeDL(dict(ytdl_options))
+                )
+
+            with YTDLP.ytdlp_downloader(ytdl_options) as second:
+                assert second is first
+                assert _comparable_state(second) == _comparable_state(
+                    yt_dlp.YoutubeDL(dict(ytdl_options))
+                )
+
+    def test_downloader_not_reused_without_expected_state(self, ytdl_options):
+        with YTDLP.reuse_downloaders():
+            with YTDLP.ytdlp_downloader(ytdl_options) as first:
+                del first._num_downloads
+
+            with YTDLP.ytdlp_downloader(ytdl_options) as second:
+                pass
+
+        assert first is not second
@@ -0,0 +1,141 @@
+import json
+import time
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+import pytest
+import yt_dlp
+
+from ytdl_sub.downloaders.ytdlp import YTDLP
+
+
+@pytest.fixture
+def ytdl_options(tmp_path) -> Dict:
+    return {"quiet": True, "cachedir": str(tmp_path / "cache")}
+
+
+@pytest.fixture
+def info_json_directory(tmp_path) -> str:
+    (tmp_path / "working").mkdir()
+    for uid, uploader in [("a", "first"), ("b", "second"), ("c", "first"), ("d", "third")]:
+        with open(tmp_path / "working" / f"{uid}.info.json", "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "id": uid,
+                    "uploader_id": f"@{uploader}",
+                    "uploader_url": f"https://yourname.here/{uploader}",
+                },
+                file,
+            )
+    return str(tmp_path / "working")
+
+
+class TestYTDLPUploaderMetadata:
+    def _extract_info_via_info_json(
+        self,
+        info_json_directory: str,
+        ytdl_options: Dict,
+        uploader_cache_ttl_s: float = 60,
+        entry_dicts_out: Optional[List[Dict]] = None,
+    ) -> List[str]:
+        def _mock_extract_info(_ytdlp, url: str, **_kwargs) -> Dict:
+            uploader = url.split("/")[-1]
+            return {
+                "id": f"UC_{uploader}",
+                "_type": "playlist",
+                "entries": [],
+                "thumbnails": ({"id": "avatar", "width": 900},),
+            }
+
+        with patch.object(
+            yt_dlp.YoutubeDL, "extract_info", autospec=True, side_effect=_mock_extract_info
+        ) as mock_extract_info:
+            entry_dicts = YTDLP.extract_info_via_info_json(
+                working_directory=info_json_directory,
+                ytdl_options_overrides=ytdl_options,
+                uploader_cache_ttl_s=uploader_cache_ttl_s,
+                url="https://yourname.here/playlist",
+            )
+        if entry_dicts_out is not None:
+            entry_dicts_out.extend(entry_dicts)
+
+        assert sorted(entry_dict["id"] for entry_dict in entry_dicts) == [
+            "UC_first",
+            "UC_second",
+            "UC_third",
+            "a",
+            "b",
+            "c",
+            "d",
+        ]
+        return [call.kwargs["url"] for call in mock_extract_info.call_args_list]
+
+    @pytest.mark.parametrize("sleep_interval_requests", [None, 1])
+    def test_uploaders_looked_up_once(
+        self, info_json_directory, ytdl_options, sleep_interval_requests
+    ):
+        ytdl_options["sleep_interval_requests"] = sleep_interval_requests
+        urls = self._extract_info_via_info_json(info_json_directory, ytdl_options)
+
+        assert sorted(urls) == [
+            "https://yourname.here/first",
+            "https://yourname.here/playlist",
+            "https://yourname.here/second",
+            "https://yourname.here/third",
+        ]
+
+    def test_uploaders_cached(self, info_json_directory, ytdl_options):
+        self._extract_info_via_info_json(info_json_directory, ytdl_options)
+        urls = self._extract_info_via_info_json(info_json_directory, ytdl_options)
+        assert urls == ["https://yourname.here/playlist"]
+
+    def test_uploaders_cached_with_same_shape(self, info_json_directory, ytdl_options):
+        fresh_entry_dicts: List[Dict] = []
+        cached_entry_dicts: List[Dict] = []
+        self._extract_info_via_info_json(
+            info_json_directory, ytdl_options, entry_dicts_out=fresh_entry_dicts
+        )
+        self._extract_info_via_info_json(
+            info_json_directory, ytdl_options, entry_dicts_out=cached_entry_dicts
+        )
+
+        assert fresh_entry_dicts == cached_entry_dicts
+        assert fresh_entry_dicts[-1]["thumbnails"] == [{"id": "avatar", "width": 900}]
+
+    def test_uploader_cache_keyed_by_credentials(self, info_json_directory, ytdl_options):
+        self._extract_info_via_info_json(info_json_directory, ytdl_options)
+        urls = self._extract_info_via_info_json(
+            info_json_directory, ytdl_options | {"username": "your_name"}
+        )
+        assert len(urls) == 4
+
+    def test_uploader_cache_disabled(self, info_json_directory, ytdl_options):
+        self._extract_info_via_info_json(info_json_directory, ytdl_options, uploader_cache_ttl_s=0)
+        urls = self._extract_info_via_info_json(
+            info_json_directory, ytdl_options, uploader_cache_ttl_s=0
+        )
+        assert len(urls) == 4
+
+    def test_uploader_cache_expires(self, info_json_directory, ytdl_options):
+        self._extract_info_via_info_json(info_json_directory, ytdl_options)
+        with patch.object(time, "time", return_value=time.time() + 120):
+            urls = self._extract_info_via_info_json(info_json_directory, ytdl_options)
+        assert len(urls) == 4
+
+    @pytest.mark.parametrize("sleep_interval_requests", [None, 1])
+    def test_uploader_lookup_uses_one_downloader(
+        self, info_json_directory, ytdl_options, sleep_interval_requests
+    ):
+        ytdl_options["sleep_interval_requests"] = sleep_interval_requests
+        downloaders: List[yt_dlp.YoutubeDL] = []
+        init = yt_dlp.YoutubeDL.__init__
+
+        def _init(ytdlp, *args, **kwargs):
+            downloaders.append(ytdlp)
+            init(ytdlp, *args, **kwargs)
+
+        with patch.object(yt_dlp.YoutubeDL, "__init__", new=_init):
+            self._extract_info_via_info_json(info_json_directory, ytdl_options)
+
+        # One for the playlist and one per uploader, which loads, extracts and stores its cache
+        assert len(downloaders) == 4
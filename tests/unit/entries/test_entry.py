@@ -1,7 +1,13 @@
+import os
+from unittest.mock import patch
+
 import pytest
 
+from ytdl_sub.config.overrides import Overrides
 from ytdl_sub.entries.entry import Entry
 from ytdl_sub.entries.script.variable_definitions import VARIABLES, VariableDefinitions
+from ytdl_sub.script.utils.exceptions import FunctionRuntimeException
+from ytdl_sub.utils.file_handler import FileHandler
 
 v: VariableDefinitions = VARIABLES
 
@@ -78,3 +84,112 @@ class TestEntry(object):
         entry.add({v.channel: "can add"})
 
         assert entry.get(v.channel, str) == "can add"
+
+    def test_entry_get_after_add(self, mock_entry_kwargs):
+        entry = Entry(entry_dict=mock_entry_kwargs, working_directory=".").initialize_script()
+        title_sanitized_plex = entry.get(v.title_sanitized_plex, str)
+
+        # Variables that were resolvable before the add keep their value,
+        # whether or not they have been resolved yet
+        entry.add({v.title: "new title 123", v.uid: "new_uid"})
+        assert entry.get(v.title, str) == "new title 123"
+        assert entry.get(v.title_sanitized_plex, str) == title_sanitized_plex
+        assert entry.get(v.uid_sanitized_plex, str) == (
+            Entry(entry_dict=mock_entry_kwargs, working_directory=".")
+            .initialize_script()
+            .get(v.uid_sanitized_plex, str)
+        )
+
+    def test_entry_invalid_override_fails_on_initialize(self, mock_entry_kwargs):
+        overrides = Overrides(
+            name="overrides",
+            value={"unused_override": "{%array_at([title], 5)}"},
+        ).initialize_script(unresolved_variables=set())
+
+        # Fails when the entry is created even though the override is never used
+        with pytest.raises(FunctionRuntimeException, match="%array_at: list index out of range"):
+            Entry(entry_dict=mock_entry_kwargs, working_directory=".").initialize_script(overrides)
+
+    def test_entry_metadata_pruning(self, mock_entry_kwargs):
+        entry_dict = dict(
+            mock_entry_kwargs,
+            formats=[{"format_id": "1"}],
+            heatmap=[{"value": 1.0}],
+            custom_key="keep me",
+        )
+        unpruned = Entry(entry_dict=dict(entry_dict), working_directory=".")
+
+        pruned = Entry(
+            entry_dict=dict(entry_dict),
+            working_directory=".",
+            metadata_keep_keys=Entry.metadata_keep_keys(additional_keys=["custom_key"]),
+        )
+
+        assert "formats" not in pruned._kwargs
+        assert "heatmap" not in pruned._kwargs
+        assert pruned._kwargs["custom_key"] == "keep me"
+
+        # Only entry_metadata itself differs
+        pruned_variables = pruned.initialize_script().to_dict()
+        unpruned_variables = unpruned.initialize_script().to_dict()
+        for variable_name in ["entry_metadata", "entry_metadata_sanitized"]:
+            del pruned_variables[variable_name]
+            del unpruned_variables[variable_name]
+        assert pruned_variables == unpruned_variables
+
+    def test_entry_working_file_snapshot(self, mock_entry_kwargs, tmp_path):
+        entry = Entry(
+            entry_dict=mock_entry_kwargs, working_directory=str(tmp_path)
+        ).initialize_script()
+        (tmp_path / "abc123.mkv").touch()
+        (tmp_path / "abc123.jpg").touch()
+        (tmp_path / "other.mp4").touch()
+
+        with patch.object(os, "scandir", wraps=os.scandir) as mock_scandir:
+            assert entry.ext == "mkv"
+            assert entry.is_downloaded()
+            assert entry.try_get_ytdlp_download_thumbnail_path() == str(tmp_path / "abc123.jpg")
+            assert not entry.working_file_exists(ext="mp4")
+            assert mock_scandir.call_count == 1
+
+            # Files changed by ytdl-sub invalidate the snapshot
+            FileHandler.move(tmp_path / "other.mp4", tmp_path / "abc123.mp4")
+            assert entry.working_file_exists(ext="mp4")
+            assert mock_scandir.call_count == 2
+
+            # Only files changed in the entry's working directory do
+            os.makedirs(tmp_path / "other_directory")
+            FileHandler.copy(tmp_path / "abc123.mp4", tmp_path / "other_directory" / "abc123.mp4")
+            assert entry.working_file_exists(ext="mp4")
+            assert mock_scandir.call_count == 2
+
+            # Files written by ffmpeg or yt-dlp are found once marked as changed
+            (tmp_path / "abc123.en.srt").touch()
+            assert not entry.working_file_exists(ext="en.srt")
+            FileHandler.mark_files_changed(tmp_path)
+            assert entry.working_file_exists(ext="en.srt")
+            assert mock_scandir.call_count == 3
+
+            FileHandler.delete(tmp_path / "abc123.mp4")
+            assert not entry.working_file_exists(ext="mp4")
+            assert entry.working_file_exists(ext="en.srt")
+            assert mock_scandir.call_count == 4
+
+    def test_entry_working_file_snapshot_misses_do_not_stat(self, mock_entry_kwargs, tmp_path):
+        entry = Entry(
+            entry_dict=mock_entry_kwargs, working_directory=str(tmp_path)
+        ).initialize_script()
+        (tmp_path / "abc123.jpg").touch()
+
+        # List the working directory once
+        assert entry.working_file_exists(ext="jpg")
+
+        # Every extension probed is a miss
+        with (
+            patch.object(os.path, "isfile", wraps=os.path.isfile) as mock_isfile,
+            patch.object(os, "stat", wraps=os.stat) as mock_stat,
+        ):
+            assert entry.ext == mock_entry_kwargs["ext"]
+            assert not entry.is_downloaded()
+            assert mock_isfile.call_count == 0
+            assert mock_stat.call_count == 0
@@ -0,0 +1,196 @@
+import copy
+import json
+from typing import Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from ytdl_sub.downloaders.url.downloader import MultiUrlDownloader
+from ytdl_sub.downloaders.ytdlp import YTDLP
+from ytdl_sub.entries.entry import Entry
+from ytdl_sub.entries.entry_parent import EntryParent
+from ytdl_sub.entries.script.variable_definitions import VARIABLES
+from ytdl_sub.script.parser import parse
+
+
+def _playlist_dict(uid: str) -> Dict:
+    return {
+        "_type": "playlist",
+        "id": uid,
+        "uploader_id": "channel",
+        "webpage_url": f"https://yourname.here/{uid}",
+    }
+
+
+def _entry_dict(uid: str, playlist_id: str | None = None, playlist_index: int = 1) -> Dict:
+    entry_dict = {"id": uid, "ext": "mp4", "title": f"title {uid}", "formats": [{"url": uid}]}
+    if playlist_id:
+        entry_dict["playlist_id"] = playlist_id
+        entry_dict["playlist_index"] = playlist_index
+    return entry_dict
+
+
+def _synthetic_entry_dicts(num_playlists: int, entries_per_playlist: int) -> List[Dict]:
+    # The channel is a disconnected root parent, i.e. no playlist references it by playlist_id
+    entry_dicts = [_playlist_dict("channel")]
+    for playlist_idx in range(num_playlists):
+        playlist_id = f"playlist_{playlist_idx}"
+        entry_dicts.append(_playlist_dict(playlist_id))
+        entry_dicts.extend(
+            _entry_dict(f"{playlist_id}_{entry_idx}", playlist_id, entry_idx + 1)
+            for entry_idx in range(entries_per_playlist)
+        )
+    entry_dicts.append(_entry_dict("orphan"))
+    entry_dicts.append(_entry_dict("unknown_playlist", "does_not_exist"))
+    return entry_dicts
+
+
+class TestEntryParent:
+    def test_from_entry_dicts(self):
+        entry_dicts = _synthetic_entry_dicts(num_playlists=2, entries_per_playlist=3)
+        parents = EntryParent.from_entry_dicts(
+            url="https://yourname.here/channel",
+            entry_dicts=entry_dicts,
+            working_directory=".",
+            include_sibling_metadata=True,
+        )
+
+        assert [parent.uid for parent in parents] == ["channel"]
+        playlists = parents[0].parent_children()
+        assert [playlist.uid for playlist in playlists] == ["playlist_0", "playlist_1"]
+        assert [entry.uid for entry in playlists[1].entry_children()] == [
+            "playlist_1_0",
+            "playlist_1_1",
+            "playlist_1_2",
+        ]
+
+        entry = playlists[1].entry_children()[0]
+        assert entry._kwargs["playlist_metadata"]["id"] == "playlist_1"
+        assert entry._kwargs["source_metadata"]["id"] == "channel"
+        assert len(entry._kwargs["sibling_metadata"]) == 3
+
+        orphans = EntryParent.from_entry_dicts_with_no_parents(
+            parents=parents, entry_dicts=entry_dicts, working_directory="."
+        )
+        assert [orphan.uid for orphan in orphans] == ["orphan", "unknown_playlist"]
+
+    @pytest.mark.parametrize("num_playlists, entries_per_playlist", [(1, 10_000), (200, 50)])
+    def test_from_entry_dicts_large(self, num_playlists: int, entries_per_playlist: int):
+        entry_dicts = _synthetic_entry_dicts(num_playlists, entries_per_playlist)
+        parents = EntryParent.from_entry_dicts(
+            url="https://yourname.here/channel",
+            entry_dicts=entry_dicts,
+            working_directory=".",
+            include_sibling_metadata=False,
+        )
+        orphans = EntryParent.from_entry_dicts_with_no_parents(
+            parents=parents, entry_dicts=entry_dicts, working_directory="."
+        )
+
+        assert sum(parent.num_children() for parent in parents) == (
+            num_playlists * entries_per_playlist
+        )
+        assert len(orphans) == 2
+
+    def test_from_info_json_index(self, tmp_path):
+        for entry_dict in _synthetic_entry_dicts(num_playlists=2, entries_per_playlist=3):
+            with open(tmp_path / f"{entry_dict['id']}.info.json", "w", encoding="utf-8") as file:
+                json.dump(entry_dict, file)
+
+        def _read_entries(index_keys):
+            entry_dicts = YTDLP._get_entry_dicts_from_info_json_files(
+                working_directory=str(tmp_path), index_keys=index_keys
+            )
+            parents = EntryParent.from_entry_dicts(
+                url="https://yourname.here/channel",
+                entry_dicts=entry_dicts,
+                working_directory=str(tmp_path),
+                include_sibling_metadata=True,
+            )
+            orphans = EntryParent.from_entry_dicts_with_no_parents(
+                parents=parents, entry_dicts=entry_dicts, working_directory=str(tmp_path)
+            )
+            playlists = parents[0].parent_children()
+            return [
+                entry
+                for entries in [
+                    playlists[0].entry_children(),
+                    playlists[1].entry_children(),
+                    orphans,
+                ]
+                for entry in entries
+            ]
+
+        entries = _read_entries(index_keys=None)
+        indexed_entries = _read_entries(
+            index_keys=MultiUrlDownloader._STREAMED_METADATA_KEYS
+            | EntryParent.sibling_metadata_keys()
+        )
+
+        assert [entry.uid for entry in indexed_entries] == [entry.uid for entry in entries]
+        assert "formats" not in indexed_entries[0]._kwargs
+        assert [entry.load_info_json()._kwargs for entry in indexed_entries] == [
+            entry._kwargs for entry in entries
+        ]
+        assert entries[0].load_info_json() is entries[0]
+
+    def test_sibling_metadata_is_shared(self, tmp_path):
+        parents = EntryParent.from_entry_dicts(
+            url="https://yourname.here/channel",
+            entry_dicts=_synthetic_entry_dicts(num_playlists=1, entries_per_playlist=3),
+            working_directory=str(tmp_path),
+            include_sibling_metadata=True,
+        )
+        entries = parents[0].parent_children()[0].entry_children()
+        sibling_metadata = entries[0]._kwargs["sibling_metadata"]
+
+        assert all(entry._kwargs["sibling_metadata"] is sibling_metadata for entry in entries)
+        assert [sibling["title"] for sibling in sibling_metadata] == [
+            "title playlist_0_0",
+            "title playlist_0_1",
+            "title playlist_0_2",
+        ]
+
+        # Resolves the same as if each entry held its own list of sibling dicts
+        entry = copy.deepcopy(entries[1])
+        unshared_entry = copy.deepcopy(entries[1])
+        unshared_entry._kwargs["sibling_metadata"] = sibling_metadata.to_list()
+
+        assert entry._kwargs["sibling_metadata"] is sibling_metadata
+        assert entry.initialize_script().get(VARIABLES.sibling_metadata, list) == (
+            unshared_entry.initialize_script().get(VARIABLES.sibling_metadata, list)
+        )
+        assert entries[2].initialize_script().get(VARIABLES.sibling_metadata, list) == (
+            entry.get(VARIABLES.sibling_metadata, list)
+        )
+
+        with patch.object(Entry, "to_dict", return_value={}):
+            entry.write_info_json()
+        with open(entry.get_download_info_json_path(), "r", encoding="utf-8") as file:
+            assert json.load(file)["sibling_metadata"] == sibling_metadata.to_list()
+
+    def test_sibling_metadata_resolved_only_when_needed(self, tmp_path):
+        parents = EntryParent.from_entry_dicts(
+            url="https://yourname.here/channel",
+            entry_dicts=_synthetic_entry_dicts(num_playlists=1, entries_per_playlist=3),
+            working_directory=str(tmp_path),
+            include_sibling_metadata=True,
+        )
+        entries = parents[0].parent_children()[0].entry_children()
+        sibling_metadata = entries[0]._kwargs["sibling_metadata"]
+
+        for entry in entries:
+            assert entry.initialize_script().get(VARIABLES.title, str)
+        assert "resolvable" not in sibling_metadata.__dict__
+
+        # Depends on sibling_metadata through a custom function
+        formatter = parse("{%extract_field_from_siblings('title')}")
+        assert entries[0].resolve_parsed(formatter).native == [
+            "title playlist_0_0",
+            "title playlist_0_1",
+            "title playlist_0_2",
+        ]
+        assert "resolvable" in sibling_metadata.__dict__
+        assert entries[1].get(VARIABLES.sibling_metadata, list) == (
+            entries[2].get(VARIABLES.sibling_metadata, list)
+        )
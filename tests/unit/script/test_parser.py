@@ -220,3 +220,20 @@ class TestParserBracketFailures:
     def test_extra_char_in_brackets(self, char: str):
         with pytest.raises(InvalidSyntaxException, match=re.escape(str(BRACKET_INVALID_CHAR))):
             parse(f"{{  %string('hi') {char} }}")
+
+
+class TestParserDependencies:
+    def test_dependencies_are_cached(self):
+        tree = parse(
+            "{%concat(%upper(a), %custom_func(b, [c, {'key': d}]), %array_apply(arr, %custom_func))}",
+            custom_function_names={"custom_func"},
+        )
+
+        assert tree.variables == {Variable(v) for v in ["a", "b", "c", "d", "arr"]}
+        assert [func.name for func in tree.built_in_functions] == ["concat", "upper", "array_apply"]
+        assert {func.name for func in tree.custom_functions} == {"custom_func"}
+        assert {lamb.value for lamb in tree.lambdas} == {"custom_func"}
+
+        # Computed once per node
+        assert tree.variables is tree.variables
+        assert tree.built_in_functions is tree.built_in_functions
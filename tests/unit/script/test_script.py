@@ -1,7 +1,16 @@
+import pytest
+
+from ytdl_sub.script.parser import parse
 from ytdl_sub.script.script import Script
 from ytdl_sub.script.script_output import ScriptOutput
 from ytdl_sub.script.types.map import Map
 from ytdl_sub.script.types.resolvable import String
+from ytdl_sub.script.utils.exceptions import (
+    FunctionDoesNotExist,
+    InvalidCustomFunctionArguments,
+    ScriptVariableNotResolved,
+    VariableDoesNotExist,
+)
 
 
 class TestScript:
@@ -86,3 +95,144 @@ class TestScript:
         assert (
             script.resolve_once({"url": "{ %bilateral_url_wrap('nope') }"})["url"].native == "nope"
         )
+
+    def test_fork_does_not_modify_parent(self):
+        parent = Script(
+            {
+                "%wrap": "{[$0]}",
+                "entry": "{%throw('entry has not been populated yet')}",
+                "title": "{%map_get(entry, 'title')}",
+                "override": "hi",
+            }
+        )
+        parent.resolve(unresolvable={"entry"}, update=True)
+
+        fork_a = parent.fork()
+        fork_b = parent.fork()
+
+        fork_a.add({"entry": "{ {'title': 'a'} }", "wrapped": "{%wrap(title)}"}).resolve(
+            update=True
+        )
+        fork_b.add({"entry": "{ {'title': 'b'} }"}).resolve(update=True)
+
+        assert fork_a.get("wrapped").native == ["a"]
+        assert fork_b.get("title") == String("b")
+        assert "wrapped" not in fork_b.variable_names
+        assert "wrapped" not in parent.variable_names
+
+        # Parent can still be modified after forking without affecting its forks
+        parent.add({"override": "bye"})
+        assert parent.resolve(unresolvable={"entry"}).get_native("override") == "bye"
+        assert fork_a.get("override") == String("hi")
+        assert fork_b.get("override") == String("hi")
+
+    def test_fork_many_times(self):
+        script = Script({"aa": "a"})
+        for idx in range(20):
+            script = script.fork().add({f"var_{idx}": f"{{aa}}{idx}"})
+            script.resolve(update=True)
+
+        assert script.get("var_0") == String("a0")
+        assert script.get("var_19") == String("a19")
+
+    def test_resolution_order_updated_on_add(self):
+        script = Script(
+            {
+                "%custom_func": "{%concat($0, late)}",
+                "early": "early",
+                "uses_late": "{%custom_func(early)}",
+                "late": "{%throw('late has not been populated yet')}",
+            }
+        )
+        assert script.resolve(unresolvable={"late"}) == ScriptOutput({"early": String("early")})
+
+        # Redefine an existing variable with a new dependency placed after it
+        script.add({"late": "{new_var}", "new_var": "new"}, unresolvable={"new_var"})
+        assert script.resolve().get_native("uses_late") == "earlynew"
+
+        # Propagates unresolvable through custom functions
+        assert script.resolve(unresolvable={"new_var"}) == ScriptOutput({"early": String("early")})
+
+        # Appended variables that depend on the rest
+        script.add({"appended": "{uses_late}!"})
+        assert script.resolve().get_native("appended") == "earlynew!"
+
+    def test_resolve_subset(self):
+        script = Script(
+            {
+                "%custom_func": "{%concat($0, dep_of_func)}",
+                "dep_of_func": "func",
+                "a": "a",
+                "b": "{%custom_func(a)}",
+                "c": "{b}c",
+                "unrelated": "{%throw('should not resolve')}",
+            }
+        )
+        assert script.resolve_subset({"b"}) == ScriptOutput(
+            {"a": String("a"), "dep_of_func": String("func"), "b": String("afunc")}
+        )
+
+        # Pre-resolved variables are used as-is
+        assert script.resolve_subset({"c"}, resolved={"b": String("pre")}) == ScriptOutput(
+            {"b": String("pre"), "c": String("prec")}
+        )
+
+    def test_dependents_of(self):
+        script = Script(
+            {
+                "%custom_func": "{%concat($0, dep_of_func)}",
+                "dep_of_func": "func",
+                "a": "a",
+                "b": "{%custom_func(a)}",
+                "c": "{b}c",
+                "unrelated": "unrelated",
+            }
+        )
+        assert script.dependents_of(["a"]) == {"b", "c"}
+        assert script.dependents_of(["dep_of_func"]) == {"b", "c"}
+        assert script.dependents_of(["c"]) == set()
+
+    def test_resolve_subset_unresolvable(self):
+        script = Script({"a": "{%throw('a is not populated yet')}", "b": "{a}"})
+        with pytest.raises(ScriptVariableNotResolved):
+            script.resolve_subset({"a"}, unresolvable={"a"})
+        with pytest.raises(ScriptVariableNotResolved):
+            script.resolve_subset({"b"}, unresolvable={"a"})
+
+    def test_side_effect_variables(self):
+        script = Script(
+            {
+                "%custom_func": "{%assert($0, 'must be true')}",
+                "a": "{%print('a', True)}",
+                "b": "{%custom_func(a)}",
+                "c": "{%array_apply(['msg'], %throw)}",
+                "pure": "{%concat(b, 'pure')}",
+            }
+        )
+        assert set(script.side_effect_variables) == {"a", "b", "c"}
+
+        script.add({"a": "not printed", "d": "{%throw('error')}"})
+        assert set(script.side_effect_variables) == {"b", "c", "d"}
+
+    def test_resolve_parsed(self):
+        script = Script({"%custom_func": "{%concat($0, b)}", "a": "a", "b": "b"})
+        definition = parse("{%custom_func(a)}")
+
+        script.validate_parsed(name="formatter", definition=definition)
+        assert script.variable_dependencies(definition) == {"a", "b"}
+        assert script.resolve_parsed(
+            definition=definition, resolved=script.resolve().output
+        ) == String("ab")
+
+        # Not added to the script
+        assert script.variable_names == {"a", "b"}
+
+    def test_validate_parsed_errors(self):
+        script = Script({"%custom_func": "{%concat($0, $1)}", "a": "a"})
+
+        with pytest.raises(VariableDoesNotExist):
+            script.validate_parsed(name="formatter", definition=parse("{dne}"))
+        with pytest.raises(FunctionDoesNotExist):
+            script.validate_parsed(name="formatter", definition=parse("{%dne(a)}"))
+        with pytest.raises(InvalidCustomFunctionArguments):
+            script.validate_parsed(name="formatter", definition=parse("{%custom_func(a)}"))
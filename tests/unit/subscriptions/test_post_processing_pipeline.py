@@ -0,0 +1,61 @@
+import threading
+import time
+from typing import List
+
+import pytest
+
+from ytdl_sub.subscriptions.subscription_download import _PostProcessingPipeline
+
+
+class TestPostProcessingPipeline:
+    def test_entries_post_processed_in_order(self):
+        post_processed: List[int] = []
+        threads: List[str] = []
+
+        def _post_process(entry: int) -> None:
+            time.sleep(0.001 * (entry % 3))
+            threads.append(threading.current_thread().name)
+            post_processed.append(entry)
+
+        with _PostProcessingPipeline(post_process=_post_process, max_queued_entries=1) as pipeline:
+            for entry in range(5):
+                pipeline.put(entry)
+            pipeline.drain()
+            assert post_processed == list(range(5))
+
+            for entry in range(5, 10):
+                pipeline.put(entry)
+
+        assert post_processed == list(range(10))
+        assert threading.current_thread().name not in threads
+
+    def test_post_process_error_raised_on_download_stage(self):
+        post_processed: List[int] = []
+
+        def _post_process(entry: int) -> None:
+            if entry == 1:
+                raise ValueError("post-process failed")
+            post_processed.append(entry)
+
+        with pytest.raises(ValueError, match="post-process failed"):
+            with _PostProcessingPipeline(
+                post_process=_post_process, max_queued_entries=1
+            ) as pipeline:
+                for entry in range(5):
+                    pipeline.put(entry)
+                pipeline.drain()
+
+        assert post_processed == [0]
+
+    def test_downloaded_entries_finish_when_download_stage_fails(self):
+        post_processed: List[int] = []
+
+        with pytest.raises(ValueError, match="download failed"):
+            with _PostProcessingPipeline(
+                post_process=post_processed.append, max_queued_entries=2
+            ) as pipeline:
+                pipeline.put(0)
+                pipeline.put(1)
+                raise ValueError("download failed")
+
+        assert post_processed == [0, 1]
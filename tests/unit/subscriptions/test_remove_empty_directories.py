@@ -0,0 +1,62 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from ytdl_sub.config.config_file import ConfigFile
+from ytdl_sub.subscriptions.subscription import Subscription
+
+
+class TestRemoveEmptyDirectories:
+    @pytest.mark.parametrize("enable_full_empty_directory_pruning", [True, False])
+    def test_remove_empty_directories(
+        self,
+        working_directory: str,
+        output_directory: str,
+        enable_full_empty_directory_pruning: bool,
+    ):
+        config = ConfigFile.from_dict(
+            {
+                "configuration": {
+                    "working_directory": working_directory,
+                    "experimental": {
+                        "enable_full_empty_directory_pruning": enable_full_empty_directory_pruning
+                    },
+                }
+            }
+        )
+        subscription = Subscription.from_dict(
+            config=config,
+            preset_name="test_remove_empty_directories",
+            preset_dict={
+                "download": "https://your.name.here",
+                "output_options": {
+                    "output_directory": output_directory,
+                    "file_name": "file.mp4",
+                },
+            },
+        )
+
+        for file_name in [
+            "Show/Season 1/Episode 1/ep.mp4",
+            "Show/Season 1/Episode 2/ep.mp4",
+            "Show/Season 2/ep.mp4",
+            "Other Show/Season 1/ep.mp4",
+        ]:
+            os.makedirs(Path(output_directory, file_name).parent)
+            Path(output_directory, file_name).touch()
+        os.makedirs(Path(output_directory, "Unrelated", "Empty"))
+
+        subscription.download_archive.reinitialize(dry_run=False)
+        with subscription._remove_empty_directories_in_output_directory():
+            for file_name in [
+                "Show/Season 1/Episode 1/ep.mp4",
+                "Show/Season 1/Episode 2/ep.mp4",
+                "Other Show/Season 1/ep.mp4",
+            ]:
+                subscription.download_archive.delete_file_from_output_directory(file_name)
+
+        assert sorted(os.listdir(output_directory)) == (
+            ["Show"] if enable_full_empty_directory_pruning else ["Show", "Unrelated"]
+        )
+        assert os.listdir(Path(output_directory, "Show")) == ["Season 2"]
@@ -1,4 +1,5 @@
 import pytest
+from yt_dlp import DateRange
 
 from ytdl_sub.validators.sort_by_validator import KeepMaxFilesSortByValidator
 from ytdl_sub.ytdl_additions.enhanced_download_archive import (
@@ -279,3 +280,57 @@ class TestRemoveStaleFilesUploadDate:
 
         remaining_ids = list(archive.mapping.entry_mappings.keys())
         assert sorted(remaining_ids) == ["id1", "id2", "id3"]
+
+    def test_same_upload_date_keeps_earliest_added(self, tmp_path):
+        mappings = {
+            "id1": DownloadMapping("2024-01-02", "yt", {"a.mp4"}),
+            "id2": DownloadMapping("2024-01-01", "yt", {"b.mp4"}),
+            "id3": DownloadMapping("2024-01-02", "yt", {"c.mp4"}),
+            "id4": DownloadMapping("2024-01-02", "yt", {"d.mp4"}),
+        }
+        archive = _make_archive(tmp_path, mappings)
+        archive.remove_stale_files(date_range=None, keep_max_files=2, sort_by="upload_date")
+
+        remaining_ids = list(archive.mapping.entry_mappings.keys())
+        assert sorted(remaining_ids) == ["id1", "id3"]
+
+
+class TestDownloadMappingsIndex:
+    @pytest.fixture
+    def download_mappings(self) -> DownloadMappings:
+        download_mappings = DownloadMappings()
+        for uid, upload_date in [
+            ("id1", "2024-01-01"),
+            ("id2", "2024-01-03"),
+            ("id3", "2024-01-03"),
+            ("id4", "2024-02-01"),
+            ("id5", "2023-12-31"),
+        ]:
+            download_mappings._entry_mappings[uid] = DownloadMapping(upload_date, "yt", set())
+        return download_mappings
+
+    def test_get_num_entries_with_date(self, download_mappings):
+        assert download_mappings.get_num_entries_with_date("2024-01-03") == 2
+        assert download_mappings.get_num_entries_with_date("2024-01-02") == 0
+
+        download_mappings.remove_entry("id2")
+        assert download_mappings.get_num_entries_with_date("2024-01-03") == 1
+
+        download_mappings._entry_mappings["id3"] = DownloadMapping("2024-01-02", "yt", set())
+        assert download_mappings.get_num_entries_with_date("2024-01-03") == 0
+        assert download_mappings.get_num_entries_with_date("2024-01-02") == 1
+
+    def test_get_entries_out_of_range(self, download_mappings):
+        out_of_range = download_mappings.get_entries_out_of_range(
+            date_range=DateRange(start="20240101", end="20240103")
+        )
+        assert sorted(out_of_range.keys()) == ["id4", "id5"]
+        assert out_of_range["id4"] is download_mappings.entry_mappings["id4"]
+
+    def test_get_entries_over_max(self, download_mappings):
+        assert list(download_mappings.get_entries_over_max(max_entries=2).keys()) == [
+            "id3",
+            "id1",
+            "id5",
+        ]
+        assert download_mappings.get_entries_over_max(max_entries=10) == {}
@@ -0,0 +1,135 @@
+import json
+import os
+import shutil
+import time
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ytdl_sub.thread import log_entries_downloaded_listener
+from ytdl_sub.thread.log_entries_downloaded_listener import LogEntriesDownloadedListener, _Inotify
+
+
+def _write_info_json(path: str, title: str) -> None:
+    # Write atomically like yt-dlp does
+    with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+        json.dump({"id": os.path.basename(path), "title": title, "formats": []}, file)
+    os.replace(f"{path}.tmp", path)
+
+
+class TestLogEntriesDownloadedListener:
+    @pytest.mark.parametrize(
+        "contents, expected_title",
+        [
+            ('{"id": "abc", "title": "A \\"quoted\\" title"}', 'A "quoted" title'),
+            ('{"id": "abc", "chapters": [{"title": "nested"}], "title": "top"}', "top"),
+            ('{"id": "abc", "formats": [1, 2, 3]}', None),
+            ('{"id": "abc", "title": 1}', None),
+            ('{"id": "abc", "title": "first", "formats": [' + "1, " * 100_000 + "1]}", "first"),
+            # Title is past the read prefix
+            ('{"id": "abc", "formats": [' + "1, " * 100_000 + '1], "title": "last"}', None),
+        ],
+    )
+    def test_get_title_from_info_json(self, tmp_path, contents, expected_title):
+        path = tmp_path / "entry.info.json"
+        path.write_text(contents, encoding="utf-8")
+
+        assert LogEntriesDownloadedListener._get_title_from_info_json(str(path)) == expected_title
+
+    @pytest.mark.parametrize("contents", ['{"id": "abc", "title": "partial', "not json", ""])
+    def test_get_title_from_info_json_not_decodable(self, tmp_path, contents):
+        path = tmp_path / "entry.info.json"
+        path.write_text(contents, encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            LogEntriesDownloadedListener._get_title_from_info_json(str(path))
+
+    def test_does_not_read_or_stat_other_files(self, tmp_path):
+        (tmp_path / "entry.mp4.part").write_text("")
+        (tmp_path / "entry.webp").write_text("")
+        listener = LogEntriesDownloadedListener(
+            working_directory=str(tmp_path), log_prefix="Downloading metadata for"
+        )
+
+        with (
+            patch.object(os.path, "isfile", wraps=os.path.isfile) as mock_isfile,
+            patch.object(
+                LogEntriesDownloadedListener,
+                "_get_title_from_info_json",
+                wraps=LogEntriesDownloadedListener._get_title_from_info_json,
+            ) as mock_get_title,
+        ):
+            listener.loop()
+            listener.loop()
+
+        assert mock_isfile.call_count == 0
+        assert mock_get_title.call_count == 0
+
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_logs_new_info_json_titles(self, tmp_path, use_inotify):
+        logged_titles: List[str] = []
+        _write_info_json(str(tmp_path / "existing.info.json"), "existing")
+
+        with (
+            patch.object(
+                log_entries_downloaded_listener.logger,
+                "info",
+                side_effect=lambda _msg, _prefix, title: logged_titles.append(title),
+            ),
+            patch.object(
+                log_entries_downloaded_listener,
+                "_Inotify",
+                new=_Inotify if use_inotify else MagicMock(side_effect=OSError),
+            ),
+        ):
+            listener = LogEntriesDownloadedListener(
+                working_directory=str(tmp_path), log_prefix="Downloading metadata for"
+            )
+            listener.start()
+
+            _write_info_json(str(tmp_path / "first.info.json"), "first")
+            os.makedirs(tmp_path / "subdirectory")
+            _write_info_json(str(tmp_path / "subdirectory" / "second.info.json"), "second")
+            (tmp_path / "not_info_json.mp4").write_text("")
+
+            for _ in range(50):
+                if len(logged_titles) == 3:
+                    break
+                time.sleep(0.1)
+
+            # Files no longer in the working directory are forgotten
+            os.remove(tmp_path / "first.info.json")
+            shutil.rmtree(tmp_path / "subdirectory")
+            expected_files_read = {str(tmp_path): {"existing.info.json"}}
+            for _ in range(50):
+                if listener._files_read == expected_files_read:
+                    break
+                time.sleep(0.1)
+
+            listener.complete = True
+            listener.join()
+
+        assert sorted(logged_titles) == ["existing", "first", "second"]
+        assert listener._files_read == expected_files_read
+
+    def test_retries_incomplete_info_json(self, tmp_path):
+        logged_titles: List[str] = []
+        path = tmp_path / "entry.info.json"
+        listener = LogEntriesDownloadedListener(
+            working_directory=str(tmp_path), log_prefix="Downloading metadata for"
+        )
+
+        with patch.object(
+            log_entries_downloaded_listener.logger,
+            "info",
+            side_effect=lambda _msg, _prefix, title: logged_titles.append(title),
+        ):
+            path.write_text('{"id": "abc", "title": "ti', encoding="utf-8")
+            listener.loop()
+            assert logged_titles == []
+
+            path.write_text('{"id": "abc", "title": "title"}', encoding="utf-8")
+            listener.loop()
+            listener.loop()
+            assert logged_titles == ["title"]
@@ -0,0 +1,108 @@
+from ytdl_sub.utils.ffmpeg_remux_plan import FFmpegRemuxPlan
+
+
+class TestFFmpegRemuxPlan:
+    def test_empty(self):
+        assert FFmpegRemuxPlan().is_empty()
+
+    def test_metadata(self):
+        plan = FFmpegRemuxPlan().add_metadata({"title": "the\0 title", "year": "2020"})
+
+        assert not plan.is_empty()
+        assert plan.ffmpeg_args(input_file_path="in.mp4", output_file_path="out.mp4") == [
+            "-i",
+            "in.mp4",
+            "-map",
+            "0",
+            "-dn",
+            "-metadata",
+            "title=the title",
+            "-metadata",
+            "year=2020",
+            "-codec",
+            "copy",
+            "-bitexact",
+            "out.mp4",
+        ]
+
+    def test_metadata_and_attached_pic(self):
+        plan = (
+            FFmpegRemuxPlan()
+            .set_attached_pic("thumb.jpg", is_temporary=True)
+            .add_metadata({"title": "title"})
+        )
+
+        assert plan.temporary_file_paths == ["thumb.jpg"]
+        assert plan.ffmpeg_args(input_file_path="in.mp4", output_file_path="out.mp4") == [
+            "-i",
+            "in.mp4",
+            "-i",
+            "thumb.jpg",
+            "-map",
+            "1",
+            "-map",
+            "0",
+            "-dn",
+            "-metadata",
+            "title=title",
+            "-codec",
+            "copy",
+            "-bitexact",
+            "-disposition:0",
+            "attached_pic",
+            "out.mp4",
+        ]
+
+    def test_chapters(self):
+        plan = FFmpegRemuxPlan().set_chapters("chapters.txt", is_temporary=True)
+
+        assert not plan.is_empty()
+        assert plan.temporary_file_paths == ["chapters.txt"]
+        assert plan.ffmpeg_args(input_file_path="in.mp4", output_file_path="out.mp4") == [
+            "-i",
+            "in.mp4",
+            "-i",
+            "chapters.txt",
+            "-map",
+            "0",
+            "-map_chapters",
+            "1",
+            "-dn",
+            "-codec",
+            "copy",
+            "-bitexact",
+            "out.mp4",
+        ]
+
+    def test_metadata_attached_pic_and_chapters(self):
+        plan = (
+            FFmpegRemuxPlan()
+            .set_chapters("chapters.txt", is_temporary=True)
+            .set_attached_pic("thumb.jpg", is_temporary=True)
+            .add_metadata({"title": "title"})
+        )
+
+        assert plan.temporary_file_paths == ["chapters.txt", "thumb.jpg"]
+        assert plan.ffmpeg_args(input_file_path="in.mp4", output_file_path="out.mp4") == [
+            "-i",
+            "in.mp4",
+            "-i",
+            "thumb.jpg",
+            "-i",
+            "chapters.txt",
+            "-map",
+            "1",
+            "-map",
+            "0",
+            "-map_chapters",
+            "2",
+            "-dn",
+            "-metadata",
+            "title=title",
+            "-codec",
+            "copy",
+            "-bitexact",
+            "-disposition:0",
+            "attached_pic",
+            "out.mp4",
+        ]
@@ -1,4 +1,10 @@
-from ytdl_sub.utils.file_handler import FileHandler
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ytdl_sub.utils import file_handler
+from ytdl_sub.utils.file_handler import FileContentHashes, FileHandler, files_equal
 from ytdl_sub.utils.system import IS_WINDOWS
 
 
@@ -15,3 +21,126 @@ class TestFileHandler:
 
         assert not FileHandler.is_path_writable("/lol-in-root")
         assert not FileHandler.is_path_writable("/")
+
+    @pytest.mark.parametrize("copy_strategy", ["copy", "reflink", "hardlink"])
+    @pytest.mark.parametrize("allow_hardlink", [True, False])
+    def test_copy(self, tmp_path, copy_strategy: str, allow_hardlink: bool):
+        src_file_path = tmp_path / "src.txt"
+        dst_file_path = tmp_path / "nested" / "dst.txt"
+        src_file_path.write_text("file contents" * 1000, encoding="utf-8")
+        os.makedirs(dst_file_path.parent)
+
+        FileHandler.copy(
+            src_file_path,
+            dst_file_path,
+            copy_strategy=copy_strategy,
+            allow_hardlink=allow_hardlink,
+        )
+
+        assert dst_file_path.read_text(encoding="utf-8") == "file contents" * 1000
+        assert os.listdir(dst_file_path.parent) == ["dst.txt"]
+        assert os.path.samefile(src_file_path, dst_file_path) == (
+            copy_strategy == "hardlink" and allow_hardlink
+        )
+
+    @pytest.mark.parametrize("copy_strategy", ["reflink", "hardlink"])
+    def test_copy_falls_back(self, tmp_path, copy_strategy: str):
+        src_file_path = tmp_path / "src.txt"
+        dst_file_path = tmp_path / "dst.txt"
+        src_file_path.write_text("file contents", encoding="utf-8")
+
+        with (
+            patch.object(os, "link", side_effect=OSError) as mock_link,
+            patch.object(FileHandler, "_reflink_file", return_value=False) as mock_reflink,
+            patch.object(FileHandler, "_copy_file_range", return_value=False),
+        ):
+            FileHandler.copy(
+                src_file_path, dst_file_path, copy_strategy=copy_strategy, allow_hardlink=True
+            )
+
+        assert dst_file_path.read_text(encoding="utf-8") == "file contents"
+        assert not os.path.samefile(src_file_path, dst_file_path)
+
+        # Each strategy only falls back to a regular copy, never to the other strategy
+        assert mock_link.called == (copy_strategy == "hardlink")
+        assert mock_reflink.called == (copy_strategy == "reflink")
+
+    @pytest.mark.parametrize("copy_strategy", ["copy", "reflink", "hardlink"])
+    def test_move_file_to_output_directory_copy_strategy(self, tmp_path, copy_strategy: str):
+        working_directory = tmp_path / "working"
+        output_directory = tmp_path / "output"
+        os.makedirs(working_directory)
+        (working_directory / "file.txt").write_text("file contents", encoding="utf-8")
+
+        file_handler_a = FileHandler(
+            working_directory=str(working_directory),
+            output_directory=str(output_directory),
+            dry_run=False,
+            copy_strategy=copy_strategy,
+        )
+        # Handlers of other subscriptions keep their own strategy
+        file_handler_b = FileHandler(
+            working_directory=str(working_directory),
+            output_directory=str(output_directory),
+            dry_run=False,
+        )
+
+        file_handler_a.move_file_to_output_directory(
+            file_name="file.txt", output_file_name="a.txt", copy_file=True
+        )
+        file_handler_b.move_file_to_output_directory(
+            file_name="file.txt", output_file_name="b.txt", copy_file=True
+        )
+
+        assert os.path.samefile(working_directory / "file.txt", output_directory / "a.txt") == (
+            copy_strategy == "hardlink"
+        )
+        assert not os.path.samefile(working_directory / "file.txt", output_directory / "b.txt")
+
+    @pytest.mark.parametrize("num_blocks", [0.5, 2, 10])
+    @pytest.mark.parametrize("differ_at", [None, "head", "middle", "tail", "unsampled"])
+    def test_files_equal(self, tmp_path, num_blocks: float, differ_at: str):
+        file_size = int(num_blocks * file_handler._SAMPLE_BLOCK_BYTES)
+        contents_a = bytes(idx % 251 for idx in range(file_size))
+        contents_b = bytearray(contents_a)
+        differ_offset = {
+            "head": 0,
+            "middle": file_size // 2,
+            "tail": file_size - 1,
+            "unsampled": file_size // 4,
+        }.get(differ_at)
+        if differ_offset is not None:
+            contents_b[differ_offset] ^= 0xFF
+
+        file_path_a = tmp_path / "a.bin"
+        file_path_b = tmp_path / "b.bin"
+        file_path_a.write_bytes(contents_a)
+        file_path_b.write_bytes(contents_b)
+
+        assert files_equal(file_path_a, file_path_b) == (differ_offset is None)
+        assert files_equal(file_path_a, file_path_a)
+        assert not files_equal(file_path_a, tmp_path / "missing.bin")
+
+    def test_content_hashes_cached_by_size_and_mtime(self, tmp_path):
+        file_path = tmp_path / "file.bin"
+        file_path.write_bytes(b"contents")
+        content_hashes = FileContentHashes()
+
+        with patch.object(
+            file_handler, "get_file_content_hash", wraps=file_handler.get_file_content_hash
+        ) as mock_hash:
+            content_hash = content_hashes.get(file_path)
+            assert content_hashes.get(file_path) == content_hash
+            assert mock_hash.call_count == 1
+
+            file_path.write_bytes(b"new contents")
+            assert content_hashes.get(file_path) != content_hash
+            assert mock_hash.call_count == 2
+
+            moved_file_path = tmp_path / "moved.bin"
+            os.rename(file_path, moved_file_path)
+            content_hashes.rekey(file_path, moved_file_path)
+            assert content_hashes.get(moved_file_path) == file_handler.get_file_content_hash(
+                moved_file_path
+            )
+            assert mock_hash.call_count == 3
@@ -1,5 +1,8 @@
+import logging
 import os.path
+import threading
 import time
+from typing import Dict, List
 
 import pytest
 
@@ -195,3 +198,59 @@ class TestLogger:
         with open(Logger._DEBUG_LOGGER_FILE.name, "r", encoding="utf-8") as log_file:
             lines = log_file.readlines()
         assert lines == expected_lines
+
+    def test_separate_debug_log_per_thread(self):
+        Logger._LOGGER_LEVEL = LoggerLevels.INFO
+        logger = Logger.get(name="name_test")
+        lines_by_thread: Dict[str, List[str]] = {}
+
+        def _log_in_thread(thread_name: str) -> None:
+            with Logger.separate_debug_log() as debug_log_filename:
+                assert Logger.debug_log_filename() == debug_log_filename
+                logger.debug("debug %s", thread_name)
+                with Logger.handle_external_logs(name="name_test"):
+                    print(f"external {thread_name}")
+
+                time.sleep(0.1)  # flush time
+                with open(debug_log_filename, "r", encoding="utf-8") as log_file:
+                    lines_by_thread[thread_name] = log_file.readlines()
+            assert not os.path.isfile(debug_log_filename)
+
+        threads = [
+            threading.Thread(target=_log_in_thread, args=(name,)) for name in ("first", "second")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for thread_name in ("first", "second"):
+            assert lines_by_thread[thread_name] == [
+                f"[ytdl-sub:name_test] debug {thread_name}\n",
+                f"[ytdl-sub:name_test] external {thread_name}\n",
+            ]
+
+        # Nothing leaks into the shared debug file
+        with open(Logger._DEBUG_LOGGER_FILE.name, "r", encoding="utf-8") as log_file:
+            assert log_file.readlines() == []
+
+    @pytest.mark.parametrize("has_error", [True, False])
+    def test_cleanup_within_separate_debug_log(self, has_error: bool):
+        logger = Logger.get(name="name_test")
+        debug_file_handler = next(
+            handler for handler in logger.handlers if isinstance(handler, logging.FileHandler)
+        )
+
+        with Logger.separate_debug_log() as debug_log_filename:
+            logger.debug("thread debug %s", has_error)
+            Logger.cleanup(has_error=has_error)
+
+            # Handlers shared with other threads stay open
+            assert debug_file_handler.stream is not None
+        assert not os.path.isfile(debug_log_filename)
+
+        error_lines: List[str] = []
+        if os.path.isfile(Logger.error_log_filename()):
+            with open(Logger.error_log_filename(), "r", encoding="utf-8") as error_log_file:
+                error_lines = error_log_file.readlines()
+        assert (f"[ytdl-sub:name_test] thread debug {has_error}\n" in error_lines) == has_error
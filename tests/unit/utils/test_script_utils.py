@@ -4,10 +4,11 @@ import pytest
 from unit.script.conftest import single_variable_output
 
 from ytdl_sub.script.parser import parse
+from ytdl_sub.script.script import Script
 from ytdl_sub.script.types.function import BuiltInFunction
 from ytdl_sub.script.types.map import UnresolvedMap
 from ytdl_sub.script.types.resolvable import String
-from ytdl_sub.script.types.syntax_tree import SyntaxTree
+from ytdl_sub.script.types.syntax_tree import ResolvedSyntaxTree, SyntaxTree
 from ytdl_sub.script.types.variable import Variable
 from ytdl_sub.utils.script import ScriptUtils
 
@@ -42,6 +43,40 @@ class TestScriptUtils:
         output = single_variable_output(ScriptUtils.to_script(json_dict))
         assert output == expected_output
 
+    def test_dict_to_resolvable_matches_to_script(self):
+        json_dict = {
+            "string": "value with {braces} and %functions()",
+            "quotes": "has '' and \"\"",
+            "none": None,
+            "int": 1,
+            "bool": True,
+            "list": [1, "two", 3.0, None],
+            "float": 3.14,
+            "nested_dict": {"b": [{"c": False}], "a": {}},
+        }
+
+        expected = Script({"output": ScriptUtils.to_script(json_dict)}).resolve().get("output")
+        resolvable = ScriptUtils.to_resolvable(json_dict)
+
+        assert resolvable == expected
+        assert list(resolvable.native.keys()) == list(expected.native.keys())
+
+    @pytest.mark.parametrize(
+        "value, expected_output",
+        [
+            (None, ""),
+            (True, True),
+            (42, 42),
+            (3.14, 3.14),
+            ([1, {"a": 2}], [1, {"a": 2}]),
+        ],
+    )
+    def test_to_syntax_tree_native(self, value, expected_output):
+        tree = ScriptUtils.to_syntax_tree(value)
+        assert isinstance(tree, ResolvedSyntaxTree)
+        assert tree.maybe_resolvable.native == expected_output
+        assert single_variable_output(ScriptUtils.to_script(value)) == expected_output
+
     @pytest.mark.parametrize(
         "input_str, expected_output",
         [
@@ -0,0 +1,112 @@
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from ytdl_sub.ytdl_additions.enhanced_download_archive import (
+    DownloadMappings,
+    EnhancedDownloadArchive,
+)
+
+
+def _mock_entry(uid: str, upload_date: str) -> MagicMock:
+    entry = MagicMock()
+    entry.uid = uid
+    entry.try_get.return_value = None
+    entry._kwargs_get.return_value = None
+    entry.get.return_value = upload_date
+    entry.download_archive_extractor = "yt"
+    return entry
+
+
+@pytest.fixture
+def archive(tmp_path) -> EnhancedDownloadArchive:
+    (tmp_path / "working").mkdir()
+    (tmp_path / "output").mkdir()
+    return EnhancedDownloadArchive(
+        file_name="archive.json",
+        working_directory=str(tmp_path / "working"),
+        output_directory=str(tmp_path / "output"),
+    ).reinitialize(dry_run=False)
+
+
+class TestDownloadMappingsJournal:
+    def test_replay_journal(self, tmp_path):
+        journal_path = str(tmp_path / "archive.json.journal")
+
+        mappings = DownloadMappings()
+        mappings.add_entry(_mock_entry("id1", "2024-01-01"), "a.mp4")
+        mappings.add_entry(_mock_entry("id2", "2024-01-02"), "b.mp4")
+        mappings.to_journal(journal_path)
+
+        mappings.add_entry(_mock_entry("id1", "2024-01-01"), "a.jpg")
+        mappings.remove_entry("id2")
+        mappings.to_journal(journal_path)
+
+        with open(journal_path, "r", encoding="utf8") as file:
+            assert [json.loads(line)["op"] for line in file] == ["set", "set", "set", "remove"]
+
+        replayed = DownloadMappings().replay_journal(journal_path)
+        assert list(replayed.entry_mappings.keys()) == ["id1"]
+        assert replayed.entry_mappings["id1"].file_names == {"a.mp4", "a.jpg"}
+
+    def test_replay_journal_skips_partially_written_line(self, tmp_path):
+        journal_path = str(tmp_path / "archive.json.journal")
+
+        mappings = DownloadMappings()
+        mappings.add_entry(_mock_entry("id1", "2024-01-01"), "a.mp4")
+        mappings.to_journal(journal_path)
+        with open(journal_path, "a", encoding="utf8") as file:
+            file.write('{"op": "set", "uid": "id2", "mapp')
+
+        mappings.add_entry(_mock_entry("id3", "2024-01-03"), "c.mp4")
+        mappings.to_journal(journal_path)
+
+        replayed = DownloadMappings().replay_journal(journal_path)
+        assert list(replayed.entry_mappings.keys()) == ["id1", "id3"]
+
+
+class TestEnhancedDownloadArchiveJournal:
+    def test_journal_replayed_on_load(self, archive):
+        archive.mapping.add_entry(_mock_entry("id1", "2024-01-01"), "a.mp4")
+        archive.journal_download_mappings()
+
+        assert os.path.isfile(archive._journal_file_path)
+        assert not os.path.isfile(archive._output_file_path)
+
+        archive.reinitialize(dry_run=False)
+        assert list(archive.mapping.entry_mappings.keys()) == ["id1"]
+
+    def test_save_compacts_journal(self, archive):
+        archive.mapping.add_entry(_mock_entry("id1", "2024-01-01"), "a.mp4")
+        archive.journal_download_mappings()
+        archive.save_download_mappings()
+
+        assert not os.path.isfile(archive._journal_file_path)
+        assert list(DownloadMappings.from_file(archive._output_file_path).entry_ids) == ["id1"]
+
+    def test_save_compacts_journal_from_previous_run(self, archive):
+        archive.mapping.add_entry(_mock_entry("id1", "2024-01-01"), "a.mp4")
+        archive.journal_download_mappings()
+
+        # Transaction log of the new session is empty, but the journal still needs compacting
+        archive.reinitialize(dry_run=False).save_download_mappings()
+
+        assert not os.path.isfile(archive._journal_file_path)
+        assert list(DownloadMappings.from_file(archive._output_file_path).entry_ids) == ["id1"]
+
+    def test_journal_compacts_past_threshold(self, archive):
+        archive._journal_compaction_size_bytes = 0
+        archive.mapping.add_entry(_mock_entry("id1", "2024-01-01"), "a.mp4")
+        archive.journal_download_mappings()
+
+        assert not os.path.isfile(archive._journal_file_path)
+        assert list(DownloadMappings.from_file(archive._output_file_path).entry_ids) == ["id1"]
+
+    def test_dry_run_does_not_journal(self, archive):
+        archive.reinitialize(dry_run=True)
+        archive.mapping.add_entry(_mock_entry("id1", "2024-01-01"), "a.mp4")
+        archive.journal_download_mappings()
+
+        assert not os.path.isfile(archive._journal_file_path)
@@ -0,0 +1,167 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from yt_dlp import DateRange
+
+from ytdl_sub.ytdl_additions.enhanced_download_archive import (
+    DownloadMapping,
+    DownloadMappings,
+    EnhancedDownloadArchive,
+    SqliteDownloadMappings,
+)
+
+
+def _mock_entry(uid: str, upload_date: str) -> MagicMock:
+    entry = MagicMock()
+    entry.uid = uid
+    entry.try_get.return_value = None
+    entry._kwargs_get.return_value = None
+    entry.get.return_value = upload_date
+    entry.download_archive_extractor = "yt"
+    return entry
+
+
+@pytest.fixture
+def database_path(tmp_path) -> str:
+    return str(tmp_path / "archive.db")
+
+
+@pytest.fixture
+def mappings_dict():
+    return {
+        "id1": DownloadMapping("2024-01-01", "yt", {"a.mp4"}, playlist_index=2),
+        "id2": DownloadMapping("2024-01-03", "yt", {"b.mp4"}, playlist_index=None),
+        "id3": DownloadMapping("2024-01-03", "yt", {"c.mp4"}, playlist_index=1),
+        "id4": DownloadMapping("2024-02-01", "yt", {"d.mp4"}, playlist_index=4),
+        "id5": DownloadMapping("2023-12-31", "yt", {"e.mp4"}, playlist_index=None),
+    }
+
+
+class TestSqliteDownloadMappings:
+    def test_changes_persist_on_commit(self, database_path):
+        mappings = SqliteDownloadMappings(database_path, subscription_name="sub")
+        mappings.add_entry(_mock_entry("id1", "2024-01-01"), "a.mp4")
+        mappings.add_entry(_mock_entry("id1", "2024-01-01"), "a.jpg")
+        mappings.add_entry(_mock_entry("id2", "2024-01-02"), "b.mp4")
+        mappings.commit()
+
+        mappings.remove_entry("id2")
+        mappings.close()
+
+        reloaded = SqliteDownloadMappings(database_path, subscription_name="sub")
+        assert reloaded.entry_ids == ["id1", "id2"]
+        assert reloaded.entry_mappings["id1"].file_names == {"a.mp4", "a.jpg"}
+
+    def test_subscriptions_are_isolated(self, database_path):
+        first = SqliteDownloadMappings(database_path, subscription_name="first")
+        first.add_entry(_mock_entry("id1", "2024-01-01"), "a.mp4").commit()
+
+        second = SqliteDownloadMappings(database_path, subscription_name="second")
+        assert second.is_empty
+        assert "id1" not in second.entry_mappings
+        assert first.get_num_entries() == 1
+
+    def test_content_hashes_persist_on_commit(self, database_path, tmp_path):
+        file_path = tmp_path / "file.bin"
+        file_path.write_bytes(b"contents")
+
+        mappings = SqliteDownloadMappings(database_path, subscription_name="sub")
+        content_hash = mappings.content_hashes.get(file_path)
+        mappings.commit()
+        mappings.close()
+
+        reloaded = SqliteDownloadMappings(database_path, subscription_name="other_sub")
+        with patch("ytdl_sub.utils.file_handler.get_file_content_hash", side_effect=AssertionError):
+            assert reloaded.content_hashes.get(file_path) == content_hash
+
+    @pytest.mark.parametrize(
+        "sort_by", ["upload_date", "playlist_index_asc", "playlist_index_desc"]
+    )
+    def test_queries_match_json_mappings(self, database_path, mappings_dict, sort_by):
+        json_mappings = DownloadMappings()
+        sqlite_mappings = SqliteDownloadMappings(database_path, subscription_name="sub")
+        for uid, mapping in mappings_dict.items():
+            json_mappings.entry_mappings[uid] = mapping
+            sqlite_mappings.entry_mappings[uid] = mapping
+
+        date_range = DateRange(start="20240101", end="20240103")
+        assert sqlite_mappings.get_entries_out_of_range(date_range) == (
+            json_mappings.get_entries_out_of_range(date_range)
+        )
+        assert sqlite_mappings.get_num_entries_with_date("2024-01-03") == 2
+        assert sqlite_mappings.has_playlist_indices()
+        assert list(sqlite_mappings.get_entries_over_max(2, sort_by=sort_by).items()) == list(
+            json_mappings.get_entries_over_max(2, sort_by=sort_by).items()
+        )
+
+
+class TestEnhancedDownloadArchiveSqlite:
+    @pytest.fixture
+    def output_directory(self, tmp_path) -> str:
+        (tmp_path / "working").mkdir()
+        (tmp_path / "output").mkdir()
+        return str(tmp_path / "output")
+
+    def _archive(self, output_directory: str, **kwargs) -> EnhancedDownloadArchive:
+        return EnhancedDownloadArchive(
+            working_directory=str(os.path.join(os.path.dirname(output_directory), "working")),
+            output_directory=output_directory,
+            subscription_name="sub",
+            **kwargs,
+        )
+
+    def test_migrate_from_json(self, output_directory, database_path, mappings_dict):
+        json_mappings = DownloadMappings()
+        for uid, mapping in mappings_dict.items():
+            json_mappings.entry_mappings[uid] = mapping
+        json_mappings.to_file(os.path.join(output_directory, "archive.json"))
+
+        archive = self._archive(
+            output_directory, file_name="archive.json", migrated_file_name=database_path
+        )
+        archive.reinitialize(dry_run=True).save_download_mappings()
+        assert os.path.isfile(os.path.join(output_directory, "archive.json"))
+        assert SqliteDownloadMappings(database_path, subscription_name="sub").is_empty
+
+        archive.reinitialize(dry_run=False).save_download_mappings()
+        assert not os.path.isfile(os.path.join(output_directory, "archive.json"))
+        assert dict(
+            SqliteDownloadMappings(database_path, subscription_name="sub").entry_mappings
+        ) == dict(json_mappings.entry_mappings)
+
+    def test_entries_committed_per_entry(self, output_directory, database_path):
+        archive = self._archive(output_directory, file_name=database_path)
+        archive.reinitialize(dry_run=False)
+        archive.mapping.add_entry(_mock_entry("id1", "2024-01-01"), "a.mp4")
+        archive.journal_download_mappings()
+
+        assert SqliteDownloadMappings(database_path, subscription_name="sub").entry_ids == ["id1"]
+        assert not os.path.isfile(f"{database_path}.journal")
+
+    def test_dry_run_is_not_committed(self, output_directory, database_path):
+        archive = self._archive(output_directory, file_name=database_path)
+        archive.reinitialize(dry_run=True)
+        archive.mapping.add_entry(_mock_entry("id1", "2024-01-01"), "a.mp4")
+        archive.journal_download_mappings()
+        archive.save_download_mappings()
+
+        assert archive.num_entries == 1
+        archive.reinitialize(dry_run=True)
+        assert archive.num_entries == 0
+
+    def test_dry_run_reads_existing_entries(self, output_directory, database_path):
+        SqliteDownloadMappings(database_path, subscription_name="sub").add_entry(
+            _mock_entry("id1", "2024-01-01"), "a.mp4"
+        ).commit()
+
+        archive = self._archive(output_directory, file_name=database_path)
+        archive.reinitialize(dry_run=True)
+        assert archive.mapping.entry_ids == ["id1"]
+
+        # The database is not locked by the dry run's uncommitted changes
+        archive.mapping.remove_entry("id1")
+        writer = SqliteDownloadMappings(database_path, subscription_name="sub")
+        writer._connection.execute("PRAGMA busy_timeout = 0")
+        writer.add_entry(_mock_entry("id2", "2024-01-02"), "b.mp4").commit()
+        assert writer.entry_ids == ["id1", "id2"]
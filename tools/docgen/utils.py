@@ -19,6 +19,7 @@ def _should_filter_property(property_name: str) -> bool:
         "list",
         "script",
         "unresolvable",
+        "user_variable_names",
         "dict_with_parsed_format_strings",
         "leaf_name",
     )